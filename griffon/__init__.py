@@ -4,21 +4,32 @@
 """
 
 import configparser
+import importlib
 import logging
 import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from configparser import ConfigParser
 from contextlib import contextmanager
-from functools import partial, wraps
-
-import component_registry_bindings
-import osidb_bindings
-from osidb_bindings.bindings.python_client.models import Affect, Flaw, Tracker
-from pkg_resources import resource_filename
-from rich.logging import RichHandler
-
-from griffon.output import console
+from functools import lru_cache, partial, wraps
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from griffon.cache import (
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_CACHE_TTL,
+    cached_session,
+    configure_cache,
+)
 
 from .exceptions import GriffonException
+from .timings import timings
+
+# service bindings, requests and rich are slow to import so they are imported
+# only once used, keeping the cli startup fast
+if TYPE_CHECKING:
+    import requests
 
 __version__ = "0.6.0"
 
@@ -45,7 +56,12 @@ GRIFFON_VERIFY_SSL = os.getenv("GRIFFON_VERIFY_SSL", "True").lower() in ("true",
 
 logger = logging.getLogger("griffon")
 
-RELATED_MODELS_MAPPING = {Flaw: {"affects": Affect}, Affect: {"trackers": Tracker}}
+
+@lru_cache
+def get_related_models_mapping() -> dict:
+    from osidb_bindings.bindings.python_client.models import Affect, Flaw, Tracker
+
+    return {Flaw: {"affects": Affect}, Affect: {"trackers": Tracker}}
 
 
 def check_envvars():
@@ -65,6 +81,8 @@ def config_logging(level="INFO"):
 
         http_client.HTTPConnection.debuglevel = 1
 
+    from rich.logging import RichHandler
+
     message_format = "%(asctime)s %(name)s %(levelname)s %(message)s"
     logging.basicConfig(
         level=level, format=message_format, datefmt="[%X]", handlers=[RichHandler()]
@@ -74,7 +92,8 @@ def config_logging(level="INFO"):
 def get_config():
     """read ~/.griffonrc ini file, if it does not exist then return some default config"""
     if not os.path.exists(os.path.expanduser(GRIFFON_RC_FILE)):
-        default_griffonrc = resource_filename(__name__, "static/default_griffonrc")
+        # avoid pkg_resources as it is slow to import
+        default_griffonrc = os.path.join(os.path.dirname(__file__), "static/default_griffonrc")
         config = configparser.ConfigParser(allow_no_value=True)
         config.read(default_griffonrc)
         return config
@@ -96,26 +115,103 @@ def list_config_sections():
     return griffon_config.sections()
 
 
+# default number of workers performing concurrent retrievals
+# can be changed by setting max_workers in .griffonrc
+DEFAULT_MAX_WORKERS = 10
+
+
+def get_max_workers() -> int:
+    """get number of workers used for concurrent retrievals"""
+    return int(get_config_option("default", "max_workers", DEFAULT_MAX_WORKERS))
+
+
+# process wide sessions, shared by all queries, reports and commands
+shared_sessions: Dict[Tuple, Any] = {}
+shared_sessions_lock = threading.Lock()
+
+
+def shared_session(create_session: Callable) -> Callable:
+    """
+    session factory decorator which creates the session only once per process
+
+    avoids repeated authentication (eg. OSIDB kerberos token negotiation) and
+    allows reusing pooled connections of the session, sessions are keyed by the
+    factory (service) and arguments they were created with
+    """
+
+    @wraps(create_session)
+    def wrapper(*args, **kwargs):
+        key = (create_session, args, tuple(sorted(kwargs.items())))
+        with shared_sessions_lock:
+            if key not in shared_sessions:
+                shared_sessions[key] = create_session(*args, **kwargs)
+            return shared_sessions[key]
+
+    return wrapper
+
+
+@shared_session
+def http_session() -> "requests.Session":
+    """
+    pooled keep-alive http session for requests made outside of service bindings
+
+    requests are bounded by the process wide request slots, pool sizes can be set
+    by http_pool_connections and http_pool_maxsize in .griffonrc
+    """
+    import requests
+
+    from griffon.cache import response_cache
+    from griffon.recording import FixtureAdapter, FixtureStore
+    from griffon.throttling import BoundedAdapter
+
+    pool_connections = int(get_config_option("default", "http_pool_connections", 10))
+    pool_maxsize = int(get_config_option("default", "http_pool_maxsize", get_max_workers()))
+    session = requests.Session()
+    adapter: BoundedAdapter
+    if isinstance(response_cache, FixtureStore):
+        adapter = FixtureAdapter(
+            response_cache, pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+    else:
+        adapter = BoundedAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.verify = GRIFFON_VERIFY_SSL
+    session.headers["Accept-Encoding"] = "gzip;q=1.0, identity; q=0.5, *;q=0"
+    return session
+
+
 class CorgiService:
     name = "component-registry"
     description = "Red Hat component registry"
     has_binding = True
 
     @staticmethod
+    @shared_session
     def create_session():
         """init corgi session"""
+        import component_registry_bindings
+
         try:
-            return component_registry_bindings.new_session(
-                component_registry_server_uri=CORGI_SERVER_URL,
-                verify_ssl=GRIFFON_VERIFY_SSL,
+            return cached_session(
+                partial(
+                    component_registry_bindings.new_session,
+                    component_registry_server_uri=CORGI_SERVER_URL,
+                    verify_ssl=GRIFFON_VERIFY_SSL,
+                ),
+                CORGI_SERVER_URL,
             )
         except:  # noqa
+            from griffon.output import console
+
             console.log(f"{CORGI_SERVER_URL} is not accessible.")
             exit(1)
 
     @staticmethod
     def get_component_types():
         """get component type enum"""
+        import component_registry_bindings
+
         return (
             component_registry_bindings.bindings.python_client.models.component_type_enum.ComponentTypeEnum  # noqa
         )
@@ -123,6 +219,8 @@ class CorgiService:
     @staticmethod
     def get_component_namespaces():
         """get component namespaces enum"""
+        import component_registry_bindings
+
         return (
             component_registry_bindings.bindings.python_client.models.namespace_enum.NamespaceEnum
         )
@@ -155,7 +253,7 @@ class CorgiService:
 
         # get rid of the self attribute
         fields = [f"{prefix}{field}" for field in model.get_fields().keys()]
-        for name, related_model in RELATED_MODELS_MAPPING.get(model, {}).items():
+        for name, related_model in get_related_models_mapping().get(model, {}).items():
             fields.extend(CorgiService.get_fields(related_model, prefix=f"{prefix}{name}."))
 
         return fields
@@ -167,30 +265,43 @@ class OSIDBService:
     has_binding = True
 
     @staticmethod
+    @shared_session
     def create_session():
         """init osidb session"""
+        import osidb_bindings
+
         try:
             credentials = {}
             if OSIDB_AUTH_METHOD == "credentials":
                 credentials["username"] = OSIDB_USERNAME
                 credentials["password"] = OSIDB_PASSWORD
-            return osidb_bindings.new_session(
-                osidb_server_uri=OSIDB_SERVER_URL,
-                verify_ssl=GRIFFON_VERIFY_SSL,
-                **credentials,
+            return cached_session(
+                partial(
+                    osidb_bindings.new_session,
+                    osidb_server_uri=OSIDB_SERVER_URL,
+                    verify_ssl=GRIFFON_VERIFY_SSL,
+                    **credentials,
+                ),
+                OSIDB_SERVER_URL,
             )
         except:  # noqa
+            from griffon.output import console
+
             console.log(f"{OSIDB_SERVER_URL} is not accessible (or krb ticket has expired).")
             exit(1)
 
     @staticmethod
     def get_flaw_states():
         """get flaw states enum"""
+        import osidb_bindings
+
         return osidb_bindings.bindings.python_client.models.FlawClassificationState
 
     @staticmethod
     def get_flaw_resolutions():
         """get flaw resolution enum"""
+        import osidb_bindings
+
         # TODO: FlawResolutionEnum changed to Resolution01FEnum in OSIDB schema
         # due to some weird drf-spectacular naming clash resolution, there is
         # a way ho to set this to a immutable name however this would require
@@ -203,16 +314,22 @@ class OSIDBService:
     @staticmethod
     def get_flaw_impacts():
         """get flaw impacts enum"""
+        import osidb_bindings
+
         return osidb_bindings.bindings.python_client.models.ImpactEnum
 
     @staticmethod
     def get_affect_affectedness():
         """get affect affectedness enum"""
+        import osidb_bindings
+
         return osidb_bindings.bindings.python_client.models.AffectednessEnum
 
     @staticmethod
     def get_affect_resolution():
         """get affect affectedness enum"""
+        import osidb_bindings
+
         # TODO: AffectResolutionEnum changed to Resolution3AcEnum in OSIDB schema
         # due to some weird drf-spectacular naming clash resolution, there is
         # a way ho to set this to a immutable name however this would require
@@ -225,11 +342,15 @@ class OSIDBService:
     @staticmethod
     def get_affect_impact():
         """get affect impact enum"""
+        import osidb_bindings
+
         return osidb_bindings.bindings.python_client.models.ImpactEnum
 
     @staticmethod
     def get_flaw_meta_type():
         """get flaw meta type enum"""
+        import osidb_bindings
+
         return osidb_bindings.bindings.python_client.models.MetaTypeEnum
 
     @staticmethod
@@ -243,7 +364,7 @@ class OSIDBService:
 
         # get rid of the self attribute
         fields = [f"{prefix}{field}" for field in model.get_fields().keys()]
-        for name, related_model in RELATED_MODELS_MAPPING.get(model, {}).items():
+        for name, related_model in get_related_models_mapping().get(model, {}).items():
             fields.extend(OSIDBService.get_fields(related_model, prefix=f"{prefix}{name}."))
 
         return fields
@@ -262,7 +383,7 @@ class OSIDBService:
 
         # get rid of the self attribute and add additional wildcard
         fields = [f"{prefix}{field}" for field in model_meta_attr.get_fields().keys() | {"*"}]
-        for name, related_model in RELATED_MODELS_MAPPING.get(model, {}).items():
+        for name, related_model in get_related_models_mapping().get(model, {}).items():
             fields.extend(
                 OSIDBService.get_meta_attr_fields(related_model, prefix=f"{prefix}{name}.")
             )
@@ -276,20 +397,31 @@ class CommunityComponentService:
     has_binding = True
 
     @staticmethod
+    @shared_session
     def create_session():
         """init corgi session"""
+        import component_registry_bindings
+
         try:
-            return component_registry_bindings.new_session(
-                component_registry_server_uri=COMMUNITY_COMPONENTS_SERVER_URL,
-                verify_ssl=GRIFFON_VERIFY_SSL,
+            return cached_session(
+                partial(
+                    component_registry_bindings.new_session,
+                    component_registry_server_uri=COMMUNITY_COMPONENTS_SERVER_URL,
+                    verify_ssl=GRIFFON_VERIFY_SSL,
+                ),
+                COMMUNITY_COMPONENTS_SERVER_URL,
             )
         except:  # noqa
+            from griffon.output import console
+
             console.log(f"{COMMUNITY_COMPONENTS_SERVER_URL } is not accessible.")
             exit(1)
 
     @staticmethod
     def get_component_types():
         """get component type enum"""
+        import component_registry_bindings
+
         return (
             component_registry_bindings.bindings.python_client.models.component_type_enum.ComponentTypeEnum  # noqa
         )
@@ -297,6 +429,8 @@ class CommunityComponentService:
     @staticmethod
     def get_component_namespaces():
         """get component namespaces enum"""
+        import component_registry_bindings
+
         return (
             component_registry_bindings.bindings.python_client.models.namespace_enum.NamespaceEnum
         )
@@ -329,12 +463,131 @@ class CommunityComponentService:
 
         # get rid of the self attribute
         fields = [f"{prefix}{field}" for field in model.get_fields().keys()]
-        for name, related_model in RELATED_MODELS_MAPPING.get(model, {}).items():
+        for name, related_model in get_related_models_mapping().get(model, {}).items():
             fields.extend(CorgiService.get_fields(related_model, prefix=f"{prefix}{name}."))
 
         return fields
 
 
+def configure_response_cache(
+    enabled: bool,
+    refresh: bool = False,
+    record: Optional[str] = None,
+    replay: Optional[str] = None,
+) -> None:
+    """
+    configure on-disk cache of service responses from .griffonrc
+
+    cache_ttl sets ttl (in seconds) of all resources which can be overridden per
+    resource by cache_ttl_{resource} (eg. cache_ttl_flaws), cache_max_size is in MB
+
+    record or replay directory replaces the cache by a store of recorded responses
+    """
+    fixtures_directory = record or replay
+    if fixtures_directory:
+        from griffon.recording import FixtureStore
+
+        configure_cache(True, store=FixtureStore(fixtures_directory, replay=bool(replay)))
+        return
+
+    resource_ttls = (
+        {
+            option[len("cache_ttl_") :]: int(griffon_config.get("default", option))
+            for option in griffon_config.options("default")
+            if option.startswith("cache_ttl_")
+        }
+        if griffon_config.has_section("default")
+        else {}
+    )
+    configure_cache(
+        enabled,
+        directory=os.path.join(GRIFFON_CONFIG_DIR, "cache"),
+        ttl=int(get_config_option("default", "cache_ttl", DEFAULT_CACHE_TTL)),
+        resource_ttls=resource_ttls,
+        max_size=int(get_config_option("default", "cache_max_size", DEFAULT_CACHE_MAX_SIZE)),
+        refresh=refresh,
+    )
+
+
+def page_limit(resource) -> int:
+    """default page size of list operations of resource, set by the binding owning it"""
+    binding = getattr(resource, "binding", None) or type(resource).__module__.split(".")[0]
+    return importlib.import_module(f"{binding}.constants").DEFAULT_LIMIT
+
+
+def retrieve_list_with_progress(
+    resource, status=None, label="result(s)", max_results=None, **params
+) -> Tuple[int, List]:
+    """
+    retrieve all results of a list operation
+
+    total count is taken from the first page instead of a separate count request,
+    remaining pages are retrieved concurrently and progress is reported to status
+    as they arrive, returns total count and results in page order
+    """
+    params.pop("offset", None)
+    limit = params.pop("limit", None) or page_limit(resource)
+
+    with timings.span("count", "service", label=label):
+        first_page = resource.retrieve_list(limit=limit, **params)
+    count = first_page.count
+    total = count if max_results is None else min(count, max_results)
+    if status:
+        status.update(f"found {count} {label}.")
+
+    offsets = range(limit, total, limit) if first_page.next_ else []
+    pages = [first_page]
+    retrieved = len(first_page.results)
+    with ThreadPoolExecutor(max_workers=get_max_workers()) as pool, timings.span(
+        "pagination", "service", label=label, pages=len(offsets)
+    ):
+        futures = [
+            pool.submit(resource.retrieve_list, limit=limit, offset=offset, **params)
+            for offset in offsets
+        ]
+        for future in as_completed(futures):
+            retrieved += len(future.result().results)
+            if status:
+                status.update(f"found {count} {label}- retrieved {retrieved}/{total}.")
+        pages.extend(future.result() for future in futures)
+    return count, [result for page in pages for result in page.results]
+
+
+def iterate_list(resource, max_results=None, **params) -> Iterator:
+    """
+    iterate over results of a list operation as pages arrive
+
+    unlike retrieve_list_iterator_async the first results are yielded as soon as
+    the first page is retrieved, at most max_workers of the remaining pages are
+    prefetched concurrently and yielded in order, pages not yet retrieved when the
+    iteration is closed are cancelled
+    """
+    params.pop("offset", None)
+    limit = params.pop("limit", None) or page_limit(resource)
+
+    first_page = resource.retrieve_list(limit=limit, **params)
+    total = first_page.count if max_results is None else min(first_page.count, max_results)
+    offsets = iter(range(limit, total, limit) if first_page.next_ else [])
+    max_workers = get_max_workers()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pages = deque(
+            pool.submit(resource.retrieve_list, limit=limit, offset=offset, **params)
+            for offset in islice(offsets, max_workers)
+        )
+        try:
+            yield from first_page.results
+            while pages:
+                page = pages.popleft().result()
+                pages.extend(
+                    pool.submit(resource.retrieve_list, limit=limit, offset=offset, **params)
+                    for offset in islice(offsets, 1)
+                )
+                yield from page.results
+        finally:
+            for future in pages:
+                future.cancel()
+
+
 @contextmanager
 def console_status(no_progress_bar, initial_status=None):
     """updatable console status progress bar"""
@@ -373,6 +626,8 @@ def console_status(no_progress_bar, initial_status=None):
     if no_progress_bar:
         yield DisabledStatusObject()
     else:
+        from griffon.output import console
+
         status = f": {initial_status}" if initial_status else ""
 
         with console.status(
@@ -1,81 +1,102 @@
 import logging
 
-import requests
-
-from griffon import CORGI_SERVER_URL, OSIDB_SERVER_URL
+from griffon import CORGI_SERVER_URL, OSIDB_SERVER_URL, http_session
+from griffon.autocomplete.index import complete
 
 logger = logging.getLogger("griffon")
 
 
-def get_product_version_ofuris(ctx, param, incomplete):
+# live lookups used until the local autocomplete index is populated
+def lookup_product_version_ofuris(incomplete):
     payload = {"limit": 100, "include_fields": "ofuri", "re_ofuri": incomplete}
-    response = requests.get(
+    response = http_session().get(
         f"{CORGI_SERVER_URL}/api/v1/product_versions",
         params=payload,
-        headers={"Accept-Encoding": "gzip;q=1.0, identity; q=0.5, *;q=0"},
     )
     ofuris = response.json()["results"]
     return [k["ofuri"] for k in ofuris if k["ofuri"].startswith(incomplete)]
 
 
-def get_product_version_names(ctx, param, incomplete):
+def lookup_product_version_names(incomplete):
     payload = {"limit": 100, "include_fields": "name", "re_name": incomplete}
-    response = requests.get(
+    response = http_session().get(
         f"{CORGI_SERVER_URL}/api/v1/product_versions",
         params=payload,
-        headers={"Accept-Encoding": "gzip;q=1.0, identity; q=0.5, *;q=0"},
     )
     names = response.json()["results"]
     return [k["name"] for k in names if k["name"].startswith(incomplete)]
 
 
-def get_product_stream_ofuris(ctx, param, incomplete):
+def lookup_product_stream_ofuris(incomplete):
     payload = {"limit": 100, "include_fields": "ofuri", "re_ofuri": incomplete}
-    response = requests.get(
+    response = http_session().get(
         f"{CORGI_SERVER_URL}/api/v1/product_streams",
         params=payload,
-        headers={"Accept-Encoding": "gzip;q=1.0, identity; q=0.5, *;q=0"},
     )
     ofuris = response.json()["results"]
     return [k["ofuri"] for k in ofuris if k["ofuri"].startswith(incomplete)]
 
 
-def get_product_stream_names(ctx, param, incomplete):
+def lookup_product_stream_names(incomplete):
     payload = {"limit": 100, "include_fields": "name", "re_name": incomplete}
-    response = requests.get(
+    response = http_session().get(
         f"{CORGI_SERVER_URL}/api/v1/product_streams",
         params=payload,
-        headers={"Accept-Encoding": "gzip;q=1.0, identity; q=0.5, *;q=0"},
     )
     names = response.json()["results"]
     return [k["name"] for k in names if k["name"].startswith(incomplete)]
 
 
-def get_component_names(ctx, param, incomplete):
+def lookup_component_names(incomplete):
     payload = {"limit": 100, "include_fields": "name", "re_name": incomplete}
-    response = requests.get(
+    response = http_session().get(
         f"{CORGI_SERVER_URL}/api/v1/components",
         params=payload,
-        headers={"Accept-Encoding": "gzip;q=1.0, identity; q=0.5, *;q=0"},
     )
     names = response.json()["results"]
     return list(set([k["name"] for k in names if k["name"].startswith(incomplete)]))
 
 
-def get_component_purls(ctx, param, incomplete):
+def lookup_component_purls(incomplete):
     payload = {"limit": 100, "include_fields": "purl", "re_purl": incomplete}
-    response = requests.get(
+    response = http_session().get(
         f"{CORGI_SERVER_URL}/api/v1/components",
         params=payload,
-        headers={"Accept-Encoding": "gzip;q=1.0, identity; q=0.5, *;q=0"},
     )
     names = response.json()["results"]
     return list(set([k["purl"] for k in names if k["purl"].startswith(incomplete)]))
 
 
-def get_cve_ids(ctx, param, incomplete):
-    """TODO - the following is not ideal for autocomplete lookup - need to investigate"""
-    response = requests.get(
+def lookup_cve_ids(incomplete):
+    response = http_session().get(
         f"{OSIDB_SERVER_URL}/osidb/api/v1/flaws?limit=10&re_cve_id={incomplete}&include_fields=cve_id"  # noqa
     )
     return [k["cve_id"] for k in response.json()["results"] if k["cve_id"].startswith(incomplete)]
+
+
+def get_product_version_ofuris(ctx, param, incomplete):
+    return complete("product_version_ofuri", incomplete, lookup_product_version_ofuris)
+
+
+def get_product_version_names(ctx, param, incomplete):
+    return complete("product_version_name", incomplete, lookup_product_version_names)
+
+
+def get_product_stream_ofuris(ctx, param, incomplete):
+    return complete("product_stream_ofuri", incomplete, lookup_product_stream_ofuris)
+
+
+def get_product_stream_names(ctx, param, incomplete):
+    return complete("product_stream_name", incomplete, lookup_product_stream_names)
+
+
+def get_component_names(ctx, param, incomplete):
+    return complete("component_name", incomplete, lookup_component_names)
+
+
+def get_component_purls(ctx, param, incomplete):
+    return complete("component_purl", incomplete, lookup_component_purls)
+
+
+def get_cve_ids(ctx, param, incomplete):
+    return complete("cve_id", incomplete, lookup_cve_ids)
@@ -0,0 +1,7 @@
+"""
+    refresh stale sources of the autocomplete index
+
+"""
+from griffon.autocomplete.index import CompletionIndex
+
+CompletionIndex().refresh_stale()
@@ -0,0 +1,241 @@
+"""
+    local autocomplete index
+
+"""
+import logging
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from griffon import (
+    CORGI_SERVER_URL,
+    GRIFFON_CONFIG_DIR,
+    OSIDB_SERVER_URL,
+    get_config_option,
+    http_session,
+)
+
+logger = logging.getLogger("griffon")
+
+AUTOCOMPLETE_INDEX_FILE = os.path.join(GRIFFON_CONFIG_DIR, "autocomplete.db")
+
+# seconds after which index is refreshed in the background
+DEFAULT_AUTOCOMPLETE_TTL = 86400
+
+# do not spawn another background refresh while one started recently
+REFRESH_LOCK_TIMEOUT = 600
+
+PAGE_LIMIT = 1000
+
+# highest code point, used as upper bound of prefix range queries
+MAX_CHAR = "\U0010ffff"
+
+
+class CompletionSource:
+    """
+    list endpoint providing values of one or more completion kinds
+
+    complete sources hold all possible values so prefixes missing in the index
+    are not looked up live, incremental sources only fetch changes since their
+    last refresh via the since_param filter
+    """
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        params: Dict[str, str],
+        kinds: Dict[str, str],
+        complete: bool = True,
+        since_param: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.url = url
+        self.params = params
+        self.kinds = kinds
+        self.complete = complete
+        self.since_param = since_param
+
+    def fetch(self, since: Optional[float] = None) -> Iterable[dict]:
+        """yield all results of source following pagination"""
+        params: Dict[str, object] = {"limit": PAGE_LIMIT, **self.params}
+        if since and self.since_param:
+            params[self.since_param] = datetime.fromtimestamp(since, timezone.utc).isoformat()
+        url = self.url
+        while url:
+            response = http_session().get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
+            yield from data["results"]
+            # next link already contains all the params
+            url, params = data.get("next"), {}
+
+
+SOURCES = [
+    CompletionSource(
+        "product_streams",
+        f"{CORGI_SERVER_URL}/api/v1/product_streams",
+        {"include_fields": "name,ofuri"},
+        {"product_stream_name": "name", "product_stream_ofuri": "ofuri"},
+    ),
+    CompletionSource(
+        "product_versions",
+        f"{CORGI_SERVER_URL}/api/v1/product_versions",
+        {"include_fields": "name,ofuri"},
+        {"product_version_name": "name", "product_version_ofuri": "ofuri"},
+    ),
+    # only latest root components are indexed upfront, other components are
+    # added to the index once looked up live
+    CompletionSource(
+        "components",
+        f"{CORGI_SERVER_URL}/api/v1/components",
+        {
+            "include_fields": "name,purl",
+            "root_components": "True",
+            "latest_components_by_streams": "True",
+        },
+        {"component_name": "name", "component_purl": "purl"},
+        complete=False,
+    ),
+    CompletionSource(
+        "flaws",
+        f"{OSIDB_SERVER_URL}/osidb/api/v1/flaws",
+        {"include_fields": "cve_id"},
+        {"cve_id": "cve_id"},
+        since_param="changed_after",
+    ),
+]
+
+KIND_SOURCES = {kind: source for source in SOURCES for kind in source.kinds}
+
+
+class CompletionIndex:
+    """sqlite backed index of completion values supporting prefix search"""
+
+    def __init__(self, path: str = AUTOCOMPLETE_INDEX_FILE) -> None:
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.connection = sqlite3.connect(self.path, timeout=5)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS completions "
+                "(kind TEXT, value TEXT, PRIMARY KEY (kind, value)) WITHOUT ROWID"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sources (name TEXT PRIMARY KEY, refreshed REAL)"
+            )
+
+    def search(self, kind: str, prefix: str, limit: int = 100) -> List[str]:
+        """get values of kind starting with prefix"""
+        rows = self.connection.execute(
+            "SELECT value FROM completions WHERE kind = ? AND value >= ? AND value < ? "
+            "ORDER BY value LIMIT ?",
+            (kind, prefix, f"{prefix}{MAX_CHAR}", limit),
+        )
+        return [value for (value,) in rows]
+
+    def add(self, kind: str, values: Iterable[str]) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO completions (kind, value) VALUES (?, ?)",
+                ((kind, value) for value in values if value),
+            )
+
+    def refreshed(self, source: CompletionSource) -> Optional[float]:
+        """get timestamp of the last refresh of source, None if never refreshed"""
+        row = self.connection.execute(
+            "SELECT refreshed FROM sources WHERE name = ?", (source.name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def is_stale(self, source: CompletionSource) -> bool:
+        refreshed = self.refreshed(source)
+        ttl = int(get_config_option("default", "autocomplete_ttl", DEFAULT_AUTOCOMPLETE_TTL))
+        return refreshed is None or time.time() - refreshed > ttl
+
+    def refresh(self, source: CompletionSource) -> None:
+        """refresh values of source, incrementally if source supports it"""
+        started = time.time()
+        since = self.refreshed(source) if source.since_param else None
+        values: Dict[str, set] = {kind: set() for kind in source.kinds}
+        for result in source.fetch(since=since):
+            for kind, field in source.kinds.items():
+                values[kind].add(result.get(field))
+        with self.connection:
+            for kind in source.kinds:
+                # full refresh replaces values so removed entities are not offered
+                if since is None:
+                    self.connection.execute("DELETE FROM completions WHERE kind = ?", (kind,))
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO completions (kind, value) VALUES (?, ?)",
+                    ((kind, value) for value in values[kind] if value),
+                )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sources (name, refreshed) VALUES (?, ?)",
+                (source.name, started),
+            )
+
+    def refresh_stale(self) -> None:
+        for source in SOURCES:
+            if self.is_stale(source):
+                try:
+                    self.refresh(source)
+                except Exception as e:
+                    logger.warning(f"{type(e).__name__} - problem refreshing {source.name} index.")
+
+    def refresh_in_background(self) -> None:
+        """spawn detached process refreshing stale sources of the index"""
+        if not any(self.is_stale(source) for source in SOURCES):
+            return
+        lock_file = f"{self.path}.refresh"
+        try:
+            if time.time() - os.path.getmtime(lock_file) < REFRESH_LOCK_TIMEOUT:
+                return
+        except OSError:
+            pass
+        with open(lock_file, "w"):
+            pass
+        subprocess.Popen(
+            [sys.executable, "-m", "griffon.autocomplete"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+
+def complete(kind: str, incomplete: str, live_lookup) -> List[str]:
+    """
+    complete value of kind from the local index
+
+    live lookup is only used when the index cannot answer, ie. it was not
+    populated yet or the prefix is missing in an incomplete source, values found
+    live are added to the index
+    """
+    source = KIND_SOURCES[kind]
+    try:
+        index = CompletionIndex()
+        values = index.search(kind, incomplete)
+        index.refresh_in_background()
+        if values or (source.complete and index.refreshed(source) is not None):
+            return values
+    except sqlite3.Error as e:
+        logger.debug(f"{type(e).__name__} - autocomplete index is not available.")
+        index = None
+
+    try:
+        values = live_lookup(incomplete)
+    except Exception as e:
+        logger.debug(f"{type(e).__name__} - problem with live autocomplete lookup.")
+        return []
+    if index is not None:
+        try:
+            index.add(kind, values)
+        except sqlite3.Error:
+            pass
+    return values
@@ -0,0 +1,292 @@
+"""
+    on-disk cache of read only service responses
+
+"""
+import gzip
+import hashlib
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("griffon")
+
+DEFAULT_CACHE_TTL = 3600
+DEFAULT_CACHE_MAX_SIZE = 512  # MB
+
+
+def model_path(value) -> Optional[str]:
+    """get import path of model class of value, None if value is not a model"""
+    if not hasattr(value, "to_dict") or not hasattr(type(value), "from_dict"):
+        return None
+    return f"{type(value).__module__}.{type(value).__qualname__}"
+
+
+def serialize(value) -> Dict[str, Any]:
+    """serialize binding model (or plain json value) into json friendly dict"""
+    path = model_path(value)
+    if path is None:
+        return {"model": None, "data": value}
+    return {"model": path, "data": value.to_dict()}
+
+
+def deserialize(entry: Dict[str, Any]):
+    """deserialize value serialized by serialize"""
+    if entry["model"] is None:
+        return entry["data"]
+    module_name, class_name = entry["model"].rsplit(".", 1)
+    model = getattr(importlib.import_module(module_name), class_name)
+    return model.from_dict(entry["data"])
+
+
+class ResponseCache:
+    """
+    on-disk response cache
+
+    entries are gzipped json files named by hash of the request, each resource
+    can have its own ttl, once the cache grows over max_size least recently
+    used entries are evicted
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: int = DEFAULT_CACHE_TTL,
+        resource_ttls: Optional[Dict[str, int]] = None,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        refresh: bool = False,
+    ) -> None:
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+        self.resource_ttls = resource_ttls or {}
+        self.max_size = max_size * 1024 * 1024
+        # refresh ignores existing entries but still stores new responses
+        self.refresh = refresh
+        # session (not resource) operations which are cached too
+        self.session_operations: Tuple[str, ...] = ()
+        self.size: Optional[int] = None
+        self.lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(service: str, resource: str, operation: str, *args, **params) -> str:
+        """cache key of request, params are normalized so their order does not matter"""
+        request = {
+            "service": service,
+            "resource": resource,
+            "operation": operation,
+            "args": [str(arg) for arg in args],
+            "params": {name: str(value) for name, value in params.items() if value is not None},
+        }
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json.gz")
+
+    def get(self, key: str, resource: str):
+        """get cached value, raises KeyError when missing or expired"""
+        if self.refresh:
+            raise KeyError(key)
+        path = self.path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as fp:
+                entry = json.load(fp)
+        except (OSError, ValueError):
+            raise KeyError(key)
+        if time.time() - entry["created"] > self.resource_ttls.get(resource, self.ttl):
+            raise KeyError(key)
+        # entry modification time tracks last use for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        logger.debug(f"cache hit {resource} {key}")
+        return entry["value"]
+
+    def set(self, key: str, resource: str, value) -> None:
+        """store value, evicting least recently used entries if over size"""
+        path = self.path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as fp:
+            json.dump({"created": time.time(), "resource": resource, "value": value}, fp)
+        os.replace(tmp_path, path)
+        with self.lock:
+            if self.size is None:
+                self.size = sum(entry.stat().st_size for entry in self.entries())
+            else:
+                self.size += os.path.getsize(path)
+            if self.size > self.max_size:
+                self.evict()
+
+    def entries(self):
+        return [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.is_file() and entry.name.endswith(".json.gz")
+        ]
+
+    def evict(self) -> None:
+        """remove least recently used entries until cache is below 90% of max size"""
+        entries = sorted(self.entries(), key=lambda entry: entry.stat().st_mtime)
+        self.size = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if self.size <= self.max_size * 0.9:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self.size -= size
+            except OSError:
+                pass
+
+
+def cached_call(
+    cache: ResponseCache, service: str, resource: str, operation: str, fetch, *args, **params
+):
+    """get json friendly value of request from cache, fetching and storing it when missing"""
+    key = ResponseCache.key(service, resource, operation, *args, **params)
+    try:
+        return cache.get(key, resource)
+    except KeyError:
+        pass
+    value = fetch()
+    try:
+        cache.set(key, resource, value)
+    except OSError as e:
+        logger.warning(f"{type(e).__name__} - problem writing {resource} to cache.")
+    return value
+
+
+class CachedOperationsGroup:
+    """proxy of session operations group caching read only operations"""
+
+    def __init__(self, group, service: str, cache: ResponseCache) -> None:
+        self.group = group
+        self.service = service
+        self.cache = cache
+        self.resource = group.resource_name
+        # binding package of the group, its constants set page size of list operations
+        self.binding = getattr(group, "binding", None) or type(group).__module__.split(".")[0]
+
+    def __getattr__(self, name):
+        return getattr(self.group, name)
+
+    def cached(self, operation: str, fetch, *args, **params):
+        return cached_call(
+            self.cache, self.service, self.resource, operation, fetch, *args, **params
+        )
+
+    def retrieve(self, *args, **params):
+        return deserialize(
+            self.cached(
+                "retrieve",
+                lambda: serialize(self.group.retrieve(*args, **params)),
+                *args,
+                **params,
+            )
+        )
+
+    def retrieve_list(self, *args, **params):
+        response = deserialize(
+            self.cached(
+                "retrieve_list",
+                lambda: serialize(self.group.retrieve_list(*args, **params)),
+                *args,
+                **params,
+            )
+        )
+        # restore pagination helpers, further pages are retrieved through the cache too
+        paginator = importlib.import_module(
+            f"{type(response).__module__.split('.')[0]}.iterators"
+        ).Paginator
+        return paginator.make_response_iterable(response, self.retrieve_list, *args, **params)
+
+    def retrieve_list_iterator_async(self, *args, max_results=None, **params):
+        params.pop("offset", None)
+        results = self.cached(
+            "retrieve_list_iterator_async",
+            lambda: [
+                serialize(result)
+                for result in self.group.retrieve_list_iterator_async(
+                    *args, max_results=max_results, **params
+                )
+            ],
+            *args,
+            max_results=max_results,
+            **params,
+        )
+        for result in results:
+            yield deserialize(result)
+
+    def count(self, *args, **params):
+        params.pop("offset", None)
+        return self.cached("count", lambda: self.group.count(*args, **params), *args, **params)
+
+
+class CachedSession:
+    """proxy of binding session caching read only operations of its resources"""
+
+    def __init__(self, session, service: str, cache: ResponseCache) -> None:
+        self.session = session
+        self.service = service
+        self.cache = cache
+        self.groups: Dict[str, CachedOperationsGroup] = {}
+
+    def __getattr__(self, name):
+        attr = getattr(self.session, name)
+        if name in self.cache.session_operations:
+            return lambda *args, **params: deserialize(
+                cached_call(
+                    self.cache,
+                    self.service,
+                    "session",
+                    name,
+                    lambda: serialize(attr(*args, **params)),
+                    *args,
+                    **params,
+                )
+            )
+        if not hasattr(attr, "resource_name") or not hasattr(attr, "allowed_operations"):
+            return attr
+        if name not in self.groups:
+            self.groups[name] = CachedOperationsGroup(attr, self.service, self.cache)
+        return self.groups[name]
+
+
+# process wide response cache, enabled by configure_cache
+response_cache: Optional[ResponseCache] = None
+
+
+def configure_cache(
+    enabled: bool, store: Optional[ResponseCache] = None, **kwargs
+) -> Optional[ResponseCache]:
+    """
+    enable (or disable) caching of sessions created from now on
+
+    store (eg. record/replay fixture store) takes precedence over the response cache
+    """
+    global response_cache
+    response_cache = store or (ResponseCache(**kwargs) if enabled else None)
+    return response_cache
+
+
+def cached_session(create_session: Callable, service: str):
+    """
+    create session wrapped in caching proxy if caching is enabled
+
+    service calls of the session are bounded by the process wide request slots,
+    session is not created at all when replaying recorded responses
+    """
+    from griffon.recording import FixtureStore, ReplaySession
+    from griffon.throttling import BoundedSession
+
+    if response_cache is None:
+        return BoundedSession(create_session(), service)
+    if isinstance(response_cache, FixtureStore) and response_cache.replay:
+        # binding package owning the session factory
+        binding = getattr(create_session, "func", create_session).__module__.split(".")[0]
+        return ReplaySession(service, response_cache, binding)
+    return CachedSession(BoundedSession(create_session(), service), service, response_cache)
@@ -3,6 +3,7 @@
 
 """
 import logging
+from functools import partial
 
 import click
 import click_completion
@@ -10,66 +11,25 @@ import click_completion
 from griffon import (
     check_envvars,
     config_logging,
+    configure_response_cache,
     get_config_option,
     list_config_sections,
     print_version,
 )
 
-from .commands.configure import configure_grp
-from .commands.docs import docs_grp
-from .commands.entities import entities_grp
+from .commands import LazyGroup
 from .commands.plugin_commands import plugin_commands
-from .commands.queries import queries_grp
+from .exceptions import GriffonException
 from .output import OUTPUT_FORMAT
+from .profiling import CpuProfiler
+from .timings import timings
 
 logger = logging.getLogger("griffon")
 
 click_completion.init()
 
 
-@click.group()
-@click.pass_context
-def configure(ctx):
-    pass
-
-
-configure.add_command(configure_grp)
-
-
-@click.group()
-@click.pass_context
-def entities(ctx):
-    pass
-
-
-entities.add_command(entities_grp)
-
-
-@click.group()
-@click.pass_context
-def services_grp(ctx):
-    pass
-
-
-services_grp.add_command(queries_grp)
-
-
-@click.group()
-@click.pass_context
-def docs(ctx):
-    pass
-
-
-docs.add_command(docs_grp)
-
-
-@click.group()
-@click.pass_context
-def plugins(ctx):
-    pass
-
-
-@plugins.command(name="plugins", help="3rd party plugins.", cls=plugin_commands)
+@click.command(name="plugins", help="3rd party plugins.", cls=plugin_commands)
 @click.pass_context
 def plugins_grp(ctx):
     pass
@@ -77,13 +37,19 @@ def plugins_grp(ctx):
 
 # CLI entry point
 #
-#   A click.CommandCollection is used to aggregate up all CLI sub commands.
+#   A LazyGroup is used to aggregate up all CLI sub commands, command modules
+#   (and service bindings they use) are only imported once a command is invoked.
 #   Top level CLI options (germane to all commands) are included here.
 
 
 @click.group(
-    cls=click.CommandCollection,
-    sources=(configure, entities, services_grp, docs, plugins),
+    cls=LazyGroup,
+    lazy_commands={
+        "configure": "griffon.commands.configure:configure_grp",
+        "entities": "griffon.commands.entities:entities_grp",
+        "service": "griffon.commands.queries:queries_grp",
+        "docs": "griffon.commands.docs:docs_grp",
+    },
 )
 @click.option(
     "--version",
@@ -129,9 +95,57 @@ def plugins_grp(ctx):
     help="Activate profile, defined in .griffonrc.",
 )
 @click.option("--editor/--no-editor", default=True, help="Allow text editor prompt.")
+@click.option(
+    "--cache/--no-cache",
+    default=get_config_option("default", "cache", False),
+    help="Cache service responses in ~/.griffon/cache.",
+)
+@click.option("--refresh", is_flag=True, help="Refresh cached service responses.")
+@click.option(
+    "--record",
+    type=click.Path(file_okay=False),
+    help="Record service responses into directory.",
+)
+@click.option(
+    "--replay",
+    type=click.Path(exists=True, file_okay=False),
+    help="Replay service responses recorded by --record from directory (no network access).",
+)
+@click.option(
+    "--profile-timings",
+    is_flag=True,
+    help="Print timings of service calls, queries and output rendering (to stderr).",
+)
+@click.option(
+    "--profile-timings-trace",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Export timings to file in Chrome trace format (implies --profile-timings).",
+)
+@click.option(
+    "--profile-cpu",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write cpu profile of invoked command to file, pstats by default, "
+    "speedscope (.speedscope.json) or html (.html) with pyinstrument.",
+)
 @click.pass_context
 def cli(
-    ctx, debug, format, verbose, no_progress_bar, no_color, no_wrap, terminal_width, profile, editor
+    ctx,
+    debug,
+    format,
+    verbose,
+    no_progress_bar,
+    no_color,
+    no_wrap,
+    terminal_width,
+    profile,
+    editor,
+    cache,
+    refresh,
+    record,
+    replay,
+    profile_timings,
+    profile_timings_trace,
+    profile_cpu,
 ):
     """Red Hat product security CLI"""
 
@@ -152,7 +166,8 @@ def cli(
     ctx.obj["SHOW_UPSTREAM"] = False
     ctx.obj["FORMAT"] = format
     ctx.obj["VERBOSE"] = verbose
-    ctx.obj["NO_PROGRESS_BAR"] = no_progress_bar
+    # progress bar would interleave with streamed results
+    ctx.obj["NO_PROGRESS_BAR"] = no_progress_bar or format == OUTPUT_FORMAT.JSONL.value
     ctx.obj["NO_COLOR"] = no_color
     ctx.obj["NO_WRAP"] = get_config_option("default", "no_wrap", False)
     if no_wrap:
@@ -164,5 +179,26 @@ def cli(
     ctx.obj["SHORT_VERSION_VALUES"] = True
     ctx.obj["EDITOR"] = editor
 
+    if record and replay:
+        raise click.UsageError("--record and --replay are mutually exclusive.")
+    configure_response_cache(cache, refresh=refresh, record=record, replay=replay)
+
+    if profile_timings or profile_timings_trace:
+        timings.enable()
+        # reported once the invoked command exits
+        ctx.call_on_close(
+            partial(timings.report, profile_timings_trace, width=int(ctx.obj["TERMINAL_WIDTH"]))
+        )
+
+    if profile_cpu:
+        profiler = CpuProfiler(profile_cpu)
+        try:
+            profiler.start()
+        except GriffonException as e:
+            raise click.BadParameter(str(e), param_hint="--profile-cpu")
+        # stopped before timings are reported so reporting is not profiled
+        ctx.call_on_close(profiler.stop)
+
 
+cli.add_command(plugins_grp)
 cli.help = "Red Hat Product Security CLI"
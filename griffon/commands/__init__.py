@@ -1,3 +1,45 @@
 """
 cli commands
 """
+import importlib
+from functools import partial
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    group importing its commands only once they are needed
+
+    lazy_commands maps command name to import path of the command in
+    {module}:{attribute} form
+    """
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module_name, attribute = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+class LazyChoice(click.Choice):
+    """choice resolving its choices (eg. binding model fields) on first use"""
+
+    def __init__(self, get_choices, *args, case_sensitive=True):
+        self.get_choices = partial(get_choices, *args)
+        self.resolved_choices = None
+        self.case_sensitive = case_sensitive
+
+    @property
+    def choices(self):
+        if self.resolved_choices is None:
+            self.resolved_choices = tuple(self.get_choices())
+        return self.resolved_choices
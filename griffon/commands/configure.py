@@ -10,6 +10,7 @@ import click
 from pkg_resources import resource_filename  # type: ignore
 
 from griffon import GRIFFON_CONFIG_DIR, GRIFFON_RC_FILE
+from griffon.autocomplete.index import SOURCES, CompletionIndex
 
 logger = logging.getLogger("griffon")
 
@@ -27,6 +28,15 @@ def update(ctx):
     subprocess.run(["pip", "install", "--force", "griffon"])
 
 
+@configure_grp.command(name="autocomplete", help="Refresh local autocomplete index")
+def autocomplete():
+    """refresh all sources of the autocomplete index"""
+    index = CompletionIndex()
+    for source in SOURCES:
+        index.refresh(source)
+        logger.warning(f"{source.name} autocomplete index refreshed")
+
+
 @configure_grp.command(name="setup", help="Create ~/.griffon and .griffonrc config file")
 def setup():
     """stub"""
@@ -5,7 +5,6 @@ corgi entity operations
 import logging
 
 import click
-import requests
 from component_registry_bindings.bindings.python_client.api.v1 import (
     v1_builds_list,
     v1_builds_retrieve,
@@ -36,6 +35,7 @@ from griffon import (
     COMMUNITY_COMPONENTS_SERVER_URL,
     CORGI_SERVER_URL,
     CommunityComponentService,
+    http_session,
     progress_bar,
 )
 from griffon.autocomplete import (
@@ -44,6 +44,7 @@ from griffon.autocomplete import (
     get_product_stream_ofuris,
     get_product_version_ofuris,
 )
+from griffon.commands import LazyChoice
 from griffon.commands.entities.helpers import (
     multivalue_params_to_csv,
     query_params_options,
@@ -84,7 +85,7 @@ def components(ctx):
     entity="Component",
     endpoint_module=v1_components_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CommunityComponentService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, Component)},
     },
 )
 @click.pass_context
@@ -117,7 +118,7 @@ def list_components(ctx, strict_name_search, component_name, **params):
     entity="Component",
     endpoint_module=v1_components_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(CommunityComponentService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, Component)},
     },
 )
 @click.pass_context
@@ -165,7 +166,7 @@ def get_component(ctx, component_id, purl, **params):
     entity="Component",
     endpoint_module=v1_components_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CommunityComponentService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, Component)},
     },
 )
 @click.pass_context
@@ -227,7 +228,7 @@ def get_component_summary(ctx, component_name, strict_name_search, **params):
     entity="Component",
     endpoint_module=v1_components_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CommunityComponentService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, Component)},
     },
 )
 @click.pass_context
@@ -267,7 +268,7 @@ def get_component_provides(ctx, component_uuid, purl, **params):
     entity="Component",
     endpoint_module=v1_components_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CommunityComponentService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, Component)},
     },
 )
 @click.pass_context
@@ -348,9 +349,7 @@ def product_streams(ctx):
     entity="ProductStream",
     endpoint_module=v1_product_streams_list,
     options_overrides={
-        "include_fields": {
-            "type": click.Choice(CommunityComponentService.get_fields(ProductStream))
-        },
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, ProductStream)},
     },
 )
 @click.pass_context
@@ -385,9 +384,7 @@ def list_product_streams(ctx, product_stream_name, **params):
     entity="ProductStream",
     endpoint_module=v1_product_streams_retrieve,
     options_overrides={
-        "include_fields": {
-            "type": click.Choice(CommunityComponentService.get_fields(ProductStream))
-        },
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, ProductStream)},
     },
 )
 @click.pass_context
@@ -419,7 +416,7 @@ def get_product_stream(ctx, product_stream_name, inactive, ofuri, **params):
     entity="Component",
     endpoint_module=v1_components_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CommunityComponentService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, Component)},
     },
 )
 @click.pass_context
@@ -478,7 +475,7 @@ def get_product_stream_manifest(ctx, product_stream_name, ofuri, spdx_json_forma
         ps = session.product_streams.retrieve_list(name=product_stream_name).additional_properties
     if not ps:
         logger.warning("could not find active product stream.")
-    data = requests.get(ps["manifest"])
+    data = http_session().get(ps["manifest"])
     cprint(data.json(), ctx=ctx)
 
 
@@ -497,9 +494,7 @@ def builds(ctx):
     entity="SoftwareBuild",
     endpoint_module=v1_builds_list,
     options_overrides={
-        "include_fields": {
-            "type": click.Choice(CommunityComponentService.get_fields(SoftwareBuild))
-        },
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, SoftwareBuild)},
     },
 )
 @click.pass_context
@@ -524,9 +519,7 @@ def list_software_builds(ctx, software_build_name, **params):
     entity="SoftwareBuild",
     endpoint_module=v1_builds_retrieve,
     options_overrides={
-        "include_fields": {
-            "type": click.Choice(CommunityComponentService.get_fields(SoftwareBuild))
-        },
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, SoftwareBuild)},
     },
 )
 @click.pass_context
@@ -559,7 +552,7 @@ def products(ctx):
     entity="Product",
     endpoint_module=v1_products_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CommunityComponentService.get_fields(Product))},
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, Product)},
     },
 )
 @click.pass_context
@@ -586,7 +579,7 @@ def list_products(ctx, product_name, **params):
     entity="Product",
     endpoint_module=v1_products_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(CommunityComponentService.get_fields(Product))},
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, Product)},
     },
 )
 @click.pass_context
@@ -620,7 +613,7 @@ def product_versions(ctx):
     endpoint_module=v1_product_versions_list,
     options_overrides={
         "include_fields": {
-            "type": click.Choice(CommunityComponentService.get_fields(ProductVersion))
+            "type": LazyChoice(CommunityComponentService.get_fields, ProductVersion)
         },
     },
 )
@@ -650,7 +643,7 @@ def list_product_versions(ctx, product_version_name, **params):
     endpoint_module=v1_product_versions_retrieve,
     options_overrides={
         "include_fields": {
-            "type": click.Choice(CommunityComponentService.get_fields(ProductVersion))
+            "type": LazyChoice(CommunityComponentService.get_fields, ProductVersion)
         },
     },
 )
@@ -685,7 +678,7 @@ def product_variants(ctx):
     endpoint_module=v1_product_variants_list,
     options_overrides={
         "include_fields": {
-            "type": click.Choice(CommunityComponentService.get_fields(ProductVariant))
+            "type": LazyChoice(CommunityComponentService.get_fields, ProductVariant)
         },
     },
 )
@@ -715,7 +708,7 @@ def list_product_variants(ctx, product_variant_name, **params):
     endpoint_module=v1_product_variants_retrieve,
     options_overrides={
         "include_fields": {
-            "type": click.Choice(CommunityComponentService.get_fields(ProductVariant))
+            "type": LazyChoice(CommunityComponentService.get_fields, ProductVariant)
         },
     },
 )
@@ -749,7 +742,7 @@ def channels(ctx):
     entity="Channel",
     endpoint_module=v1_channels_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CommunityComponentService.get_fields(Channel))},
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, Channel)},
     },
 )
 @click.pass_context
@@ -776,7 +769,7 @@ def list_channels(ctx, channel_name, **params):
     entity="Channel",
     endpoint_module=v1_channels_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(CommunityComponentService.get_fields(Channel))},
+        "include_fields": {"type": LazyChoice(CommunityComponentService.get_fields, Channel)},
     },
 )
 @click.pass_context
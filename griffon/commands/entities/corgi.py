@@ -5,7 +5,6 @@ corgi entity operations
 import logging
 
 import click
-import requests
 from component_registry_bindings.bindings.python_client.api.v1 import (
     v1_builds_list,
     v1_builds_retrieve,
@@ -32,19 +31,27 @@ from component_registry_bindings.bindings.python_client.models import (
     SoftwareBuild,
 )
 
-from griffon import CORGI_SERVER_URL, CorgiService, progress_bar
+from griffon import (
+    CORGI_SERVER_URL,
+    CorgiService,
+    http_session,
+    iterate_list,
+    progress_bar,
+    retrieve_list_with_progress,
+)
 from griffon.autocomplete import (
     get_component_purls,
     get_product_stream_names,
     get_product_stream_ofuris,
     get_product_version_ofuris,
 )
+from griffon.commands import LazyChoice
 from griffon.commands.entities.helpers import (
     multivalue_params_to_csv,
     query_params_options,
 )
 from griffon.exceptions import GriffonException
-from griffon.output import console, cprint
+from griffon.output import OUTPUT_FORMAT, console, cprint
 
 logger = logging.getLogger("griffon")
 
@@ -79,7 +86,7 @@ def components(ctx):
     entity="Component",
     endpoint_module=v1_components_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, Component)},
     },
 )
 @click.pass_context
@@ -99,10 +106,9 @@ def list_components(ctx, strict_name_search, component_name, **params):
             "include_fields"
         ] = "link,uuid,purl,nvr,version,type,name,upstreams,related_url,download_url"
     params = multivalue_params_to_csv(params)
-    data = sorted(
-        list(session.components.retrieve_list_iterator_async(max_results=5000, **params)),
-        key=lambda d: d.purl,
-    )
+    data = iterate_list(session.components, max_results=5000, **params)
+    if ctx.obj["FORMAT"] != OUTPUT_FORMAT.JSONL.value:
+        data = sorted(data, key=lambda d: d.purl)
     return cprint(data, ctx=ctx)
 
 
@@ -113,7 +119,7 @@ def list_components(ctx, strict_name_search, component_name, **params):
     entity="Component",
     endpoint_module=v1_components_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, Component)},
     },
 )
 @click.pass_context
@@ -161,12 +167,12 @@ def get_component(ctx, component_id, purl, **params):
     entity="Component",
     endpoint_module=v1_components_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, Component)},
     },
 )
 @click.pass_context
-@progress_bar()
-def get_component_summary(ctx, component_name, strict_name_search, **params):
+@progress_bar(is_updatable=True)
+def get_component_summary(ctx, component_name, strict_name_search, operation_status, **params):
     """Get Component summary."""
     is_params_empty = [False for v in params.values() if v]
     if not component_name and not is_params_empty:
@@ -179,8 +185,9 @@ def get_component_summary(ctx, component_name, strict_name_search, **params):
         "name": component_name,
     }
     params = multivalue_params_to_csv(params)
-    components = session.components.retrieve_list_iterator_async(**cond)
-    components_cnt = session.components.count(**cond)
+    components_cnt, components = retrieve_list_with_progress(
+        session.components, status=operation_status, label="component(s)", **cond
+    )
     product_streams = []
     versions = []
     releases = []
@@ -222,7 +229,7 @@ def get_component_summary(ctx, component_name, strict_name_search, **params):
     entity="Component",
     endpoint_module=v1_components_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, Component)},
     },
 )
 @click.pass_context
@@ -260,7 +267,7 @@ def get_component_provides(ctx, component_uuid, purl, **params):
     entity="Component",
     endpoint_module=v1_components_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, Component)},
     },
 )
 @click.pass_context
@@ -353,7 +360,7 @@ def get_component_tree(ctx, component_uuid, nvr, purl, show_purl):
         component_uuid = c.results[0].uuid
     c = session.components.retrieve(component_uuid, include_fields="uuid,nvr,arch")
     if c.arch == "src" or c.arch == "noarch":
-        data = requests.get(f"{CORGI_SERVER_URL}/api/v1/components/{component_uuid}/taxonomy")
+        data = http_session().get(f"{CORGI_SERVER_URL}/api/v1/components/{component_uuid}/taxonomy")
         return cprint(data.json(), ctx=ctx)
     else:
         logger.info(f"{c.nvr},{c.arch} not a root component.")
@@ -377,7 +384,7 @@ def product_streams(ctx):
     entity="ProductStream",
     endpoint_module=v1_product_streams_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(ProductStream))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, ProductStream)},
     },
 )
 @click.pass_context
@@ -414,7 +421,7 @@ def list_product_streams(ctx, product_stream_name, **params):
     entity="ProductStream",
     endpoint_module=v1_product_streams_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(ProductStream))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, ProductStream)},
     },
 )
 @click.pass_context
@@ -446,7 +453,7 @@ def get_product_stream(ctx, product_stream_name, inactive, ofuri, **params):
     entity="Component",
     endpoint_module=v1_components_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, Component)},
     },
 )
 @click.pass_context
@@ -509,7 +516,7 @@ def get_product_stream_manifest(ctx, product_stream_name, ofuri, spdx_json_forma
     if not ps["manifest"]:
         logger.error(f"could not find manifest for {product_stream_name}.")
         ctx.exit()
-    data = requests.get(ps["manifest"])
+    data = http_session().get(ps["manifest"])
     cprint(data.json(), ctx=ctx)
 
 
@@ -528,7 +535,7 @@ def builds(ctx):
     entity="SoftwareBuild",
     endpoint_module=v1_builds_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(SoftwareBuild))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, SoftwareBuild)},
     },
 )
 @click.pass_context
@@ -555,7 +562,7 @@ def list_software_builds(ctx, software_build_name, **params):
     entity="SoftwareBuild",
     endpoint_module=v1_builds_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(SoftwareBuild))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, SoftwareBuild)},
     },
 )
 @click.pass_context
@@ -588,7 +595,7 @@ def products(ctx):
     entity="Product",
     endpoint_module=v1_products_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(Product))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, Product)},
     },
 )
 @click.pass_context
@@ -616,7 +623,7 @@ def list_products(ctx, product_name, **params):
     entity="Product",
     endpoint_module=v1_products_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(Product))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, Product)},
     },
 )
 @click.pass_context
@@ -649,7 +656,7 @@ def product_versions(ctx):
     entity="ProductVersion",
     endpoint_module=v1_product_versions_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(ProductVersion))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, ProductVersion)},
     },
 )
 @click.pass_context
@@ -678,7 +685,7 @@ def list_product_versions(ctx, product_version_name, **params):
     entity="ProductVersion",
     endpoint_module=v1_product_versions_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(ProductVersion))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, ProductVersion)},
     },
 )
 @click.pass_context
@@ -711,7 +718,7 @@ def product_variants(ctx):
     entity="ProductVariant",
     endpoint_module=v1_product_variants_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(ProductVariant))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, ProductVariant)},
     },
 )
 @click.pass_context
@@ -740,7 +747,7 @@ def list_product_variants(ctx, product_variant_name, **params):
     entity="ProductVariant",
     endpoint_module=v1_product_variants_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(ProductVariant))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, ProductVariant)},
     },
 )
 @click.pass_context
@@ -773,7 +780,7 @@ def channels(ctx):
     entity="Channel",
     endpoint_module=v1_channels_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(Channel))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, Channel)},
     },
 )
 @click.pass_context
@@ -801,7 +808,7 @@ def list_channels(ctx, channel_name, **params):
     entity="Channel",
     endpoint_module=v1_channels_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(Channel))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, Channel)},
     },
 )
 @click.pass_context
@@ -1,14 +1,28 @@
+import atexit
+import importlib
 import inspect
+import json
+import logging
+import os
 from datetime import datetime
 from enum import Enum
+from importlib.metadata import PackageNotFoundError, version
 from itertools import chain
 from types import ModuleType
-from typing import Callable, Optional, Union, get_args, get_origin
+from typing import Callable, Optional, Type, Union, cast, get_args, get_origin
 
 import click
 from osidb_bindings.bindings.python_client.types import OSIDBModel
 
-from griffon import get_config_option
+from griffon import GRIFFON_CONFIG_DIR, __version__, get_config_option
+from griffon.commands import LazyChoice
+
+logger = logging.getLogger("griffon")
+
+OPTION_SCHEMA_FILE = os.path.join(GRIFFON_CONFIG_DIR, "option_schema.json")
+
+# option types which are serialized by name
+BASIC_OPTION_TYPES = {type_.__name__: type_ for type_ in (str, int, float, bool)}
 
 
 def abort_if_false(ctx, param, value: bool):
@@ -33,25 +47,121 @@ def safe_issubclass(cls: type, class_or_tuple):
     return inspect.isclass(cls) and issubclass(cls, class_or_tuple)
 
 
-def to_option_type(type_):
-    """Convert type to the Click option type"""
+def class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def import_class(path: str) -> type:
+    module_name, name = path.split(":")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def enum_choices(*paths: str) -> list:
+    """get members of all enums given by their import paths"""
+    return list(chain.from_iterable(cast(Type[Enum], import_class(path)) for path in paths))
+
+
+def to_option_spec(type_):
+    """Convert type to the serializable spec of the Click option type"""
 
     is_multiple = False
     if get_origin(type_) is list:
-        option_type = get_args(type_)[0]
+        type_spec, _ = to_option_spec(get_args(type_)[0])
+        # list items are converted by the item type itself
+        if isinstance(type_spec, dict) and "choice" in type_spec:
+            type_spec = {"class": type_spec["choice"][0]}
         is_multiple = True
     elif get_origin(type_) == Union and all(safe_issubclass(arg, Enum) for arg in get_args(type_)):
-        option_type = click.Choice(
-            list(chain.from_iterable([list(enum) for enum in get_args(type_)]))
-        )
+        type_spec = {"choice": [class_path(enum) for enum in get_args(type_)]}
     elif safe_issubclass(type_, Enum):
-        option_type = click.Choice(list(type_))
+        type_spec = {"choice": [class_path(type_)]}
     elif type_ is datetime:
-        option_type = click.DateTime()
+        type_spec = "datetime"
+    elif type_ in BASIC_OPTION_TYPES.values():
+        type_spec = type_.__name__
     else:
-        option_type = type_
+        type_spec = {"class": class_path(type_)}
+
+    return type_spec, is_multiple
+
+
+def from_option_spec(type_spec):
+    """Convert spec created by to_option_spec to the Click option type"""
+
+    if type_spec == "datetime":
+        return click.DateTime()
+    if isinstance(type_spec, str):
+        return BASIC_OPTION_TYPES[type_spec]
+    if "choice" in type_spec:
+        # enums are imported only once choices are needed
+        return LazyChoice(enum_choices, *type_spec["choice"])
+    return import_class(type_spec["class"])
+
+
+def to_option_type(type_):
+    """Convert type to the Click option type"""
 
-    return option_type, is_multiple
+    type_spec, is_multiple = to_option_spec(type_)
+    return from_option_spec(type_spec), is_multiple
+
+
+def option_schema_key() -> str:
+    """key of the option schema, schema is rebuilt once any of the versions change"""
+    versions = [f"griffon={__version__}"]
+    for package in ("osidb-bindings", "component-registry-bindings"):
+        try:
+            versions.append(f"{package}={version(package)}")
+        except PackageNotFoundError:
+            versions.append(f"{package}=unknown")
+    return ",".join(versions)
+
+
+class OptionSchema:
+    """
+    flat table of the option specs generated from the bindings
+
+    introspection of the endpoint modules and their models is done only once per
+    installed bindings versions, the table is stored in ~/.griffon/option_schema.json
+    """
+
+    def __init__(self, path: str = OPTION_SCHEMA_FILE) -> None:
+        self.path = os.path.expanduser(path)
+        self.table: Optional[dict] = None
+        self.dirty = False
+
+    def load(self) -> dict:
+        try:
+            with open(self.path) as fp:
+                data = json.load(fp)
+            if data.get("key") == option_schema_key():
+                return data["options"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def save(self) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w") as fp:
+                json.dump({"key": option_schema_key(), "options": self.table}, fp)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.debug(f"{type(e).__name__} - option schema could not be stored.")
+
+    def get(self, key: str, build: Callable[[], list]) -> list:
+        """get option specs stored under key, build and store them if missing"""
+        if self.table is None:
+            self.table = self.load()
+        if key not in self.table:
+            self.table[key] = build()
+            if not self.dirty:
+                self.dirty = True
+                atexit.register(self.save)
+        return self.table[key]
+
+
+option_schema = OptionSchema()
 
 
 def filter_request_fields(fields: dict, exclude: list[str]):
@@ -94,18 +204,26 @@ def query_params_options(
     if options_overrides is None:
         options_overrides = {}
 
+    def build() -> list:
+        specs = []
+        for query_param, param_type in endpoint_module.QUERY_PARAMS.items():
+            type_spec, is_multiple = to_option_spec(param_type)
+            specs.append(
+                {
+                    "option": f"--{query_param.replace('_','-')}",
+                    "variable": query_param,
+                    "type": type_spec,
+                    "help": f"{entity.capitalize()} {query_param.replace('_',' ')}",
+                    "multiple": is_multiple,
+                }
+            )
+        return specs
+
     def inner(fn):
         wrapper = fn
-        for query_param, param_type in endpoint_module.QUERY_PARAMS.items():
-            option_type, is_multiple = to_option_type(param_type)
-            option_params = {
-                "option": f"--{query_param.replace('_','-')}",
-                "variable": query_param,
-                "type": option_type,
-                "help": f"{entity.capitalize()} {query_param.replace('_',' ')}",
-                "multiple": is_multiple,
-            }
-            option_override = options_overrides.get(query_param, {})
+        for spec in option_schema.get(f"query:{endpoint_module.__name__}:{entity}", build):
+            option_params = {**spec, "type": from_option_spec(spec["type"])}
+            option_override = options_overrides.get(spec["variable"], {})
             option_params.update(
                 (override, option_override[override])
                 for override in option_params.keys() & option_override.keys()
@@ -137,24 +255,31 @@ def request_body_options(
     if exclude is None:
         exclude = []
 
-    def inner(fn):
-        wrapper = fn
-
+    def build() -> list:
         request_body_type = getattr(endpoint_module, "REQUEST_BODY_TYPE", None)
         if request_body_type is None:
-            return wrapper
+            return []
 
+        specs = []
         fields = filter_request_fields(request_body_type.get_fields(), exclude=exclude)
         for field, field_type in fields.items():
-            option_type, is_multiple = to_option_type(field_type)
-            option_params = {
-                "option": f"--{field.replace('_','-')}",
-                "variable": field,
-                "type": option_type,
-                "help": f"{request_body_type.__name__} {field.replace('_',' ')}",
-                "multiple": is_multiple,
-            }
+            type_spec, is_multiple = to_option_spec(field_type)
+            specs.append(
+                {
+                    "option": f"--{field.replace('_','-')}",
+                    "variable": field,
+                    "type": type_spec,
+                    "help": f"{request_body_type.__name__} {field.replace('_',' ')}",
+                    "multiple": is_multiple,
+                }
+            )
+        return specs
 
+    def inner(fn):
+        wrapper = fn
+        key = f"body:{endpoint_module.__name__}:{','.join(sorted(exclude))}"
+        for spec in option_schema.get(key, build):
+            option_params = {**spec, "type": from_option_spec(spec["type"])}
             wrapper = (
                 click.option(
                     option_params.pop("option"), option_params.pop("variable"), **option_params
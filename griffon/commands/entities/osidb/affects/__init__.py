@@ -15,7 +15,8 @@ from osidb_bindings.bindings.python_client.api.osidb import (
 from osidb_bindings.bindings.python_client.models import Affect
 from requests import HTTPError
 
-from griffon import OSIDB_SERVER_URL, OSIDBService, progress_bar
+from griffon import OSIDB_SERVER_URL, OSIDBService, iterate_list, progress_bar
+from griffon.commands import LazyChoice
 from griffon.commands.entities.helpers import (
     abort_if_false,
     filter_request_fields,
@@ -42,9 +43,9 @@ def affects(ctx):
     entity="Affect",
     endpoint_module=osidb_api_v1_affects_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(Affect))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(Affect))},
-        "include_meta_attr": {"type": click.Choice(OSIDBService.get_meta_attr_fields(Affect))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, Affect)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, Affect)},
+        "include_meta_attr": {"type": LazyChoice(OSIDBService.get_meta_attr_fields, Affect)},
     },
 )
 @click.pass_context
@@ -55,9 +56,7 @@ def list_affects(ctx, **params):
     session = OSIDBService.create_session()
 
     params = multivalue_params_to_csv(params)
-    return cprint(
-        list(session.affects.retrieve_list_iterator_async(max_results=5000, **params)), ctx=ctx
-    )
+    return cprint(iterate_list(session.affects, max_results=5000, **params), ctx=ctx)
 
 
 @affects.command(name="get")
@@ -66,9 +65,9 @@ def list_affects(ctx, **params):
     entity="Affect",
     endpoint_module=osidb_api_v1_affects_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(Affect))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(Affect))},
-        "include_meta_attr": {"type": click.Choice(OSIDBService.get_meta_attr_fields(Affect))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, Affect)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, Affect)},
+        "include_meta_attr": {"type": LazyChoice(OSIDBService.get_meta_attr_fields, Affect)},
     },
 )
 @click.pass_context
@@ -15,7 +15,8 @@ from osidb_bindings.bindings.python_client.api.osidb import (
 from osidb_bindings.bindings.python_client.models import Flaw
 from requests import HTTPError
 
-from griffon import OSIDB_SERVER_URL, OSIDBService, progress_bar
+from griffon import OSIDB_SERVER_URL, OSIDBService, iterate_list, progress_bar
+from griffon.commands import LazyChoice
 from griffon.commands.entities.helpers import (
     filter_request_fields,
     get_editor,
@@ -46,9 +47,9 @@ def flaws(ctx):
     entity="Flaw",
     endpoint_module=osidb_api_v1_flaws_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(Flaw))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(Flaw))},
-        "include_meta_attr": {"type": click.Choice(OSIDBService.get_meta_attr_fields(Flaw))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, Flaw)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, Flaw)},
+        "include_meta_attr": {"type": LazyChoice(OSIDBService.get_meta_attr_fields, Flaw)},
     },
 )
 @click.pass_context
@@ -58,9 +59,7 @@ def list_flaws(ctx, **params):
     session = OSIDBService.create_session()
 
     params = multivalue_params_to_csv(params)
-    return cprint(
-        list(session.flaws.retrieve_list_iterator_async(max_results=5000, **params)), ctx=ctx
-    )
+    return cprint(iterate_list(session.flaws, max_results=5000, **params), ctx=ctx)
 
 
 @flaws.command(name="get")
@@ -74,9 +73,9 @@ def list_flaws(ctx, **params):
     entity="Flaw",
     endpoint_module=osidb_api_v1_flaws_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(Flaw))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(Flaw))},
-        "include_meta_attr": {"type": click.Choice(OSIDBService.get_meta_attr_fields(Flaw))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, Flaw)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, Flaw)},
+        "include_meta_attr": {"type": LazyChoice(OSIDBService.get_meta_attr_fields, Flaw)},
     },
 )
 @click.pass_context
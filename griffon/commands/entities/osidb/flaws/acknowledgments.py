@@ -16,6 +16,7 @@ from osidb_bindings.bindings.python_client.models import FlawAcknowledgment
 from requests import HTTPError
 
 from griffon import OSIDB_SERVER_URL, OSIDBService, progress_bar
+from griffon.commands import LazyChoice
 from griffon.commands.entities.helpers import (
     abort_if_false,
     filter_request_fields,
@@ -53,10 +54,10 @@ def flaw_acknowledgments(ctx):
     entity="Flaw Acknowledgment",
     endpoint_module=osidb_api_v1_flaws_acknowledgments_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(FlawAcknowledgment))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(FlawAcknowledgment))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawAcknowledgment)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawAcknowledgment)},
         "include_meta_attr": {
-            "type": click.Choice(OSIDBService.get_meta_attr_fields(FlawAcknowledgment))
+            "type": LazyChoice(OSIDBService.get_meta_attr_fields, FlawAcknowledgment)
         },
     },
 )
@@ -81,10 +82,10 @@ def get_flaw_acknowledgment(ctx, flaw_id, acknowledgment_uuid, **params):
     entity="Flaw Acknowledgment",
     endpoint_module=osidb_api_v1_flaws_acknowledgments_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(FlawAcknowledgment))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(FlawAcknowledgment))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawAcknowledgment)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawAcknowledgment)},
         "include_meta_attr": {
-            "type": click.Choice(OSIDBService.get_meta_attr_fields(FlawAcknowledgment))
+            "type": LazyChoice(OSIDBService.get_meta_attr_fields, FlawAcknowledgment)
         },
     },
 )
@@ -15,6 +15,7 @@ from osidb_bindings.bindings.python_client.models import FlawComment
 from requests import HTTPError
 
 from griffon import OSIDB_SERVER_URL, OSIDBService, progress_bar
+from griffon.commands import LazyChoice
 from griffon.commands.entities.helpers import (
     filter_request_fields,
     get_editor,
@@ -47,9 +48,9 @@ def flaw_comments(ctx):
     entity="Flaw Comment",
     endpoint_module=osidb_api_v1_flaws_comments_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(FlawComment))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(FlawComment))},
-        "include_meta_attr": {"type": click.Choice(OSIDBService.get_meta_attr_fields(FlawComment))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawComment)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawComment)},
+        "include_meta_attr": {"type": LazyChoice(OSIDBService.get_meta_attr_fields, FlawComment)},
     },
 )
 @click.pass_context
@@ -73,9 +74,9 @@ def get_flaw_comment(ctx, flaw_id, comment_uuid, **params):
     entity="Flaw Comments",
     endpoint_module=osidb_api_v1_flaws_comments_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(FlawComment))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(FlawComment))},
-        "include_meta_attr": {"type": click.Choice(OSIDBService.get_meta_attr_fields(FlawComment))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawComment)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawComment)},
+        "include_meta_attr": {"type": LazyChoice(OSIDBService.get_meta_attr_fields, FlawComment)},
     },
 )
 @click.pass_context
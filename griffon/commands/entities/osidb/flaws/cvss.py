@@ -16,6 +16,7 @@ from osidb_bindings.bindings.python_client.models import FlawCVSS
 from requests import HTTPError
 
 from griffon import OSIDB_SERVER_URL, OSIDBService, progress_bar
+from griffon.commands import LazyChoice
 from griffon.commands.entities.helpers import (
     abort_if_false,
     filter_request_fields,
@@ -49,9 +50,9 @@ def flaw_cvss(ctx):
     entity="Flaw CVSS",
     endpoint_module=osidb_api_v1_flaws_cvss_scores_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(FlawCVSS))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(FlawCVSS))},
-        "include_meta_attr": {"type": click.Choice(OSIDBService.get_meta_attr_fields(FlawCVSS))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawCVSS)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawCVSS)},
+        "include_meta_attr": {"type": LazyChoice(OSIDBService.get_meta_attr_fields, FlawCVSS)},
     },
 )
 @click.pass_context
@@ -75,9 +76,9 @@ def get_flaw_cvss(ctx, flaw_id, cvss_uuid, **params):
     entity="Flaw CVSS",
     endpoint_module=osidb_api_v1_flaws_cvss_scores_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(FlawCVSS))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(FlawCVSS))},
-        "include_meta_attr": {"type": click.Choice(OSIDBService.get_meta_attr_fields(FlawCVSS))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawCVSS)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawCVSS)},
+        "include_meta_attr": {"type": LazyChoice(OSIDBService.get_meta_attr_fields, FlawCVSS)},
     },
 )
 @click.pass_context
@@ -16,6 +16,7 @@ from osidb_bindings.bindings.python_client.models import FlawPackageVersion
 from requests import HTTPError
 
 from griffon import OSIDB_SERVER_URL, OSIDBService, progress_bar
+from griffon.commands import LazyChoice
 from griffon.commands.entities.helpers import (
     abort_if_false,
     filter_request_fields,
@@ -51,10 +52,10 @@ def flaw_package_versions(ctx):
     entity="Flaw Package Version",
     endpoint_module=osidb_api_v1_flaws_package_versions_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(FlawPackageVersion))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(FlawPackageVersion))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawPackageVersion)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawPackageVersion)},
         "include_meta_attr": {
-            "type": click.Choice(OSIDBService.get_meta_attr_fields(FlawPackageVersion))
+            "type": LazyChoice(OSIDBService.get_meta_attr_fields, FlawPackageVersion)
         },
     },
 )
@@ -79,10 +80,10 @@ def get_flaw_package_version(ctx, flaw_id, package_version_uuid, **params):
     entity="Flaw Package Version",
     endpoint_module=osidb_api_v1_flaws_package_versions_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(FlawPackageVersion))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(FlawPackageVersion))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawPackageVersion)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawPackageVersion)},
         "include_meta_attr": {
-            "type": click.Choice(OSIDBService.get_meta_attr_fields(FlawPackageVersion))
+            "type": LazyChoice(OSIDBService.get_meta_attr_fields, FlawPackageVersion)
         },
     },
 )
@@ -16,6 +16,7 @@ from osidb_bindings.bindings.python_client.models import FlawReference
 from requests import HTTPError
 
 from griffon import OSIDB_SERVER_URL, OSIDBService, progress_bar
+from griffon.commands import LazyChoice
 from griffon.commands.entities.helpers import (
     abort_if_false,
     filter_request_fields,
@@ -49,11 +50,9 @@ def flaw_references(ctx):
     entity="Flaw Reference",
     endpoint_module=osidb_api_v1_flaws_references_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(FlawReference))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(FlawReference))},
-        "include_meta_attr": {
-            "type": click.Choice(OSIDBService.get_meta_attr_fields(FlawReference))
-        },
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawReference)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawReference)},
+        "include_meta_attr": {"type": LazyChoice(OSIDBService.get_meta_attr_fields, FlawReference)},
     },
 )
 @click.pass_context
@@ -77,11 +76,9 @@ def get_flaw_reference(ctx, flaw_id, reference_uuid, **params):
     entity="Flaw References",
     endpoint_module=osidb_api_v1_flaws_references_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(FlawReference))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(FlawReference))},
-        "include_meta_attr": {
-            "type": click.Choice(OSIDBService.get_meta_attr_fields(FlawReference))
-        },
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawReference)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, FlawReference)},
+        "include_meta_attr": {"type": LazyChoice(OSIDBService.get_meta_attr_fields, FlawReference)},
     },
 )
 @click.pass_context
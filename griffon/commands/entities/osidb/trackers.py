@@ -11,7 +11,8 @@ from osidb_bindings.bindings.python_client.api.osidb import (
 )
 from osidb_bindings.bindings.python_client.models import Tracker
 
-from griffon import OSIDB_SERVER_URL, OSIDBService, progress_bar
+from griffon import OSIDB_SERVER_URL, OSIDBService, iterate_list, progress_bar
+from griffon.commands import LazyChoice
 from griffon.commands.entities.helpers import (
     multivalue_params_to_csv,
     query_params_options,
@@ -33,9 +34,9 @@ def trackers(ctx):
     entity="Tracker",
     endpoint_module=osidb_api_v1_trackers_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(Tracker))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(Tracker))},
-        "include_meta_attr": {"type": click.Choice(OSIDBService.get_meta_attr_fields(Tracker))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, Tracker)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, Tracker)},
+        "include_meta_attr": {"type": LazyChoice(OSIDBService.get_meta_attr_fields, Tracker)},
     },
 )
 @click.pass_context
@@ -45,9 +46,7 @@ def list_trackers(ctx, **params):
     session = OSIDBService.create_session()
 
     params = multivalue_params_to_csv(params)
-    return cprint(
-        list(session.trackers.retrieve_list_iterator_async(max_results=5000, **params)), ctx=ctx
-    )
+    return cprint(iterate_list(session.trackers, max_results=5000, **params), ctx=ctx)
 
 
 @trackers.command(name="get")
@@ -56,9 +55,9 @@ def list_trackers(ctx, **params):
     entity="Tracker",
     endpoint_module=osidb_api_v1_trackers_retrieve,
     options_overrides={
-        "include_fields": {"type": click.Choice(OSIDBService.get_fields(Tracker))},
-        "exclude_fields": {"type": click.Choice(OSIDBService.get_fields(Tracker))},
-        "include_meta_attr": {"type": click.Choice(OSIDBService.get_meta_attr_fields(Tracker))},
+        "include_fields": {"type": LazyChoice(OSIDBService.get_fields, Tracker)},
+        "exclude_fields": {"type": LazyChoice(OSIDBService.get_fields, Tracker)},
+        "include_meta_attr": {"type": LazyChoice(OSIDBService.get_meta_attr_fields, Tracker)},
     },
 )
 @click.pass_context
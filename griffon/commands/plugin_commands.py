@@ -1,12 +1,18 @@
 """
 
 """
+import importlib
+import importlib.util
+import json
 import logging
 import os
+import sys
+from typing import Dict, Optional, Tuple
 
 import click
 
-from griffon import get_config_option
+from griffon import GRIFFON_CONFIG_DIR, get_config_option
+from griffon.exceptions import GriffonException
 
 logger = logging.getLogger("griffon")
 
@@ -15,38 +21,148 @@ plugin_folder = os.path.join(os.path.dirname(__file__), "plugins")
 custom_plugin_dir = get_config_option("default", "custom_plugin_dir", "~/.griffon/plugins/")
 custom_folder = os.path.dirname(os.path.expanduser(custom_plugin_dir))
 
+PLUGIN_MANIFEST_FILE = os.path.join(GRIFFON_CONFIG_DIR, "plugins_manifest.json")
+
+
+def folder_mtime(folder: str) -> Optional[float]:
+    try:
+        return os.stat(folder).st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def find_plugins() -> Dict[str, str]:
+    """get paths of all plugins, griffon plugins take precedence over custom ones"""
+    plugins = {}
+    for folder in (custom_folder, plugin_folder):
+        try:
+            filenames = os.listdir(folder)
+        except FileNotFoundError:
+            continue
+        for filename in filenames:
+            if filename.endswith(".py") and not filename.startswith("__init__"):
+                plugins[filename[:-3]] = os.path.join(folder, filename)
+    return plugins
+
+
+def load_plugin(name: str, path: str) -> click.Command:
+    """
+    import plugin as module so its bytecode is cached in __pycache__ and module
+    is reused when plugin is looked up again within the same process
+    """
+    if os.path.dirname(path) == plugin_folder:
+        module = importlib.import_module(f"{__package__}.plugins.{name}")
+    else:
+        module_name = f"griffon_custom_plugins.{name}"
+        if module_name in sys.modules:
+            module = sys.modules[module_name]
+        else:
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            if spec is None or spec.loader is None:
+                raise GriffonException(f"Cannot load plugin {name} from {path}")
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[module_name]
+                raise
+    return module.plugins
+
+
+class PluginManifest:
+    """
+    plugin names, paths and short help strings stored in ~/.griffon
+
+    manifest is rebuilt once mtime of any of the plugin folders changes so
+    listing plugins (help, shell completion) does not load any plugin
+    """
+
+    def __init__(self, path: str = PLUGIN_MANIFEST_FILE) -> None:
+        self.path = os.path.expanduser(path)
+        self.plugins: Optional[Dict[str, dict]] = None
+
+    @staticmethod
+    def key() -> dict:
+        return {folder: folder_mtime(folder) for folder in (plugin_folder, custom_folder)}
+
+    def load(self) -> Dict[str, dict]:
+        if self.plugins is None:
+            try:
+                with open(self.path) as fp:
+                    data = json.load(fp)
+                if data.get("key") == self.key():
+                    self.plugins = data["plugins"]
+            except (OSError, ValueError, KeyError):
+                pass
+        if self.plugins is None:
+            self.plugins, complete = self.build()
+            # manifest with plugins failing to load is rebuilt on next invocation so
+            # that they are listed properly once fixed (eg. missing module installed)
+            if complete:
+                self.save()
+        return self.plugins
+
+    def build(self) -> Tuple[Dict[str, dict], bool]:
+        """
+        get path and short help of every plugin found, plugins failing to load are
+        kept with fallback help so their error is reported once they are invoked
+        """
+        plugins = {}
+        complete = True
+        for name, path in sorted(find_plugins().items()):
+            try:
+                short_help = load_plugin(name, path).get_short_help_str()
+            except Exception as e:
+                logger.warning(f"{type(e).__name__} - problem loading {name} plugin.")
+                short_help = f"{name} plugin (failed to load)"
+                complete = False
+            plugins[name] = {"path": path, "help": short_help}
+        return plugins, complete
+
+    def save(self) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w") as fp:
+                json.dump({"key": self.key(), "plugins": self.plugins}, fp)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.debug(f"{type(e).__name__} - plugin manifest could not be stored.")
+
+
+plugin_manifest = PluginManifest()
+
 
 class plugin_commands(click.MultiCommand):
     def list_commands(self, ctx):
         """Dynamically generate list of commands."""
-        rv = []
-        for filename in os.listdir(plugin_folder):
-            if filename.endswith(".py") and not filename.startswith("__init__"):
-                rv.append(filename[:-3])
-        try:
-            for filename in os.listdir(custom_folder):
-                if filename.endswith(".py") and not filename.startswith("__init__"):
-                    rv.append(filename[:-3])
-        except FileNotFoundError:
-            click.echo("")
-        rv.sort()
-        return rv
+        return sorted(plugin_manifest.load())
 
     def get_command(self, ctx, name):
         """Invoke command."""
-        ns = {}
-        try:
-            fn = os.path.join(plugin_folder, name + ".py")
-            with open(fn) as f:
-                code = compile(f.read(), fn, "exec")
-                eval(code, ns, ns)
-            return ns["plugins"]
-        except FileNotFoundError:
-            try:
-                fn = os.path.join(custom_folder, name + ".py")
-                with open(fn) as f:
-                    code = compile(f.read(), fn, "exec")
-                    eval(code, ns, ns)
-                return ns["plugins"]
-            except FileNotFoundError:
-                logger.warning("plugin does not exist.")
+        plugin = plugin_manifest.load().get(name)
+        if plugin is None:
+            logger.warning("plugin does not exist.")
+            return None
+        return load_plugin(name, plugin["path"])
+
+    def format_commands(self, ctx, formatter):
+        """List plugins with help from the manifest without loading them."""
+        rows = [(name, plugin["help"]) for name, plugin in sorted(plugin_manifest.load().items())]
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx, incomplete):
+        """Complete plugin names with help from the manifest without loading them."""
+        from click.shell_completion import CompletionItem
+
+        # completes options of the plugins group itself
+        results = click.Command.shell_complete(self, ctx, incomplete)
+        results.extend(
+            CompletionItem(name, help=plugin["help"])
+            for name, plugin in sorted(plugin_manifest.load().items())
+            if name.startswith(incomplete)
+        )
+        return results
@@ -10,7 +10,10 @@ import copy
 import logging
 import re
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
 from json import loads
+from typing import List
 
 import click
 from component_registry_bindings.bindings.python_client.api.v1 import v1_components_list
@@ -30,6 +33,7 @@ from griffon.autocomplete import (
     get_product_stream_ofuris,
     get_product_version_names,
 )
+from griffon.commands import LazyChoice
 from griffon.commands.custom_commands import GroupArgument, GroupOption
 from griffon.commands.entities.corgi import (
     get_component_manifest,
@@ -45,14 +49,18 @@ from griffon.commands.reports import (
 )
 from griffon.helpers import Style
 from griffon.output import (
+    OUTPUT_FORMAT,
     console,
     cprint,
+    cprint_batch,
+    cprint_unsorted,
     generate_affects,
     generate_normalised_results,
     generate_result_tree,
     raw_json_transform,
 )
 from griffon.services import QueryService, core_queries  # , exp
+from griffon.timings import timed
 
 logger = logging.getLogger("griffon")
 
@@ -167,6 +175,80 @@ def retrieve_component_summary(ctx, component_name, strict_name_search):
     ctx.invoke(get_component_summary, **cond)
 
 
+def batch_file_names(batch_file) -> List[str]:
+    """component names (or purls) of batch file, blank and # comment lines are skipped"""
+    names = (line.strip() for line in batch_file)
+    return [name for name in names if name and not name.startswith("#")]
+
+
+@timed("service")
+def search_middleware(middleware_cli: str, component_name, strict_name_search) -> list:
+    """components of deptopia middleware builds of component_name"""
+    results = []
+    # Use split for users who runs middleware via python
+    mw_command = [
+        *middleware_cli.split(),
+        re.escape(component_name),
+        "-e",
+        "maven",
+        "-b",
+        "maven",
+        "--json",
+    ]
+    if strict_name_search:
+        mw_command.append("-s")
+    proc = subprocess.run(
+        mw_command,
+        capture_output=True,
+        text=True,
+    )
+    try:
+        mw_json = loads(proc.stdout)
+        mw_components = mw_json["deps"]
+        # TODO: need to determine if we use "build" or "deps"
+        # if search_all:
+        #     mw_components.extend(mw_json["deps"])
+        for build in mw_components:
+            component = {
+                "product_versions": [{"name": build["ps_module"]}],
+                "product_streams": [
+                    {
+                        "name": build["ps_update_stream"],
+                        "product_versions": [{"name": build["ps_module"]}],
+                        "active": True,  # assume all product streams as active
+                    }
+                ],
+                "product_active": True,
+                "type": build["build_type"],
+                "name": build["build_name"],
+                "nvr": build["build_nvr"],
+                "upstreams": [],
+                "sources": [],
+                "software_build": {
+                    "build_id": build["build_id"],
+                    "source": build["build_repo"],
+                },
+            }
+            if "sources" in build:
+                for deps in build["sources"]:
+                    for dep in deps["dependencies"]:
+                        components = []
+                        components.append(
+                            {
+                                "name": dep.get("name"),
+                                "nvr": dep.get("nvr"),
+                                "type": dep.get("ecosystem"),
+                                "version": dep.get("version"),
+                                "arch": dep.get("arch"),
+                            }
+                        )
+                        component["sources"] = components
+            results.append(component)
+    except Exception:
+        logger.warning("problem accessing deptopia.")
+    return results
+
+
 @queries_grp.command(
     name="products-contain-component",
     help="List Products containing Component.",
@@ -175,25 +257,35 @@ def retrieve_component_summary(ctx, component_name, strict_name_search):
     "component_name",
     cls=GroupArgument,
     required=False,
-    required_group=["component_name", "purl"],
-    mutually_exclusive_group=["purl"],
+    required_group=["component_name", "purl", "batch_file"],
+    mutually_exclusive_group=["purl", "batch_file"],
 )
 @click.option(
     "--purl",
     cls=GroupOption,
     help="Component purl, needs to be in quotes (ex. 'pkg:rpm/python-pyjwt@1.7.1')",
-    required_group=["component_name", "purl"],
-    mutually_exclusive_group=["component_name"],
+    required_group=["component_name", "purl", "batch_file"],
+    mutually_exclusive_group=["component_name", "batch_file"],
 )
 @click.option(
-    "--arch",
-    default="src",
-    type=click.Choice(CorgiService.get_component_arches()),
+    "--batch-file",
+    "batch_file",
+    cls=GroupOption,
+    type=click.File("r"),
+    help=(
+        "Search all Component names (or purls) listed in file, one per line "
+        "(use - to read from stdin)"
+    ),
+    required_group=["component_name", "purl", "batch_file"],
+    mutually_exclusive_group=["component_name", "purl"],
 )
 @click.option(
-    "--namespace", default=None, type=click.Choice(CorgiService.get_component_namespaces())
+    "--arch",
+    default="src",
+    type=LazyChoice(CorgiService.get_component_arches),
 )
-@click.option("--type", "component_type", type=click.Choice(CorgiService.get_component_types()))
+@click.option("--namespace", default=None, type=LazyChoice(CorgiService.get_component_namespaces))
+@click.option("--type", "component_type", type=LazyChoice(CorgiService.get_component_types))
 @click.option(
     "-s",
     "strict_name_search",
@@ -330,7 +422,7 @@ def retrieve_component_summary(ctx, component_name, strict_name_search):
 @click.option(
     "--output-type-filter",
     "output_type_filter",
-    type=click.Choice(CorgiService.get_component_types()),
+    type=LazyChoice(CorgiService.get_component_types),
     default=None,
     help="Filter components by type from output.",
 )
@@ -373,12 +465,22 @@ def retrieve_component_summary(ctx, component_name, strict_name_search):
         "based on following rules: rhel/rhel-br redundancy"
     ),
 )
+@click.option(
+    "--unsorted-fast",
+    "unsorted_fast",
+    cls=GroupOption,
+    is_flag=True,
+    default=False,
+    help="Print (text) results of each search as soon as it completes, unsorted across searches",
+    mutually_exclusive_group=["purl", "batch_file", "affect_mode", "sfm2_flaw_id"],
+)
 @click.pass_context
 @progress_bar(is_updatable=True)
 def get_product_contain_component(
     ctx,
     component_name,
     purl,
+    batch_file,
     arch,
     namespace,
     component_type,
@@ -407,6 +509,7 @@ def get_product_contain_component(
     include_container_roots,
     exclude_unreleased,
     deduplicate,
+    unsorted_fast,
 ):
     # with console_status(ctx) as operation_status:
     """List products of a latest component."""
@@ -425,13 +528,32 @@ def get_product_contain_component(
     ):
         ctx.params["search_provides"] = True
 
+    # file object cannot be deep copied
+    ctx.params.pop("batch_file")
     params = copy.deepcopy(ctx.params)
     params.pop("verbose")
     params.pop("sfm2_flaw_id")
     params.pop("flaw_mode")
     params.pop("affect_mode")
     params.pop("deduplicate")
-    if component_name:
+    params.pop("unsorted_fast")
+    if unsorted_fast and ctx.obj["FORMAT"] != OUTPUT_FORMAT.TEXT.value:
+        raise click.UsageError("--unsorted-fast applies to text output only.")
+    if batch_file:
+        # sessions, cache and worker pool are shared by searches of all names
+        params["component_names"] = batch_file_names(batch_file)
+        q = query_service.invoke(
+            core_queries.products_containing_component_query, params, status=operation_status
+        )
+        cprint_batch(q, ctx=ctx)
+        return
+    if component_name and unsorted_fast:
+        # searches run while middleware is searched, its results are rendered last
+        searches = query_service.stream(
+            core_queries.products_containing_component_query, params, status=operation_status
+        )
+        q = []
+    elif component_name:
         q = query_service.invoke(
             core_queries.products_containing_component_query, params, status=operation_status
         )
@@ -443,71 +565,22 @@ def get_product_contain_component(
         )
 
     # TODO: interim hack for middleware
+    middleware_searches: List[Future] = []
     if component_name and MIDDLEWARE_CLI and not no_middleware:
         operation_status.update("searching deptopia middleware.")
         ctx.obj["MIDDLEWARE_CLI"] = MIDDLEWARE_CLI
-
-        # Use split for users who runs middleware via python
-        mw_command = [
-            *MIDDLEWARE_CLI.split(),
-            re.escape(component_name),
-            "-e",
-            "maven",
-            "-b",
-            "maven",
-            "--json",
-        ]
-        if strict_name_search:
-            mw_command.append("-s")
-        proc = subprocess.run(
-            mw_command,
-            capture_output=True,
-            text=True,
-        )
-        try:
-            mw_json = loads(proc.stdout)
-            mw_components = mw_json["deps"]
-            # TODO: need to determine if we use "build" or "deps"
-            # if search_all:
-            #     mw_components.extend(mw_json["deps"])
-            for build in mw_components:
-                component = {
-                    "product_versions": [{"name": build["ps_module"]}],
-                    "product_streams": [
-                        {
-                            "name": build["ps_update_stream"],
-                            "product_versions": [{"name": build["ps_module"]}],
-                            "active": True,  # assume all product streams as active
-                        }
-                    ],
-                    "product_active": True,
-                    "type": build["build_type"],
-                    "name": build["build_name"],
-                    "nvr": build["build_nvr"],
-                    "upstreams": [],
-                    "sources": [],
-                    "software_build": {
-                        "build_id": build["build_id"],
-                        "source": build["build_repo"],
-                    },
-                }
-                if "sources" in build:
-                    for deps in build["sources"]:
-                        for dep in deps["dependencies"]:
-                            components = []
-                            components.append(
-                                {
-                                    "name": dep.get("name"),
-                                    "nvr": dep.get("nvr"),
-                                    "type": dep.get("ecosystem"),
-                                    "version": dep.get("version"),
-                                    "arch": dep.get("arch"),
-                                }
-                            )
-                            component["sources"] = components
-                q.append(component)
-        except Exception:
-            logger.warning("problem accessing deptopia.")
+        if unsorted_fast:
+            # middleware is searched while the searches are rendered, its results
+            # are rendered last
+            middleware_pool = ThreadPoolExecutor(max_workers=1)
+            middleware_searches.append(
+                middleware_pool.submit(
+                    search_middleware, MIDDLEWARE_CLI, component_name, strict_name_search
+                )
+            )
+            middleware_pool.shutdown(wait=False)
+        else:
+            q.extend(search_middleware(MIDDLEWARE_CLI, component_name, strict_name_search))
 
     # TODO: in the short term affect handling will be mediated via sfm2 here in the operation itself # noqa
     if ctx.params["sfm2_flaw_id"]:
@@ -643,6 +716,10 @@ def get_product_contain_component(
 
         ctx.exit()
 
+    if unsorted_fast:
+        cprint_unsorted(
+            chain(searches, (search.result() for search in middleware_searches)), ctx=ctx
+        )
     cprint(q, ctx=ctx)
 
 
@@ -663,15 +740,15 @@ def get_product_contain_component(
     required_group=["component_name", "purl"],
     mutually_exclusive_group=["component_name"],
 )
-@click.option("--type", "component_type", type=click.Choice(CorgiService.get_component_types()))
+@click.option("--type", "component_type", type=LazyChoice(CorgiService.get_component_types))
 @click.option("--version", "component_version")
 @click.option(
     "--arch",
     "component_arch",
-    type=click.Choice(CorgiService.get_component_arches()),
+    type=LazyChoice(CorgiService.get_component_arches),
     help="Default arch=src.",
 )
-@click.option("--namespace", type=click.Choice(CorgiService.get_component_namespaces()))
+@click.option("--namespace", type=LazyChoice(CorgiService.get_component_namespaces))
 @click.option(
     "-s",
     "strict_name_search",
@@ -795,7 +872,7 @@ def get_product_manifest_query(ctx, product_stream_name, ofuri, spdx_json_format
     entity="Component",
     endpoint_module=v1_components_list,
     options_overrides={
-        "include_fields": {"type": click.Choice(CorgiService.get_fields(Component))},
+        "include_fields": {"type": LazyChoice(CorgiService.get_fields, Component)},
     },
 )
 @click.option(
@@ -879,29 +956,29 @@ def retrieve_component_manifest(ctx, component_uuid, purl, spdx_json_format, ope
 @click.option(
     "--affectedness",
     help="Filter by Affect affectedness.",
-    type=click.Choice(OSIDBService.get_affect_affectedness()),
+    type=LazyChoice(OSIDBService.get_affect_affectedness),
 )
 @click.option(
     "--resolution",
     "affect_resolution",
     help="Filter by Affect resolution.",
-    type=click.Choice(OSIDBService.get_affect_resolution()),
+    type=LazyChoice(OSIDBService.get_affect_resolution),
 )
 @click.option(
     "--impact",
     "affect_impact",
     help="Filter by Affect impact.",
-    type=click.Choice(OSIDBService.get_affect_impact()),
+    type=LazyChoice(OSIDBService.get_affect_impact),
 )
 @click.option(
     "--type",
     "component_type",
-    type=click.Choice(CorgiService.get_component_types()),
+    type=LazyChoice(CorgiService.get_component_types),
     help="Filter by Component type.",
 )
 @click.option(
     "--namespace",
-    type=click.Choice(CorgiService.get_component_namespaces()),
+    type=LazyChoice(CorgiService.get_component_namespaces),
     help="filter by Component namespace.",
 )
 @click.pass_context
@@ -953,30 +1030,30 @@ def product_versions_affected_by_cve_query(ctx, cve_id):
     "--flaw-impact",
     "flaw_impact",
     help="Filter by Flaw impact.",
-    type=click.Choice(OSIDBService.get_flaw_impacts()),
+    type=LazyChoice(OSIDBService.get_flaw_impacts),
 )
 @click.option(
     "--flaw-resolution",
     "flaw_resolution",
     help="Filter by Flaw resolution.",
-    type=click.Choice(OSIDBService.get_flaw_resolutions()),
+    type=LazyChoice(OSIDBService.get_flaw_resolutions),
 )
 @click.option(
     "--affectedness",
     help="Filter by Affect affectedness.",
-    type=click.Choice(OSIDBService.get_affect_affectedness()),
+    type=LazyChoice(OSIDBService.get_affect_affectedness),
 )
 @click.option(
     "--affect-resolution",
     "affect_resolution",
     help="Filter by Affect resolution.",
-    type=click.Choice(OSIDBService.get_affect_resolution()),
+    type=LazyChoice(OSIDBService.get_affect_resolution),
 )
 @click.option(
     "--affect-impact",
     "affect_impact",
     help="Filter by Affect impact.",
-    type=click.Choice(OSIDBService.get_affect_impact()),
+    type=LazyChoice(OSIDBService.get_affect_impact),
 )
 @click.option(
     "-s",
@@ -1026,30 +1103,30 @@ def cves_for_specific_component_query(
     "--flaw-impact",
     "flaw_impact",
     help="Filter by Flaw impact.",
-    type=click.Choice(OSIDBService.get_flaw_impacts()),
+    type=LazyChoice(OSIDBService.get_flaw_impacts),
 )
 @click.option(
     "--flaw-resolution",
     "flaw_resolution",
     help="Filter by Flaw resolution.",
-    type=click.Choice(OSIDBService.get_flaw_resolutions()),
+    type=LazyChoice(OSIDBService.get_flaw_resolutions),
 )
 @click.option(
     "--affectedness",
     help="Filter by Affect affectedness.",
-    type=click.Choice(OSIDBService.get_affect_affectedness()),
+    type=LazyChoice(OSIDBService.get_affect_affectedness),
 )
 @click.option(
     "--affect-resolution",
     "affect_resolution",
     help="Filter by Affect resolution.",
-    type=click.Choice(OSIDBService.get_affect_resolution()),
+    type=LazyChoice(OSIDBService.get_affect_resolution),
 )
 @click.option(
     "--affect-impact",
     "affect_impact",
     help="Filter by Affect impact.",
-    type=click.Choice(OSIDBService.get_affect_impact()),
+    type=LazyChoice(OSIDBService.get_affect_impact),
 )
 @click.option(
     "-s",
@@ -6,14 +6,14 @@ import logging
 
 import click
 
-from griffon import progress_bar
+from griffon import get_max_workers, progress_bar
 from griffon.autocomplete import (
     get_component_names,
     get_component_purls,
     get_product_stream_names,
     get_product_stream_ofuris,
 )
-from griffon.output import cprint
+from griffon.output import OUTPUT_FORMAT, cprint, json_items_print
 from griffon.services import ReportService, core_reports
 
 logger = logging.getLogger("griffon")
@@ -82,12 +82,23 @@ def generate_entity_report(ctx, all):
 @click.option(
     "--exclude_children", is_flag=True, default=False, help="Exclude children Component licenses."
 )
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=get_max_workers,
+    show_default="max_workers from .griffonrc",
+    help="Number of components whose children are retrieved concurrently.",
+)
 @click.pass_context
 @progress_bar()
-def generate_license_report(ctx, product_stream_name, purl, exclude_children):
+def generate_license_report(ctx, product_stream_name, purl, exclude_children, max_workers):
     """A report operation"""
     if not product_stream_name and not purl:
         click.echo(ctx.get_help())
         exit(0)
-    ctx.obj["FORMAT"] = "json"
-    cprint(report_service.invoke(core_reports.license_report, ctx.params), ctx=ctx)
+    # records of root components are printed as they are completed
+    records = report_service.stream(core_reports.license_report, ctx.params)
+    if ctx.obj["FORMAT"] == OUTPUT_FORMAT.JSONL.value:
+        cprint(({"purl": purl, **record} for purl, record in records), ctx=ctx)
+    else:
+        json_items_print(records)
@@ -2,27 +2,42 @@
 Helpers for direct usage or debbuging
 """
 
+import gzip
 import json
 import re
 from enum import Enum
-from typing import Callable, Optional, Type, Union
+from typing import TYPE_CHECKING, Callable, Optional, Type, Union
 
-from component_registry_bindings.bindings.python_client.types import (
-    ComponentRegistryModel,
-)
-from osidb_bindings.bindings.python_client.types import OSIDBModel
+# bindings are imported lazily, see griffon/__init__.py
+if TYPE_CHECKING:
+    from component_registry_bindings.bindings.python_client.types import (
+        ComponentRegistryModel,
+    )
+    from osidb_bindings.bindings.python_client.types import OSIDBModel
+
+
+def open_data_file(filename: str, mode: str = "r"):
+    """open data file in text mode, gzip compressed if filename ends with .gz"""
+    if filename.endswith(".gz"):
+        return gzip.open(filename, f"{mode}t", encoding="utf-8")
+    return open(filename, mode)
 
 
 def debug_data_dump(filename: str, data, transform_fn: Optional[Callable] = None):
     """
     Debugging utility to avoid heavy HTTP data transfers.
     Serializes the data into JSON and dumps that into a
-    specified file.
+    specified file (gzip compressed if filename ends with .gz).
 
     transform function can be used for postprocessing the data after
     the basic dict serialization
 
     """
+    from component_registry_bindings.bindings.python_client.types import (
+        ComponentRegistryModel,
+    )
+    from osidb_bindings.bindings.python_client.types import OSIDBModel
+
     if isinstance(data, list):
         json_data = [
             item.to_dict() if isinstance(item, (ComponentRegistryModel, OSIDBModel)) else item
@@ -35,24 +50,24 @@ def debug_data_dump(filename: str, data, transform_fn: Optional[Callable] = None
     else:
         json_data = data
 
-    with open(filename, "w") as fp:
+    with open_data_file(filename, "w") as fp:
         json.dump(json_data, fp)
 
 
 def debug_data_load(
     filename: str,
-    model: Optional[Union[Type[ComponentRegistryModel], Type[OSIDBModel]]] = None,
+    model: Optional[Union[Type["ComponentRegistryModel"], Type["OSIDBModel"]]] = None,
     transform_fn: Optional[Callable] = None,
 ):
     """
     Debugging utility to avoid heavy HTTP data transfers.
-    Loads the data from specified JSON file and transforms them
-    back into internal models.
+    Loads the data from specified JSON file (gzip compressed if
+    filename ends with .gz) and transforms them back into internal models.
 
     transform function can be used for preprocessing the data before
     the internal model transformation
     """
-    with open(filename) as fp:
+    with open_data_file(filename) as fp:
         json_data = json.load(fp)
 
     if isinstance(json_data, list):
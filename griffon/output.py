@@ -7,17 +7,16 @@ import enum
 import json
 import logging
 import re
+from typing import Iterator
 
 import click
-from component_registry_bindings.bindings.python_client.types import (
-    ComponentRegistryModel,
-)
 from packageurl import PackageURL
 from rich.console import Console
 from rich.text import Text
 from rich.tree import Tree
 
 from .helpers import natural_sort_key
+from .timings import timed
 
 console = Console(color_system="auto")
 
@@ -28,6 +27,7 @@ class OUTPUT_FORMAT(enum.Enum):
     JSON = "json"
     TEXT = "text"
     TABLE = "table"
+    JSONL = "jsonl"
 
 
 class DEST(enum.Enum):
@@ -41,6 +41,10 @@ def raw_json_transform_related(data: dict, name):
     related_data = data.get(name)
     if related_data is not None:
         if isinstance(related_data, list):
+            from component_registry_bindings.bindings.python_client.types import (
+                ComponentRegistryModel,
+            )
+
             transformed = [
                 item.to_dict() if isinstance(item, ComponentRegistryModel) else item
                 for item in related_data
@@ -49,18 +53,19 @@ def raw_json_transform_related(data: dict, name):
     return transformed
 
 
+def raw_json_transform_item(item) -> dict:
+    """normalise single list item to dict"""
+    transformed = item if type(item) is dict else item.to_dict()
+    for related_data in ("upstreams", "sources", "provides"):
+        if related_data in transformed:
+            transformed[related_data] = raw_json_transform_related(transformed, related_data)
+    return transformed
+
+
 def raw_json_transform(data, show_count: bool) -> dict:
     """normalise all data to dict"""
     if type(data) is list:
-        results = []
-        for item in data:
-            transformed = item if type(item) is dict else item.to_dict()
-            for related_data in ("upstreams", "sources", "provides"):
-                if related_data in transformed:
-                    transformed[related_data] = raw_json_transform_related(
-                        transformed, related_data
-                    )
-            results.append(transformed)
+        results = [raw_json_transform_item(item) for item in data]
         output = {
             "results": results,
         }
@@ -182,25 +187,67 @@ def text_output_product_summary(ctx, output, format, exclude_products, no_wrap=F
     ctx.exit()
 
 
-def process_excludes_condition(
-    exclude_products,
-    ps_exclude_components,
-    exclude_components,
-    ps_version_name,
-    component_name,
-    include_product_stream_excluded_components,
-):
-    # .griffonrc defined exclude product streams
-    if not any([re.search(match, ps_version_name) for match in exclude_products]):
+def compile_patterns(patterns):
+    """combine patterns into single alternation regex, None if there are no patterns"""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+class ExcludeMatcher:
+    """
+    .griffonrc exclude patterns compiled once per output
+
+    each pattern list is combined into one regex and verdicts are memoized per
+    product stream excluded components, product version and component name
+    """
+
+    def __init__(self, exclude_products, exclude_components):
+        self.exclude_products = compile_patterns(exclude_products)
+        self.exclude_components = compile_patterns(exclude_components)
+        self.ps_exclude_components = {}
+        self.verdicts = {}
+
+    def is_included(
+        self,
+        ps_exclude_components,
+        ps_version_name,
+        component_name,
+        include_product_stream_excluded_components,
+    ) -> bool:
+        key = (
+            tuple(ps_exclude_components),
+            ps_version_name,
+            component_name,
+            include_product_stream_excluded_components,
+        )
+        if key not in self.verdicts:
+            self.verdicts[key] = self.match(*key)
+        return self.verdicts[key]
+
+    def match(
+        self,
+        ps_exclude_components,
+        ps_version_name,
+        component_name,
+        include_product_stream_excluded_components,
+    ) -> bool:
+        # .griffonrc defined exclude product streams
+        if self.exclude_products and self.exclude_products.search(ps_version_name):
+            return False
         # product stream defined exclude components
-        if (
-            not any([re.search(match, component_name) for match in ps_exclude_components])
-            or include_product_stream_excluded_components
-        ):
-            # .griffonrc defined exclude components
-            if not any([re.search(match, component_name) for match in exclude_components]):
-                return True
-        return False
+        if not include_product_stream_excluded_components:
+            if ps_exclude_components not in self.ps_exclude_components:
+                self.ps_exclude_components[ps_exclude_components] = compile_patterns(
+                    ps_exclude_components
+                )
+            ps_excludes = self.ps_exclude_components[ps_exclude_components]
+            if ps_excludes and ps_excludes.search(component_name):
+                return False
+        # .griffonrc defined exclude components
+        if self.exclude_components and self.exclude_components.search(component_name):
+            return False
+        return True
 
 
 def generate_normalised_results(
@@ -210,7 +257,10 @@ def generate_normalised_results(
     output_type_filter,
     include_inactive_product_streams,
     include_product_stream_excluded_components,
+    exclude_matcher=None,
 ):
+    if exclude_matcher is None:
+        exclude_matcher = ExcludeMatcher(exclude_products, exclude_components)
     normalised_results = list()
     if "results" in output:
         # ensure unique result set
@@ -229,10 +279,8 @@ def generate_normalised_results(
             for ps in item["product_streams"]:
                 # only include component from active product stream
                 if ps.get("active") or include_inactive_product_streams:
-                    if process_excludes_condition(
-                        exclude_products,
+                    if exclude_matcher.is_included(
                         ps.get("exclude_components", []),
-                        exclude_components,
                         ps["product_versions"][0]["name"],
                         item["name"],
                         include_product_stream_excluded_components,
@@ -258,10 +306,8 @@ def generate_normalised_results(
                         if "sources" in item:
                             sources = []
                             for source in item.get("sources"):
-                                if process_excludes_condition(
-                                    exclude_products,
+                                if exclude_matcher.is_included(
                                     ps.get("exclude_components", []),
-                                    exclude_components,
                                     ps["product_versions"][0]["name"],
                                     source["name"],
                                     include_product_stream_excluded_components,
@@ -272,10 +318,8 @@ def generate_normalised_results(
                         if "upstreams" in item:
                             upstreams = []
                             for upstream in item.get("upstreams"):
-                                if process_excludes_condition(
-                                    exclude_products,
+                                if exclude_matcher.is_included(
                                     ps.get("exclude_components", []),
-                                    exclude_components,
                                     ps["product_versions"][0]["name"],
                                     upstream["name"],
                                     include_product_stream_excluded_components,
@@ -286,10 +330,8 @@ def generate_normalised_results(
                         if "provides" in item:
                             provides = []
                             for provide in item.get("provides"):
-                                if process_excludes_condition(
-                                    exclude_products,
+                                if exclude_matcher.is_included(
                                     ps.get("exclude_components", []),
-                                    exclude_components,
                                     ps["product_versions"][0]["name"],
                                     provide["name"],
                                     include_product_stream_excluded_components,
@@ -306,44 +348,26 @@ def generate_normalised_results(
 
 
 def generate_result_tree(normalised_results):
-    product_versions = sorted(list(set([item["product_version"] for item in normalised_results])))
+    """
+    group normalised results into product version -> product stream -> component name -> nvr
+
+    results are indexed in a single pass and sorted once at the end, note that
+    component names of a product stream are collected across all product versions
+    """
+    product_versions = {}
+    product_streams = {}
+    for item in normalised_results:
+        product_versions.setdefault(item["product_version"], set()).add(item["product_stream"])
+        components = product_streams.setdefault(item["product_stream"], {})
+        components.setdefault(item["name"], {})[item["nvr"]] = item
+
     result_tree = {}
-    for pv in product_versions:
+    for pv in sorted(product_versions):
         result_tree[pv] = {}
-        product_streams = sorted(
-            list(
-                set(
-                    [
-                        item["product_stream"]
-                        for item in normalised_results
-                        if item["product_version"] == pv
-                    ]
-                )
-            )
-        )
-        for ps in product_streams:
+        for ps in sorted(product_versions[pv]):
             result_tree[pv][ps] = {}
-            component_names = sorted(
-                list(
-                    set(
-                        [
-                            item["name"]
-                            for item in normalised_results
-                            if item["product_stream"] == ps
-                        ]
-                    )
-                )
-            )
-            for cn in component_names:
-                result_tree[pv][ps][cn] = {}
-                nvrs = [
-                    item
-                    for item in normalised_results
-                    if item["product_stream"] == ps and item["name"] == cn
-                ]
-
-                for nvr in nvrs:
-                    result_tree[pv][ps][cn][nvr["nvr"]] = nvr
+            for cn in sorted(product_streams[ps]):
+                result_tree[pv][ps][cn] = dict(product_streams[ps][cn])
     return result_tree
 
 
@@ -458,6 +482,9 @@ def text_output_products_contain_component(
     exclude_products,
     exclude_components,
     no_wrap=False,
+    exclude_matcher=None,
+    search_component_name=None,
+    exit_after=True,
 ):
     # handle single component
     if ctx.params["purl"]:
@@ -469,7 +496,8 @@ def text_output_products_contain_component(
             )
         ctx.exit()
 
-    search_component_name = ctx.params["component_name"]
+    if search_component_name is None:
+        search_component_name = ctx.params["component_name"]
 
     # handle multiple components
     if "results" in output and output["count"] > 0:
@@ -483,6 +511,7 @@ def text_output_products_contain_component(
             ctx.params["output_type_filter"],
             ctx.params["include_inactive_product_streams"],
             ctx.params["include_product_stream_excluded_components"],
+            exclude_matcher=exclude_matcher,
         )
         result_tree = generate_result_tree(normalised_results)
 
@@ -1114,7 +1143,91 @@ def text_output_products_contain_component(
                                     no_wrap=no_wrap,
                                 )
 
-        ctx.exit()
+        if exit_after:
+            ctx.exit()
+
+
+def text_output_products_contain_component_unsorted(
+    ctx,
+    batches,
+    exclude_products,
+    exclude_components,
+    no_wrap=False,
+    exclude_matcher=None,
+):
+    """
+    render products-contain-component results of each search as soon as it completes,
+    results are only sorted within each search
+
+    product streams of components already rendered are skipped, rhel-br product streams
+    are held back until all searches complete so they are deduplicated against rhel ones
+    """
+    deduplicate = ctx.params["deduplicate"]
+    seen = set()  # (component purl or nvr, product stream)
+    rendered = set()  # (product version, product stream, component name)
+    held = []
+
+    @timed("render")
+    def render(results):
+        text_output_products_contain_component(
+            ctx,
+            {"results": results, "count": len(results)},
+            exclude_products,
+            exclude_components,
+            no_wrap=no_wrap,
+            exclude_matcher=exclude_matcher,
+            exit_after=False,
+        )
+        normalised_results = generate_normalised_results(
+            {"results": results},
+            exclude_products,
+            exclude_components,
+            ctx.params["output_type_filter"],
+            ctx.params["include_inactive_product_streams"],
+            ctx.params["include_product_stream_excluded_components"],
+            exclude_matcher=exclude_matcher,
+        )
+        rendered.update(
+            (item["product_version"], item["product_stream"], item["name"])
+            for item in normalised_results
+        )
+
+    for batch in batches:
+        ready = []
+        for component in raw_json_transform(batch, True)["results"]:
+            key = component["purl"] if "purl" in component else component["nvr"]
+            streams, held_streams = [], []
+            for ps in component["product_streams"]:
+                if (key, ps.get("name")) in seen:
+                    continue
+                seen.add((key, ps.get("name")))
+                if deduplicate and ps["product_versions"][0]["name"].startswith("rhel-br"):
+                    held_streams.append(ps)
+                else:
+                    streams.append(ps)
+            if streams:
+                ready.append({**component, "product_streams": streams})
+            if held_streams:
+                held.append({**component, "product_streams": held_streams})
+        if ready:
+            render(ready)
+
+    results = []
+    for component in held:
+        streams = [
+            ps
+            for ps in component["product_streams"]
+            if (
+                ps["product_versions"][0]["name"].replace("rhel-br", "rhel"),
+                ps.get("name", "").replace("rhel-br", "rhel"),
+                component["name"],
+            )
+            not in rendered
+        ]
+        if streams:
+            results.append({**component, "product_streams": streams})
+    if results:
+        render(results)
 
 
 def text_output_components_contain_component(
@@ -1527,6 +1640,25 @@ def text_output_generic(ctx, output, format, no_wrap=False):
         console.print(key_name, " : ", v, no_wrap=no_wrap)
 
 
+def jsonl_print(data):
+    """print each item as a single line of json, bypassing rich formatting"""
+    for item in data:
+        click.echo(json.dumps(raw_json_transform_item(item)))
+
+
+@timed("render")
+def json_items_print(items):
+    """print (key, value) items as a single json object as they come, bypassing rich formatting"""
+    separator = "{"
+    for key, value in items:
+        # strip braces of the single item object, keeping its indentation
+        item = json.dumps({key: value}, indent=2)[2:-2]
+        click.echo(f"{separator}\n{item}", nl=False)
+        separator = ","
+    click.echo("{}" if separator == "{" else "\n}")
+
+
+@timed("render")
 def cprint(
     data,
     dest=DEST.CONSOLE,
@@ -1537,6 +1669,17 @@ def cprint(
     """handle format and output"""
     from griffon import get_config_option
 
+    format = OUTPUT_FORMAT.JSON
+    if ctx and "FORMAT" in ctx.obj:
+        format = OUTPUT_FORMAT(ctx.obj["FORMAT"])
+
+    if isinstance(data, Iterator):
+        # stream results one per line as they are retrieved
+        if format is OUTPUT_FORMAT.JSONL:
+            jsonl_print(data)
+            exit(0)
+        data = list(data)
+
     exclude_products = []
     if get_config_option(ctx.obj["PROFILE"], "exclude"):
         exclude_products = get_config_option(ctx.obj["PROFILE"], "exclude").split("\n")
@@ -1546,13 +1689,11 @@ def cprint(
     if get_config_option(ctx.obj["PROFILE"], "exclude_components"):
         exclude_components = get_config_option(ctx.obj["PROFILE"], "exclude_components").split("\n")
     logger.debug(f"exclude_components = {exclude_components}")
+    exclude_matcher = ExcludeMatcher(exclude_products, exclude_components)
 
     output = raw_json_transform(data, show_count)
     if ctx and ctx.obj["NO_COLOR"]:
         console.no_color = True
-    format = OUTPUT_FORMAT.JSON
-    if ctx and "FORMAT" in ctx.obj:
-        format = OUTPUT_FORMAT(ctx.obj["FORMAT"])
     if format is OUTPUT_FORMAT.TEXT:
         no_wrap = ctx.obj["NO_WRAP"]
         terminal_width = ctx.obj["TERMINAL_WIDTH"]
@@ -1566,6 +1707,7 @@ def cprint(
                 exclude_products,
                 exclude_components,
                 no_wrap=no_wrap,
+                exclude_matcher=exclude_matcher,
             )
         if ctx.info_name == "components-contain-component":
             text_output_components_contain_component(
@@ -1599,6 +1741,10 @@ def cprint(
         if dest is DEST.CONSOLE:
             console.print_json(json.dumps(output))
 
+    if format is OUTPUT_FORMAT.JSONL:
+        if dest is DEST.CONSOLE:
+            jsonl_print(output["results"] if type(data) is list else [output])
+
     # if we instructed to open browser, open that up now
     if ctx:
         if "link" in data and "open_browser" in ctx.obj:
@@ -1606,3 +1752,70 @@ def cprint(
                 click.launch(data["link"])
 
     exit(0)
+
+
+@timed("render")
+def cprint_batch(data: dict, ctx=None):
+    """handle format and output of products-contain-component results keyed by search name"""
+    from griffon import get_config_option
+
+    format = OUTPUT_FORMAT(ctx.obj["FORMAT"])
+    outputs = {name: raw_json_transform(results, True) for name, results in data.items()}
+
+    if format is OUTPUT_FORMAT.TEXT:
+        exclude_products = []
+        if get_config_option(ctx.obj["PROFILE"], "exclude"):
+            exclude_products = get_config_option(ctx.obj["PROFILE"], "exclude").split("\n")
+        exclude_components = []
+        if get_config_option(ctx.obj["PROFILE"], "exclude_components"):
+            exclude_components = get_config_option(ctx.obj["PROFILE"], "exclude_components").split(
+                "\n"
+            )
+        exclude_matcher = ExcludeMatcher(exclude_products, exclude_components)
+        if ctx.obj["NO_COLOR"]:
+            console.no_color = True
+        console.width = int(ctx.obj["TERMINAL_WIDTH"])
+        for name, output in outputs.items():
+            console.print(Text(name, style="bold u"), no_wrap=ctx.obj["NO_WRAP"])
+            if output["count"] == 0:
+                console.print("No results found.")
+                continue
+            text_output_products_contain_component(
+                ctx,
+                output,
+                exclude_products,
+                exclude_components,
+                no_wrap=ctx.obj["NO_WRAP"],
+                exclude_matcher=exclude_matcher,
+                search_component_name=name,
+                exit_after=False,
+            )
+    elif format is OUTPUT_FORMAT.JSONL:
+        jsonl_print({"component_name": name, **output} for name, output in outputs.items())
+    else:
+        console.print_json(json.dumps(outputs))
+    exit(0)
+
+
+def cprint_unsorted(batches: Iterator[list], ctx=None):
+    """handle text output of products-contain-component results streamed by search"""
+    from griffon import get_config_option
+
+    exclude_products = []
+    if get_config_option(ctx.obj["PROFILE"], "exclude"):
+        exclude_products = get_config_option(ctx.obj["PROFILE"], "exclude").split("\n")
+    exclude_components = []
+    if get_config_option(ctx.obj["PROFILE"], "exclude_components"):
+        exclude_components = get_config_option(ctx.obj["PROFILE"], "exclude_components").split("\n")
+    if ctx.obj["NO_COLOR"]:
+        console.no_color = True
+    console.width = int(ctx.obj["TERMINAL_WIDTH"])
+    text_output_products_contain_component_unsorted(
+        ctx,
+        batches,
+        exclude_products,
+        exclude_components,
+        no_wrap=ctx.obj["NO_WRAP"],
+        exclude_matcher=ExcludeMatcher(exclude_products, exclude_components),
+    )
+    exit(0)
@@ -0,0 +1,82 @@
+"""
+    cpu profiling of invoked command
+
+"""
+import cProfile
+import logging
+import pstats
+import sys
+import threading
+from typing import List
+
+from griffon.exceptions import GriffonException
+
+logger = logging.getLogger("griffon")
+
+# output formats rendered by pyinstrument sampling profiler, pstats otherwise
+PYINSTRUMENT_SUFFIXES = (".speedscope.json", ".html")
+
+
+class CpuProfiler:
+    """
+    profiler of the invoked command, profile is written to file once it exits
+
+    deterministic cProfile profiles the main thread as well as all threads started
+    meanwhile (eg. workers of concurrent retrievals) and writes merged pstats,
+    pyinstrument sampling profiler (main thread) is used for speedscope and html
+    output
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.sampling = path.endswith(PYINSTRUMENT_SUFFIXES)
+        self.thread_profiles: List[cProfile.Profile] = []
+        self.lock = threading.Lock()
+
+    def start(self) -> None:
+        if self.sampling:
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                raise GriffonException(
+                    "pyinstrument library not found, cannot write "
+                    f"{' or '.join(PYINSTRUMENT_SUFFIXES)} profile"
+                )
+            self.profiler = Profiler()
+            self.profiler.start()
+        else:
+            self.profiler = cProfile.Profile()
+            # cProfile profiles all threads since python 3.12 (sys.monitoring)
+            if sys.version_info < (3, 12):
+                threading.setprofile(self.profile_thread)
+            self.profiler.enable()
+
+    def profile_thread(self, frame, event, arg) -> None:
+        """profile function of new threads replacing itself by thread profiler"""
+        profile = cProfile.Profile()
+        with self.lock:
+            self.thread_profiles.append(profile)
+        profile.enable()
+
+    def stop(self) -> None:
+        if self.sampling:
+            from pyinstrument.renderers import HTMLRenderer, SpeedscopeRenderer
+
+            self.profiler.stop()
+            renderer = HTMLRenderer() if self.path.endswith(".html") else SpeedscopeRenderer()
+            with open(self.path, "w") as fp:
+                fp.write(self.profiler.output(renderer))
+        else:
+            self.profiler.disable()
+            if sys.version_info < (3, 12):
+                threading.setprofile(None)
+            stats = pstats.Stats(self.profiler)
+            with self.lock:
+                for profile in self.thread_profiles:
+                    try:
+                        stats.add(profile)
+                    except TypeError:
+                        # thread did not call any profiled function
+                        pass
+            stats.dump_stats(self.path)
+        logger.info(f"cpu profile written to {self.path}")
@@ -0,0 +1,135 @@
+"""
+    record and replay of service responses
+
+"""
+import base64
+import logging
+import os
+import threading
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from griffon.cache import CachedSession, ResponseCache
+from griffon.exceptions import GriffonException
+from griffon.helpers import debug_data_dump, debug_data_load
+from griffon.throttling import BoundedAdapter
+
+logger = logging.getLogger("griffon")
+
+# headers describing the raw response which no longer apply to the recorded content
+STRIPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+class ReplayError(GriffonException):
+    """response of request was not recorded"""
+
+    pass
+
+
+class FixtureStore(ResponseCache):
+    """
+    directory of recorded service responses
+
+    while recording every response is fetched from the service and stored, while
+    replaying responses are served from the directory only and missing ones are
+    errors, entries never expire nor are evicted
+    """
+
+    def __init__(self, directory: str, replay: bool = False) -> None:
+        # refresh bypasses other (eg. entity report) caches of service responses
+        super().__init__(directory, refresh=True)
+        self.replay = replay
+        self.session_operations = ("status",)
+
+    def get(self, key: str, resource: str):
+        if not self.replay:
+            raise KeyError(key)
+        try:
+            entry = debug_data_load(self.path(key))
+        except OSError:
+            raise ReplayError(f"{resource} response was not recorded in {self.directory}.")
+        logger.debug(f"replay {resource} {key}")
+        return entry["value"]
+
+    def set(self, key: str, resource: str, value) -> None:
+        if self.replay:
+            return
+        tmp_path = os.path.join(self.directory, f"{key}.{threading.get_ident()}.tmp.gz")
+        debug_data_dump(tmp_path, {"resource": resource, "value": value})
+        os.replace(tmp_path, self.path(key))
+        logger.debug(f"record {resource} {key}")
+
+
+class FixtureAdapter(BoundedAdapter):
+    """http adapter recording responses to (or replaying them from) fixture store"""
+
+    def __init__(self, store: FixtureStore, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.store = store
+
+    def send(self, request, *args, **kwargs):
+        key = ResponseCache.key("http", "http", request.method, request.url, body=request.body)
+        if self.store.replay:
+            return self.build_recorded_response(request, self.store.get(key, "http"))
+        response = super().send(request, *args, **kwargs)
+        self.store.set(
+            key,
+            "http",
+            {
+                "status_code": response.status_code,
+                "headers": {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() not in STRIPPED_HEADERS
+                },
+                "encoding": response.encoding,
+                "content": base64.b64encode(response.content).decode("ascii"),
+            },
+        )
+        return response
+
+    @staticmethod
+    def build_recorded_response(request, recorded: dict) -> Response:
+        response = Response()
+        response.status_code = recorded["status_code"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response.encoding = recorded["encoding"]
+        response._content = base64.b64decode(recorded["content"])
+        response.url = request.url
+        response.request = request
+        return response
+
+
+class ReplayedOperationsGroup:
+    """stand-in of binding session operations group, its responses are only replayed"""
+
+    allowed_operations = ()
+
+    def __init__(self, resource_name: str, binding: str) -> None:
+        self.resource_name = resource_name
+        self.binding = binding
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        raise ReplayError(f"{self.resource_name} {name} responses cannot be replayed.")
+
+
+class ReplaySession(CachedSession):
+    """
+    session proxy replaying recorded responses without creating binding session,
+    which would otherwise authenticate against the service
+    """
+
+    class BindingSession:
+        def __init__(self, binding: str) -> None:
+            self.binding = binding
+
+        def __getattr__(self, name):
+            if name.startswith("__"):
+                raise AttributeError(name)
+            return ReplayedOperationsGroup(name, self.binding)
+
+    def __init__(self, service: str, cache: FixtureStore, binding: str) -> None:
+        super().__init__(self.BindingSession(binding), service, cache)
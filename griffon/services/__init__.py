@@ -4,9 +4,12 @@
 """
 # define interface for query which is asserted by mypy as well as runtime checking
 import logging
+import time
 import typing
 from typing import Any, Dict, List, Protocol, runtime_checkable
 
+from griffon.timings import timings
+
 logger = logging.getLogger("griffon")
 
 
@@ -71,16 +74,30 @@ def check_allowed_params(allowed_params, params):
 class QueryService:
     def invoke(self, obj, params: dict, status=None):
         check_allowed_params(obj.allowed_params, params)
-        return obj(params).execute(status=status)
+        with timings.span(obj.name, "service"):
+            return obj(params).execute(status=status)
+
+    def stream(self, obj, params: dict, status=None):
+        check_allowed_params(obj.allowed_params, params)
+        # span lasts until the stream is consumed, not only while it is created
+        start = time.perf_counter()
+        return timings.iterate(obj(params).stream(status=status), obj.name, "service", start)
 
 
 class ReportService:
     def invoke(self, obj, params: dict, status=None):
         check_allowed_params(obj.allowed_params, params)
-        return obj(params).generate()
+        with timings.span(obj.name, "service"):
+            return obj(params).generate()
+
+    def stream(self, obj, params: dict):
+        check_allowed_params(obj.allowed_params, params)
+        start = time.perf_counter()
+        return timings.iterate(obj(params).stream(), obj.name, "service", start)
 
 
 class ProcessService:
     def invoke(self, obj, params: dict, status=None):
         check_allowed_params(obj.allowed_params, params)
-        return obj(params).process()
+        with timings.span(obj.name, "service"):
+            return obj(params).process()
@@ -4,10 +4,11 @@
 """
 import copy
 import logging
-import multiprocessing
 import re
-from functools import partial
-from typing import Any, Dict, List
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from component_registry_bindings.bindings.python_client.models import Component
 
@@ -18,7 +19,10 @@ from griffon import (
     CommunityComponentService,
     CorgiService,
     OSIDBService,
+    get_max_workers,
+    retrieve_list_with_progress,
 )
+from griffon.timings import timed
 
 logger = logging.getLogger("griffon")
 
@@ -108,6 +112,26 @@ class product_stream_summary:
         return results
 
 
+def retrieve_latest_components_by_name(session, names, **params) -> Dict[str, list]:
+    """
+    retrieve latest components of each distinct name
+
+    names repeat when a component is affected in multiple product modules, each
+    name is retrieved only once and names are retrieved concurrently
+    """
+
+    def retrieve(name):
+        return list(
+            session.components.retrieve_list_iterator_async(
+                name=name, latest_components_by_streams="True", **params
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=get_max_workers()) as pool:
+        futures = {name: pool.submit(retrieve, name) for name in dict.fromkeys(names)}
+        return {name: future.result() for name, future in futures.items()}
+
+
 class products_versions_affected_by_specific_cve_query:
     """Given a specific CVE ID, what products are affected?"""
 
@@ -146,13 +170,13 @@ class products_versions_affected_by_specific_cve_query:
         results = list()
         product_versions = set()
         product_streams = set()
+        components = retrieve_latest_components_by_name(
+            self.corgi_session,
+            [affect.ps_component for affect in affects],
+            include_fields="product_streams.name,product_versions.name",
+        )
         for affect in affects:
-            components = self.corgi_session.components.retrieve_list_iterator_async(
-                name=affect.ps_component,
-                latest_components_by_streams="True",
-                include_fields="product_streams.name,product_versions.name",
-            )
-            for c in components:
+            for c in components[affect.ps_component]:
                 results.append(c.to_dict())
         for c in results:
             for ps in c["product_streams"]:
@@ -244,12 +268,9 @@ def async_retrieve_upstreams(self, purl):
         return []
 
 
-def async_retrieve_provides(self, urlparams, purl):
-    params = {
-        "limit": ITEM_BATCH,
-        "sources": purl,
-        "include_fields": "type,arch,nvr,purl,version,name,namespace",
-    }
+def provides_filter(urlparams) -> dict:
+    """get child component filter of provides sub retrieval from search params"""
+    params = {}
     if "name" in urlparams:
         params["name"] = urlparams["name"]
     if "provides_name" in urlparams:
@@ -260,6 +281,16 @@ def async_retrieve_provides(self, urlparams, purl):
         params["re_name"] = urlparams["re_provides_name"]
     if "namespace" in urlparams:
         params["namespace"] = urlparams["namespace"]
+    return params
+
+
+def async_retrieve_provides(self, urlparams, purl):
+    params = {
+        "limit": ITEM_BATCH,
+        "sources": purl,
+        "include_fields": "type,arch,nvr,purl,version,name,namespace",
+        **provides_filter(urlparams),
+    }
     try:
         return list(self.components.retrieve_list_iterator_async(**params, max_results=5000))
     except Exception as e:
@@ -267,12 +298,92 @@ def async_retrieve_provides(self, urlparams, purl):
         return []
 
 
-def process_component(session, urlparams, c):
-    """perform any neccessary sub retrievals."""
-    c.sources = async_retrieve_sources(session, c.purl)
-    c.upstreams = async_retrieve_upstreams(session, c.purl)
-    c.provides = async_retrieve_provides(session, urlparams, c.purl)
-    return c
+# rh naming conventions of components, {} is replaced by searched component name
+RH_NAMING_PATTERNS = [
+    # binutils
+    "(devtoolset\\-[0-9]+\\-|mingw\\-|gcc\\-toolset\\-[0-9]+\\-)?{}[0-9\\.]*$",
+    # compat-* style
+    "(compat\\-)?{}[0-9\\.]*(\\-[0-9]+)?$",
+    # kernel
+    "^{}(\\-rt)?$",
+    # qemu
+    "^{}(\\-kvm(\\-rhev|\\-ma)?)?$",
+    # webkit
+    "^{}([0-9])?(gtk)?([0-9])?$",
+]
+
+
+@lru_cache
+def rh_naming_pattern(component_name: str) -> re.Pattern:
+    """single pattern matching any of the rh naming conventions of component_name"""
+    return re.compile(
+        "|".join(f"(?:{pattern.format(component_name)})" for pattern in RH_NAMING_PATTERNS),
+        flags=re.IGNORECASE,
+    )
+
+
+def rh_naming_verdicts(component_name: str, names: Iterable[str]) -> Dict[str, bool]:
+    """match each distinct name against rh naming conventions of component_name once"""
+    pattern = rh_naming_pattern(component_name)
+    verdicts = {name: pattern.match(name) is not None for name in names}
+    logger.debug(f"rh naming filtered {[name for name, keep in verdicts.items() if not keep]}")
+    return verdicts
+
+
+class SubRetrievals:
+    """sub retrievals submitted to a worker pool, deduplicated by key"""
+
+    def __init__(self, pool: ThreadPoolExecutor) -> None:
+        self.pool = pool
+        self.futures: Dict[tuple, Future] = {}
+        # search modes submit concurrently so lookup and submit must be atomic
+        self.lock = threading.Lock()
+
+    def submit(self, key: tuple, fn, *args) -> Future:
+        with self.lock:
+            if key not in self.futures:
+                self.futures[key] = self.pool.submit(fn, *args)
+            return self.futures[key]
+
+
+@timed("service")
+def process_components(sub_retrievals, session, urlparams, components) -> list:
+    """
+    perform any neccessary sub retrievals of components concurrently
+
+    component registry has no bulk endpoint so sources, upstreams and provides are
+    still retrieved per component, they are all submitted to the pool at once and
+    deduplicated by purl (and provides filter) against already submitted sub
+    retrievals, results are then mapped back to their components
+    """
+    components = list(components)
+    provides_key = tuple(sorted(provides_filter(urlparams).items()))
+
+    retrievals = []
+    for c in components:
+        retrievals.append(
+            (
+                c,
+                sub_retrievals.submit(
+                    (id(session), "sources", c.purl), async_retrieve_sources, session, c.purl
+                ),
+                sub_retrievals.submit(
+                    (id(session), "upstreams", c.purl), async_retrieve_upstreams, session, c.purl
+                ),
+                sub_retrievals.submit(
+                    (id(session), "provides", c.purl, provides_key),
+                    async_retrieve_provides,
+                    session,
+                    urlparams,
+                    c.purl,
+                ),
+            )
+        )
+    for c, sources, upstreams, provides in retrievals:
+        c.sources = list(sources.result())
+        c.upstreams = list(upstreams.result())
+        c.provides = list(provides.result())
+    return components
 
 
 class products_containing_component_query:
@@ -282,6 +393,7 @@ class products_containing_component_query:
     description = "What products contain a component?"
     allowed_params = [
         "component_name",
+        "component_names",
         "purl",
         "arch",
         "namespace",
@@ -307,11 +419,14 @@ class products_containing_component_query:
         "include_container_roots",
         "exclude_unreleased",
     ]
+    include_fields = "purl,type,name,related_url,namespace,software_build,nvr,release,version,arch,product_streams.product_versions,product_streams.name,product_streams.ofuri,product_streams.active,product_streams.exclude_components,product_streams.relations"  # noqa
 
     def __init__(self, params: dict) -> None:
         self.corgi_session = CorgiService.create_session()
         self.params = params
         self.component_name = self.params.get("component_name", "")
+        # batch of component names (or purls) searched instead of component_name
+        self.component_names = self.params.get("component_names")
         self.component_type = self.params.get("component_type", "")
         self.strict_name_search = self.params.get("strict_name_search")
         self.search_deps = self.params.get("search_deps")
@@ -332,13 +447,201 @@ class products_containing_component_query:
         self.include_inactive_product_streams = self.params.get("include_inactive_product_streams")
         self.include_container_roots = self.params.get("include_container_roots")
         self.exclude_unreleased = self.params.get("exclude_unreleased")
+        self.max_workers = get_max_workers()
+
+    def execute(self, status=None) -> Union[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        # single long-lived worker pool shared by all search modes, sub retrievals
+        # are I/O bound so threads are used instead of forking processes
+        self.pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        # sub retrievals shared by all search modes to avoid refetching the same purl
+        self.sub_retrievals = SubRetrievals(self.pool)
+        try:
+            if self.component_names is not None:
+                return self.batch_search(status)
+            return self.search(self.component_name, status)
+        finally:
+            self.pool.shutdown()
+
+    def batch_search(self, status=None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        search all component names (or purls) of the batch, results are keyed by name
+
+        names are searched concurrently sharing the worker pool and sub retrievals
+        so components found by multiple names are processed only once, service calls
+        of all the searches are bounded by max_workers in total (request slots)
+        """
+        names: List[str] = list(dict.fromkeys(self.component_names or []))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as batch:
+            searches = {
+                name: batch.submit(
+                    self.purl_search if name.startswith("pkg:") else self.search, name, status
+                )
+                for name in names
+            }
+            return {name: search.result() for name, search in searches.items()}
 
-    def execute(self, status=None) -> List[Dict[str, Any]]:
+    def purl_search(self, purl, status=None) -> list:
+        status.update(f"searching {purl}.")
+        search_purl_params = {
+            "limit": ITEM_BATCH,
+            "include_fields": self.include_fields,
+            "purl": purl,
+        }
+        components = self.retrieve_components(
+            self.corgi_session, search_purl_params, status, "purl component(s)"
+        )
+        return self.process_components(self.corgi_session, search_purl_params, components)
+
+    def process_components(self, session, urlparams, components) -> list:
+        """perform sub retrievals of components using the query worker pool"""
+        return process_components(self.sub_retrievals, session, urlparams, components)
+
+    def session_label(self, session) -> str:
+        """label used in status messages of a search against session"""
+        return "community " if session is not self.corgi_session else ""
+
+    def name_params(self, params, component_name, name_field="name") -> dict:
+        """copy search params adding (regex) name condition on name_field"""
+        search_params = copy.deepcopy(params)
+        if not (self.strict_name_search):
+            search_params[f"re_{name_field}"] = component_name
+        else:
+            search_params[name_field] = component_name
+        return search_params
+
+    def retrieve_components(self, session, search_params, status, label, max_results=10000):
+        """retrieve components reporting progress of search labelled label"""
+        _, components = retrieve_list_with_progress(
+            session.components,
+            status=status,
+            label=f"{self.session_label(session)}{label}",
+            max_results=max_results,
+            **search_params,
+        )
+        return components
+
+    def provides_search(self, session, params, component_name, status) -> list:
+        search_provides_params = self.name_params(params, component_name, "provides_name")
+        search_provides_params["latest_components_by_streams"] = "True"
+        status.update(f"searching latest {self.session_label(session)}provided child component(s).")
+        latest_components = self.retrieve_components(
+            session, search_provides_params, status, "latest provided child component(s)"
+        )
+        return self.process_components(session, search_provides_params, latest_components)
+
+    def latest_search(self, session, params, component_name, status) -> list:
+        search_latest_params = self.name_params(params, component_name)
+        search_latest_params["root_components"] = "True"
+        search_latest_params["latest_components_by_streams"] = "True"
+        status.update(f"searching latest {self.session_label(session)}root component(s).")
+        latest_components = self.retrieve_components(
+            session, search_latest_params, status, "latest root component(s)"
+        )
+        return self.process_components(session, search_latest_params, latest_components)
+
+    def upstreams_search(self, session, params, component_name, status) -> list:
+        search_upstreams_params = self.name_params(params, component_name, "upstreams_name")
+        search_upstreams_params["latest_components_by_streams"] = "True"
+        status.update(
+            f"searching latest {self.session_label(session)}upstreams child component(s)."
+        )
+        latest_components = self.retrieve_components(
+            session, search_upstreams_params, status, "latest upstreams child component(s)"
+        )
+        return self.process_components(session, search_upstreams_params, latest_components)
+
+    def related_url_search(self, session, params, component_name, status) -> list:
+        search_related_url_params = copy.deepcopy(params)
+        # Note: related_url filter has no concept of strict
+        search_related_url_params["related_url"] = component_name
+        return self.retrieve_components(
+            session, search_related_url_params, status, "related url component(s)"
+        )
+
+    def all_search(self, session, params, component_name, status) -> list:
+        search_all_params = self.name_params(params, component_name)
+        # TODO: remove max_results
+        all_components = self.retrieve_components(
+            session, search_all_params, status, "all component(s)"
+        )
+        for c in all_components:
+            c.upstreams = []
+            c.sources = []
+        return all_components
+
+    def all_roots_search(self, session, params, component_name, status) -> list:
+        search_all_roots_params = self.name_params(params, component_name)
+        search_all_roots_params["root_components"] = "True"
+        all_src_components = self.retrieve_components(
+            session, search_all_roots_params, status, "all root component(s)"
+        )
+        for c in all_src_components:
+            c.upstreams = []
+            c.sources = []
+        return all_src_components
+
+    def all_upstreams_search(self, session, params, component_name, status) -> list:
+        search_all_upstreams_params = self.name_params(params, component_name)
+        search_all_upstreams_params["namespace"] = "UPSTREAM"
+        upstream_components = self.retrieve_components(
+            session, search_all_upstreams_params, status, "upstream component(s)"
+        )
+        return self.process_components(session, search_all_upstreams_params, upstream_components)
+
+    def community_search(self, params, component_name, status) -> list:
+        search_community_params = self.name_params(params, component_name)
+        all_community_components = self.retrieve_components(
+            self.community_session,
+            search_community_params,
+            status,
+            "all component(s)",
+            max_results=None,
+        )
+        return self.process_components(
+            self.community_session, search_community_params, all_community_components
+        )
+
+    def stream(self, status=None) -> Iterator[list]:
+        """
+        components found by each search of component_name in completion order
+
+        searches are submitted right away so they run before the stream is consumed,
+        components are neither merged nor ordered across searches
+        """
+        self.pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.sub_retrievals = SubRetrievals(self.pool)
         status.update("searching component-registry.")
-        results = []
+        component_name = self.search_name(self.component_name)
+        searches = self.searches_pool()
+        search_results, community_search = self.submit_searches(searches, component_name, status)
+        return self.completed_searches(searches, component_name, search_results, community_search)
+
+    def completed_searches(
+        self, searches, component_name, search_results, community_search
+    ) -> Iterator[list]:
+        """yield components of searches as they complete, pools are shut down once consumed"""
+        try:
+            futures = [*search_results, *([community_search] if community_search else [])]
+            for search in as_completed(futures):
+                components = search.result()
+                if search is not community_search:
+                    components = self.rh_named(component_name, components)
+                if components:
+                    yield components
+        finally:
+            searches.shutdown()
+            self.pool.shutdown()
+
+    def search_name(self, component_name) -> str:
+        """component name (pattern) as searched"""
+        if not self.strict_name_search and not self.regex_name_search:
+            return re.escape(component_name)
+        return component_name
+
+    def search_params(self) -> dict:
         params = {
             "limit": ITEM_BATCH,
-            "include_fields": "purl,type,name,related_url,namespace,software_build,nvr,release,version,arch,product_streams.product_versions,product_streams.name,product_streams.ofuri,product_streams.active,product_streams.exclude_components,product_streams.relations",  # noqa
+            "include_fields": self.include_fields,
         }
         if not (self.include_inactive_product_streams):
             params["active_streams"] = "True"
@@ -350,363 +653,98 @@ class products_containing_component_query:
             params["namespace"] = self.ns
         if self.component_type:
             params["type"] = self.component_type
+        return params
 
-        component_name = self.component_name
-        if not self.strict_name_search and not self.regex_name_search:
-            component_name = re.escape(component_name)
-
-        if self.search_provides:
-            search_provides_params = copy.deepcopy(params)
-            if not (self.strict_name_search):
-                search_provides_params["re_provides_name"] = component_name
-            else:
-                search_provides_params["provides_name"] = component_name
-            search_provides_params["latest_components_by_streams"] = "True"
-            status.update("searching latest provided child component(s).")
-            latest_components_cnt = self.corgi_session.components.count(**search_provides_params)
-            status.update(f"found {latest_components_cnt} latest provides component(s).")
-            latest_components = self.corgi_session.components.retrieve_list_iterator_async(
-                **search_provides_params, max_results=10000
-            )
-
-            status.update(
-                f"found {latest_components_cnt} latest provides child component(s)- retrieving children, sources & upstreams."  # noqa
-            )
-            with multiprocessing.Pool() as pool:
-                for processed_component in pool.map(
-                    partial(process_component, self.corgi_session, search_provides_params),
-                    latest_components,
-                ):
-                    results.append(processed_component)
-            # if we have found no children then search_latest for roots
-            if not (results):
-                self.search_latest = True
-
-            if not self.no_community:
-                status.update("searching latest community provided child component(s).")
-                community_component_cnt = self.community_session.components.count(
-                    **search_provides_params
-                )
-                status.update(
-                    f"found {community_component_cnt} latest community provided child component(s)."  # noqa
-                )
-                latest_community_components = (
-                    self.community_session.components.retrieve_list_iterator_async(
-                        **search_provides_params, max_results=10000
-                    )
-                )
-                status.update(
-                    f"found {community_component_cnt} latest community provided child component(s)- retrieving children, sources & upstreams."  # noqa
-                )
-                with multiprocessing.Pool() as pool:
-                    for processed_component in pool.map(
-                        partial(process_component, self.community_session, search_provides_params),
-                        latest_community_components,
-                    ):
-                        results.append(processed_component)
-
-        if self.search_latest:
-            search_latest_params = copy.deepcopy(params)
-            if not (self.strict_name_search):
-                search_latest_params["re_name"] = component_name
-            else:
-                search_latest_params["name"] = component_name
-            search_latest_params["root_components"] = "True"
-            search_latest_params["latest_components_by_streams"] = "True"
-            status.update("searching latest root component(s).")
-            latest_components_cnt = self.corgi_session.components.count(**search_latest_params)
-            status.update(f"found {latest_components_cnt} latest component(s).")
-            latest_components = self.corgi_session.components.retrieve_list_iterator_async(
-                **search_latest_params, max_results=10000
-            )
-            status.update(f"found {latest_components_cnt} latest root component(s).")  # noqa
-            with multiprocessing.Pool() as pool:
-                for processed_component in pool.map(
-                    partial(process_component, self.corgi_session, search_latest_params),
-                    latest_components,
-                ):
-                    results.append(processed_component)
-
-            if not self.no_community:
-                status.update("searching latest community root component(s).")
-                community_component_cnt = self.community_session.components.count(
-                    **search_latest_params
-                )
-                status.update(
-                    f"found {community_component_cnt} latest community root component(s)."  # noqa
-                )
-                latest_community_components = (
-                    self.community_session.components.retrieve_list_iterator_async(
-                        **search_latest_params, max_results=10000
-                    )
-                )
-                status.update(
-                    f"found {community_component_cnt} latest community root component(s)- retrieving children, sources & upstreams."  # noqa
-                )
-                with multiprocessing.Pool() as pool:
-                    for processed_component in pool.map(
-                        partial(process_component, self.community_session, search_latest_params),
-                        latest_community_components,
-                    ):
-                        results.append(processed_component)
-
-        if self.search_upstreams:
-            search_upstreams_params = copy.deepcopy(params)
-            search_upstreams_params["latest_components_by_streams"] = "True"
-            if not (self.strict_name_search):
-                search_upstreams_params["re_upstreams_name"] = component_name
-            else:
-                search_upstreams_params["upstreams_name"] = component_name
-            search_upstreams_params["latest_components_by_streams"] = "True"
-            status.update("searching latest upstreams child component(s).")
-            latest_components_cnt = self.corgi_session.components.count(**search_upstreams_params)
-            status.update(f"found {latest_components_cnt} latest component(s).")
-            latest_components = self.corgi_session.components.retrieve_list_iterator_async(
-                **search_upstreams_params, max_results=10000
-            )
-            with multiprocessing.Pool() as pool:
-                status.update(
-                    f"found {latest_components_cnt} latest upstreams child component(s)- retrieving children, sources & upstreams."  # noqa
-                )
-                for processed_component in pool.map(
-                    partial(process_component, self.corgi_session, search_upstreams_params),
-                    latest_components,
-                ):
-                    results.append(processed_component)
-            if not self.no_community:
-                status.update("searching latest community upstreams child component(s).")
-                community_component_cnt = self.community_session.components.count(
-                    **search_upstreams_params
-                )
-                status.update(
-                    f"found {community_component_cnt} latest community upstreams child component(s)."  # noqa
-                )
-                latest_community_components = (
-                    self.community_session.components.retrieve_list_iterator_async(
-                        **search_upstreams_params, max_results=10000
-                    )
-                )
-                with multiprocessing.Pool() as pool:
-                    status.update(
-                        f"found {community_component_cnt} latest community provided child component(s)- retrieving children, sources & upstreams."  # noqa
-                    )
-                    for processed_component in pool.map(
-                        partial(process_component, self.community_session, search_upstreams_params),
-                        latest_community_components,
-                    ):
-                        results.append(processed_component)
-
-        if self.search_related_url:
-            search_related_url_params = copy.deepcopy(params)
-            # Note: related_url filter has no concept of strict
-            search_related_url_params["related_url"] = component_name
-            related_url_components_cnt = self.corgi_session.components.count(
-                **search_related_url_params,
-            )
-            status.update(f"found {related_url_components_cnt} related url component(s).")
-            related_url_components = self.corgi_session.components.retrieve_list_iterator_async(
-                **search_related_url_params, max_results=10000
-            )
-            for c in related_url_components:
-                results.append(c)
-
-            if not self.no_community:
-                latest_community_url_components_cnt = self.community_session.components.count(
-                    **search_related_url_params
-                )
-                status.update(
-                    f"found {latest_community_url_components_cnt} related url community component(s)."  # noqa
-                )
-                latest_community_url_components = (
-                    self.community_session.components.retrieve_list_iterator_async(
-                        **search_related_url_params, max_results=10000
-                    )
-                )
-                for c in latest_community_url_components:
-                    results.append(c)
+    def search_sessions(self) -> list:
+        sessions = [self.corgi_session]
+        if not self.no_community:
+            sessions.append(self.community_session)
+        return sessions
+
+    def search_modes(self) -> list:
+        return [
+            (self.search_provides, self.provides_search),
+            (self.search_latest, self.latest_search),
+            (self.search_upstreams, self.upstreams_search),
+            (self.search_related_url, self.related_url_search),
+            (self.search_all, self.all_search),
+            (self.search_all_roots, self.all_roots_search),
+            (self.search_all_upstreams, self.all_upstreams_search),
+        ]
+
+    def searches_pool(self) -> ThreadPoolExecutor:
+        """pool running every search mode against every session (and community search)"""
+        return ThreadPoolExecutor(
+            max_workers=len(self.search_modes()) * len(self.search_sessions()) + 1
+        )
 
-        if self.search_all:
-            search_all_params = copy.deepcopy(params)
-            if not (self.strict_name_search):
-                search_all_params["re_name"] = component_name
-            else:
-                search_all_params["name"] = component_name
-            all_components_cnt = self.corgi_session.components.count(**search_all_params)
-            status.update(f"found {all_components_cnt} all component(s).")
-            # TODO: remove max_results
-            all_components = self.corgi_session.components.retrieve_list_iterator_async(
-                **search_all_params, max_results=10000
-            )
-            status.update(f"found {all_components_cnt} all component(s).")
-            for c in all_components:
-                c.upstreams = []
-                c.sources = []
-                results.append(c)
-
-            if not self.no_community:
-                all_community_components_cnt = self.community_session.components.count(
-                    **search_all_params
-                )
-                status.update(
-                    f"found {all_community_components_cnt} community all component(s)."  # noqa
-                )
-                # TODO: remove max_results
-                all_community_components = (
-                    self.community_session.components.retrieve_list_iterator_async(
-                        **search_all_params, max_results=10000
-                    )
-                )
-                for c in all_community_components:
-                    c.upstreams = []
-                    c.sources = []
-                    results.append(c)
-
-        if self.search_all_roots:
-            search_all_roots_params = copy.deepcopy(params)
-            search_all_roots_params["root_components"] = "True"
-            if not (self.strict_name_search):
-                search_all_roots_params["re_name"] = component_name
-            else:
-                search_all_roots_params["name"] = component_name
-            all_src_components_cnt = self.corgi_session.components.count(**search_all_roots_params)
-            status.update(f"found {all_src_components_cnt} all root component(s).")
-            all_src_components = self.corgi_session.components.retrieve_list_iterator_async(
-                **search_all_roots_params, max_results=10000
-            )
-            for c in all_src_components:
-                c.upstreams = []
-                c.sources = []
-                results.append(c)
-            if not self.no_community:
-                all_src_community_components_cnt = self.community_session.components.count(
-                    **search_all_roots_params
-                )
-                all_src_community_components = (
-                    self.community_session.components.retrieve_list_iterator_async(
-                        **search_all_roots_params, max_results=10000
-                    )
-                )
-                status.update(
-                    f"found {all_src_community_components_cnt} community all root component(s)."  # noqa
-                )
-                for c in all_src_community_components:
-                    c.upstreams = []
-                    c.sources = []
-                    results.append(c)
-
-        if self.search_all_upstreams:
-            search_all_upstreams_params = copy.deepcopy(params)
-            search_all_upstreams_params["namespace"] = "UPSTREAM"
-            if not (self.strict_name_search):
-                search_all_upstreams_params["re_name"] = component_name
-            else:
-                search_all_upstreams_params["name"] = component_name
-            upstream_components_cnt = self.corgi_session.components.count(
-                **search_all_upstreams_params
-            )
-            status.update(f"found {upstream_components_cnt} upstream component(s).")
-            upstream_components = self.corgi_session.components.retrieve_list_iterator_async(
-                **search_all_upstreams_params, max_results=10000
-            )
-            with multiprocessing.Pool() as pool:
-                status.update(f"found {upstream_components_cnt} upstream component(s).")
-                for processed_component in pool.map(
-                    partial(process_component, self.corgi_session, search_all_upstreams_params),
-                    upstream_components,
-                ):
-                    results.append(processed_component)
-            if not self.no_community:
-                commmunity_upstream_components_cnt = self.community_session.components.count(
-                    **search_all_upstreams_params
-                )
-                status.update(
-                    f"found {commmunity_upstream_components_cnt} community upstream component(s)."  # noqa
-                )
-                commmunity_upstream_components = (
-                    self.community_session.components.retrieve_list_iterator_async(
-                        **search_all_upstreams_params, max_results=10000
-                    )
-                )
-                with multiprocessing.Pool() as pool:
-                    status.update(
-                        f"found {commmunity_upstream_components_cnt} community upstream component(s)- retrieving children, sources & upstreams."  # noqa
-                    )
-                    for processed_component in pool.map(
-                        partial(
-                            process_component, self.community_session, search_all_upstreams_params
-                        ),
-                        commmunity_upstream_components,
-                    ):
-                        results.append(processed_component)
-
-        if self.filter_rh_naming:
-            flags = re.IGNORECASE
-            patterns = [
-                # binutils
-                re.compile(
-                    f"(devtoolset\\-[0-9]+\\-|mingw\\-|gcc\\-toolset\\-[0-9]+\\-)?{component_name}[0-9\\.]*$",  # noqa
-                    flags=flags,
-                ),
-                # compat-* style
-                re.compile(f"(compat\\-)?{component_name}[0-9\\.]*(\\-[0-9]+)?$", flags=flags),
-                # kernel
-                re.compile(f"^{component_name}(\\-rt)?$", flags=flags),
-                # qemu
-                re.compile(f"^{component_name}(\\-kvm(\\-rhev|\\-ma)?)?$", flags=flags),
-                # webkit
-                re.compile(f"^{component_name}([0-9])?(gtk)?([0-9])?$", flags=flags),
+    def submit_searches(
+        self, searches, component_name, status
+    ) -> Tuple[List[Future], Optional[Future]]:
+        """
+        submit enabled search modes of component_name against all sessions
+
+        search modes are independent so all of them are run concurrently, futures are
+        returned in merge order (component-registry before community) along with the
+        community search if enabled
+        """
+        params = self.search_params()
+        sessions = self.search_sessions()
+
+        def submit_search(search_mode) -> List[Future]:
+            return [
+                searches.submit(search_mode, session, params, component_name, status)
+                for session in sessions
             ]
 
-            filtered_results = []
-
-            for result in results:
-                is_matched = False
-                for p in patterns:
-                    if is_matched:
-                        break
-                    if type(result) == Component:
-                        m = p.match(result.name)
-                        logger.debug(f"rh naming filtered {result.name}")
-                        if m:
-                            filtered_results.append(result)
-                            is_matched = True
-                            break
-                    else:
-                        m = p.match(result["name"])
-                        if m:
-                            filtered_results.append(result)
-                            is_matched = True
-                            break
-
-            results = filtered_results
-
+        community_search = None
         if self.search_community:
-            search_community_params = copy.deepcopy(params)
-            if not (self.strict_name_search):
-                search_community_params["re_name"] = component_name
-            else:
-                search_community_params["name"] = component_name
-            all_community_components_cnt = self.community_session.components.count(
-                **search_community_params
-            )
-            status.update(
-                f"found {all_community_components_cnt} community all component(s)."  # noqa
+            community_search = searches.submit(
+                self.community_search, params, component_name, status
             )
-            all_community_components = (
-                self.community_session.components.retrieve_list_iterator_async(
-                    **search_community_params
-                )
+        search_results = [
+            submit_search(search_mode) if enabled else []
+            for enabled, search_mode in self.search_modes()
+        ]
+        # if we have found no provided children then search_latest for roots
+        if self.search_provides and not self.search_latest:
+            search_results[1] = submit_search(
+                partial(self.latest_fallback_search, search_results[0][0])
             )
-            with multiprocessing.Pool() as pool:
-                status.update(
-                    f"found {all_community_components_cnt} community all component(s)- retrieving children, sources & upstreams."  # noqa
-                )
-                for processed_component in pool.map(
-                    partial(process_component, self.community_session, search_community_params),
-                    all_community_components,
-                ):
-                    results.append(processed_component)
+        return [search for mode in search_results for search in mode], community_search
+
+    def latest_fallback_search(
+        self, provides_search: Future, session, params, component_name, status
+    ) -> list:
+        """latest root components search performed only if no provided children were found"""
+        if provides_search.result():
+            return []
+        return self.latest_search(session, params, component_name, status)
+
+    def rh_named(self, component_name, components) -> list:
+        """components matching rh naming conventions of component_name if filtered"""
+        if not self.filter_rh_naming:
+            return components
+        is_rh_named = rh_naming_verdicts(
+            component_name,
+            {c.name if isinstance(c, Component) else c["name"] for c in components},
+        )
+        return [
+            c for c in components if is_rh_named[c.name if isinstance(c, Component) else c["name"]]
+        ]
 
+    def search(self, component_name, status=None) -> List[Dict[str, Any]]:
+        status.update("searching component-registry.")
+        component_name = self.search_name(component_name)
+        with self.searches_pool() as searches:
+            search_results, community_search = self.submit_searches(
+                searches, component_name, status
+            )
+            results = self.rh_named(
+                component_name, [c for search in search_results for c in search.result()]
+            )
+            if community_search:
+                results.extend(community_search.result())
         return results
 
 
@@ -866,13 +904,13 @@ class components_affected_by_specific_cve_query:
         affects = flaw.affects
         results = list()
 
+        components = retrieve_latest_components_by_name(
+            self.corgi_session,
+            [affect.ps_component for affect in affects],
+            include_fields="purl,product_streams,product_versions,software_build",
+        )
         for affect in affects:
-            components = self.corgi_session.components.retrieve_list_iterator_async(
-                name=affect.ps_component,
-                latest_components_by_streams="True",
-                include_fields="purl,product_streams,product_versions,software_build",
-            )
-            for c in components:
+            for c in components[affect.ps_component]:
                 results.append(c.to_dict())
 
         return {
@@ -884,6 +922,35 @@ class components_affected_by_specific_cve_query:
         }
 
 
+AFFECT_FIELDS = "uuid,flaw,ps_component,ps_module,affectedness,impact,resolution"
+
+
+def retrieve_affects_with_flaws(osidb_session, affect_params, flaw_params) -> list:
+    """
+    retrieve affects filtered server side joined with their flaws
+
+    flaws (retrieved without their affects) supply the flaw details and flaw level
+    filters, affects of flaws not matching flaw_params are dropped, returns
+    (flaw, affect) pairs ordered by flaw
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        affects = pool.submit(
+            lambda: list(
+                osidb_session.affects.retrieve_list_iterator_async(
+                    include_fields=AFFECT_FIELDS, **affect_params
+                )
+            )
+        )
+        flaws = {
+            flaw.uuid: (position, flaw)
+            for position, flaw in enumerate(
+                osidb_session.flaws.retrieve_list_iterator_async(**flaw_params)
+            )
+        }
+        joined = [(flaws[a.flaw], a) for a in affects.result() if a.flaw in flaws]
+    return [(flaw, affect) for (_, flaw), affect in sorted(joined, key=lambda j: j[0][0])]
+
+
 class cves_for_specific_component_query:
     """CVEs affecting a specific component?"""
 
@@ -920,7 +987,7 @@ class cves_for_specific_component_query:
         if self.component_name:
             affects: list = []
             params = {
-                "include_fields": "cve_id,title,resolution,impact,affects",
+                "include_fields": "uuid,cve_id,title,resolution",
             }
             params["affects__ps_component"] = self.component_name
             if self.flaw_state:
@@ -936,35 +1003,33 @@ class cves_for_specific_component_query:
             if self.affect_impact:
                 params["affects__impact"] = self.affect_impact
 
-            flaws = self.osidb_session.flaws.retrieve_list_iterator_async(**params)
-
-            for flaw in flaws:
-                for affect in flaw.affects:
-                    if self.affectedness:
-                        if self.affectedness != affect.affectedness:
-                            continue
-                    if self.affect_resolution:
-                        if self.affect_resolution != affect.resolution:
-                            continue
-                    if self.affect_impact:
-                        if self.affect_impact != affect.impact:
-                            continue
-                    affects.append(
-                        {
-                            "link_affect": f"{OSIDB_SERVER_URL}/osidb/api/v1/affects/{affect.uuid}",  # noqa
-                            "link_cve": f"{OSIDB_SERVER_URL}/osidb/api/v1/flaws/{flaw.cve_id}",  # noqa
-                            "link_component": f"{CORGI_SERVER_URL}/api/v1/components?name={affect.ps_component}&latest_components_by_streams=True",  # noqa
-                            "link_community_component": f"{COMMUNITY_COMPONENTS_SERVER_URL}/api/v1/components?name={affect.ps_component}&latest_components_by_streams=True",  # noqa
-                            "flaw_cve_id": flaw.cve_id,
-                            "title": flaw.title,
-                            "flaw_resolution": flaw.resolution,
-                            "affect_component_name": affect.ps_component,
-                            "affect_product_version": affect.ps_module,
-                            "affect_affectedness": affect.affectedness,
-                            "affect_impact": affect.impact,
-                            "affect_resolution": affect.resolution,
-                        }
-                    )
+            affect_params = {"ps_component": self.component_name}
+            if self.affectedness:
+                affect_params["affectedness"] = self.affectedness
+            if self.affect_resolution:
+                affect_params["resolution"] = self.affect_resolution
+            if self.affect_impact:
+                affect_params["impact"] = self.affect_impact
+
+            for flaw, affect in retrieve_affects_with_flaws(
+                self.osidb_session, affect_params, params
+            ):
+                affects.append(
+                    {
+                        "link_affect": f"{OSIDB_SERVER_URL}/osidb/api/v1/affects/{affect.uuid}",  # noqa
+                        "link_cve": f"{OSIDB_SERVER_URL}/osidb/api/v1/flaws/{flaw.cve_id}",  # noqa
+                        "link_component": f"{CORGI_SERVER_URL}/api/v1/components?name={affect.ps_component}&latest_components_by_streams=True",  # noqa
+                        "link_community_component": f"{COMMUNITY_COMPONENTS_SERVER_URL}/api/v1/components?name={affect.ps_component}&latest_components_by_streams=True",  # noqa
+                        "flaw_cve_id": flaw.cve_id,
+                        "title": flaw.title,
+                        "flaw_resolution": flaw.resolution,
+                        "affect_component_name": affect.ps_component,
+                        "affect_product_version": affect.ps_module,
+                        "affect_affectedness": affect.affectedness,
+                        "affect_impact": affect.impact,
+                        "affect_resolution": affect.resolution,
+                    }
+                )
             components.append(
                 {
                     "link": f"{CORGI_SERVER_URL}/api/v1/components?name={self.component_name}",
@@ -1012,7 +1077,7 @@ class cves_for_specific_product_query:
         if self.product_version_name:
             affects: list = []
             params = {
-                "include_fields": "cve_id,title,resolution,impact,affects",
+                "include_fields": "uuid,cve_id,title,state,resolution",
             }
             params["affects__ps_module"] = self.product_version_name
             if self.flaw_resolution:
@@ -1026,35 +1091,34 @@ class cves_for_specific_product_query:
             if self.affect_impact:
                 params["affects__impact"] = self.affect_impact
 
-            flaws = self.osidb_session.flaws.retrieve_list_iterator_async(**params)
-            for flaw in flaws:
-                for affect in flaw.affects:
-                    if self.affectedness:
-                        if self.affectedness != affect.affectedness:
-                            continue
-                    if self.affect_resolution:
-                        if self.affect_resolution != affect.resolution:
-                            continue
-                    if self.affect_impact:
-                        if self.affect_impact != affect.impact:
-                            continue
-                    affects.append(
-                        {
-                            "link_affect": f"{OSIDB_SERVER_URL}/osidb/api/v1/affects/{affect.uuid}",  # noqa
-                            "link_cve": f"{OSIDB_SERVER_URL}/osidb/api/v1/flaws/{flaw.cve_id}",  # noqa
-                            "link_component": f"{CORGI_SERVER_URL}/api/v1/components?name={affect.ps_component}&latest_components_by_streams=True",  # noqa
-                            "link_community_component": f"{COMMUNITY_COMPONENTS_SERVER_URL}/api/v1/components?name={affect.ps_component}&latest_components_by_streams=True",  # noqa
-                            "flaw_cve_id": flaw.cve_id,
-                            "title": flaw.title,
-                            "flaw_state": flaw.state,
-                            "flaw_resolution": flaw.resolution,
-                            "affect_component_name": affect.ps_component,
-                            "affect_product_version": affect.ps_module,
-                            "affect_affectedness": affect.affectedness,
-                            "affect_impact": affect.impact,
-                            "affect_resolution": affect.resolution,
-                        }
-                    )
+            affect_params = {"ps_module": self.product_version_name}
+            if self.affectedness:
+                affect_params["affectedness"] = self.affectedness
+            if self.affect_resolution:
+                affect_params["resolution"] = self.affect_resolution
+            if self.affect_impact:
+                affect_params["impact"] = self.affect_impact
+
+            for flaw, affect in retrieve_affects_with_flaws(
+                self.osidb_session, affect_params, params
+            ):
+                affects.append(
+                    {
+                        "link_affect": f"{OSIDB_SERVER_URL}/osidb/api/v1/affects/{affect.uuid}",  # noqa
+                        "link_cve": f"{OSIDB_SERVER_URL}/osidb/api/v1/flaws/{flaw.cve_id}",  # noqa
+                        "link_component": f"{CORGI_SERVER_URL}/api/v1/components?name={affect.ps_component}&latest_components_by_streams=True",  # noqa
+                        "link_community_component": f"{COMMUNITY_COMPONENTS_SERVER_URL}/api/v1/components?name={affect.ps_component}&latest_components_by_streams=True",  # noqa
+                        "flaw_cve_id": flaw.cve_id,
+                        "title": flaw.title,
+                        "flaw_state": flaw.state,
+                        "flaw_resolution": flaw.resolution,
+                        "affect_component_name": affect.ps_component,
+                        "affect_product_version": affect.ps_module,
+                        "affect_affectedness": affect.affectedness,
+                        "affect_impact": affect.impact,
+                        "affect_resolution": affect.resolution,
+                    }
+                )
             components.append(
                 {
                     "link": f"{CORGI_SERVER_URL}/api/v1/product_versions?name={self.product_version_name}",  # noqa
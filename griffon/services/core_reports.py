@@ -3,13 +3,31 @@
 
 """
 import logging
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from griffon import (
+    OSIDB_SERVER_URL,
+    CorgiService,
+    OSIDBService,
+    cache,
+    get_max_workers,
+    http_session,
+    iterate_list,
+)
 
-import requests
+logger = logging.getLogger("griffon")
 
-from griffon import OSIDB_SERVER_URL, CorgiService, OSIDBService
+AFFECT_IMPACTS = ("CRITICAL", "IMPORTANT", "MODERATE", "LOW")
+AFFECTS_PAGE_LIMIT = 2000
 
-logger = logging.getLogger("griffon")
+# component types counted by their root components only
+ROOT_COMPONENT_TYPES = ("RPM", "OCI")
 
 
 class example_affects_report:
@@ -40,110 +58,90 @@ class example_affects_report:
         self.component_name = self.params.get("name")
         self.ofuri = self.params.get("ofuri")
         self.product_name = self.params.get("product_name")
+        # affected affects tallied by impact, per component and product
+        self.components: Dict[str, Counter] = {impact: Counter() for impact in AFFECT_IMPACTS}
+        self.products: Dict[str, Counter] = {impact: Counter() for impact in AFFECT_IMPACTS}
 
-    def generate(self) -> dict:
-        affects = self.osidb_session.affects.retrieve_list()
-
-        affects_affected = self.osidb_session.affects.retrieve_list(affectedness="AFFECTED")
+    def tally(self, impact: str, page: dict) -> None:
+        """add affects of page to component and product counts of impact"""
+        for affect in page["results"]:
+            self.components[impact][affect.get("ps_component", "no_name")] += 1
+            self.products[impact][affect.get("ps_module", "no_name")] += 1
 
+    def retrieve_page(self, offset: int, limit: Optional[int] = None, **params) -> dict:
         # TODO osidb_session.affects does not support include_fields, do it manually for now
-        affect_critical_res = requests.get(
-            f"{OSIDB_SERVER_URL}/osidb/api/v1/affects?affectedness=AFFECTED&impact=CRITICAL&include_fields=ps_component,ps_module,impact&limit=10000"  # noqa
+        response = http_session().get(
+            f"{OSIDB_SERVER_URL}/osidb/api/v1/affects",
+            params={
+                "affectedness": "AFFECTED",
+                "include_fields": "ps_component,ps_module",
+                "limit": limit or AFFECTS_PAGE_LIMIT,
+                "offset": offset,
+                **params,
+            },
         )
-        affects_critical = affect_critical_res.json()
-        critical_components = {}
-        critical_products = {}
-        for affect in affects_critical["results"]:
-            component_name = affect.get("ps_component", "no_name")
-            if component_name not in critical_components:
-                critical_components[component_name] = 0
-            critical_components[component_name] += 1
-
-            product_version_name = affect.get("ps_module", "no_name")
-            if product_version_name not in critical_products:
-                critical_products[product_version_name] = 0
-            critical_products[product_version_name] += 1
-
-        top_critical_component = max(critical_components, key=critical_components.get)  # type: ignore # noqa
-        top_critical_product = max(critical_products, key=critical_products.get)  # type: ignore
-
-        affect_important_res = requests.get(
-            f"{OSIDB_SERVER_URL}/osidb/api/v1/affects?affectedness=AFFECTED&impact=IMPORTANT&include_fields=ps_component,ps_module,impact&limit=10000"  # noqa
+        response.raise_for_status()
+        return response.json()
+
+    def generate(self) -> dict:
+        max_workers = get_max_workers()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            affects = pool.submit(self.osidb_session.affects.retrieve_list, limit=1)
+            affected = pool.submit(self.retrieve_page, 0, limit=1)
+
+            # affected affects of each impact are filtered by OSIDB and retrieved by
+            # paginated listings, first pages of all impacts and then at most
+            # max_workers remaining pages are retrieved concurrently, pages are tallied
+            # (and dropped) as they arrive
+            first_pages = {
+                impact: pool.submit(self.retrieve_page, 0, impact=impact)
+                for impact in AFFECT_IMPACTS
+            }
+            pages: List[Tuple[str, int]] = []
+            for impact, first_page in first_pages.items():
+                page = first_page.result()
+                self.tally(impact, page)
+                pages.extend(
+                    (impact, offset)
+                    for offset in range(AFFECTS_PAGE_LIMIT, page["count"], AFFECTS_PAGE_LIMIT)
+                )
+            remaining_pages = iter(pages)
+
+            def submit(impact: str, offset: int) -> Tuple[Future, str]:
+                return pool.submit(self.retrieve_page, offset, impact=impact), impact
+
+            pending = dict(submit(*page) for page in islice(remaining_pages, max_workers))
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self.tally(pending.pop(future), future.result())
+                pending.update(submit(*page) for page in islice(remaining_pages, len(done)))
+
+            total_affects = affects.result().count
+            total_affected = affected.result()["count"]
+
+        critical, important, moderate, low = (
+            {
+                "affected": sum(self.components[impact].values()),
+                "top_component": max(
+                    self.components[impact],
+                    key=lambda name: self.components[impact][name],
+                    default=None,
+                ),
+                "top_product": max(
+                    self.products[impact],
+                    key=lambda name: self.products[impact][name],
+                    default=None,
+                ),
+            }
+            for impact in AFFECT_IMPACTS
         )
-        affects_important = affect_important_res.json()
-        important_components = {}
-        important_products = {}
-        for affect in affects_important["results"]:
-            component_name = affect.get("ps_component", "no_name")
-            if component_name not in important_components:
-                important_components[component_name] = 0
-            important_components[component_name] += 1
-
-            product_version_name = affect.get("ps_module", "no_name")
-            if product_version_name not in important_products:
-                important_products[product_version_name] = 0
-            important_products[product_version_name] += 1
-        top_important_component = max(important_components, key=important_components.get)  # type: ignore # noqa
-        top_important_product = max(important_products, key=important_products.get)  # type: ignore # noqa
-
-        affect_moderate_res = requests.get(
-            f"{OSIDB_SERVER_URL}/osidb/api/v1/affects?affectedness=AFFECTED&impact=MODERATE&include_fields=ps_component,ps_module,impact&limit=10000"  # noqa
+        critical_components, important_components, moderate_components, low_components = (
+            dict(self.components[impact]) for impact in AFFECT_IMPACTS
         )
-        affects_moderate = affect_moderate_res.json()
-        moderate_components = {}
-        moderate_products = {}
-        for affect in affects_moderate["results"]:
-            component_name = affect.get("ps_component", "no_name")
-            if component_name not in moderate_components:
-                moderate_components[component_name] = 0
-            moderate_components[component_name] += 1
-
-            product_version_name = affect.get("ps_module", "no_name")
-            if product_version_name not in moderate_products:
-                moderate_products[product_version_name] = 0
-            moderate_products[product_version_name] += 1
-        top_moderate_component = max(moderate_components, key=moderate_components.get)  # type: ignore # noqa
-        top_moderate_product = max(moderate_products, key=moderate_products.get)  # type: ignore
-
-        affect_low_res = requests.get(
-            f"{OSIDB_SERVER_URL}/osidb/api/v1/affects?affectedness=AFFECTED&impact=LOW&include_fields=ps_component,ps_module,impact&limit=10000"  # noqa
+        critical_products, important_products, moderate_products, low_products = (
+            dict(self.products[impact]) for impact in AFFECT_IMPACTS
         )
-        affects_low = affect_low_res.json()
-        low_components = {}
-        low_products = {}
-        for affect in affects_low["results"]:
-            component_name = affect.get("ps_component", "no_name")
-            if component_name not in low_components:
-                low_components[component_name] = 0
-            low_components[component_name] += 1
-
-            product_version_name = affect.get("ps_module", "no_name")
-            if product_version_name not in low_products:
-                low_products[product_version_name] = 0
-            low_products[product_version_name] += 1
-        top_low_component = max(low_components, key=low_components.get)  # type: ignore
-        top_low_product = max(low_products, key=low_products.get)  # type: ignore
-
-        critical = {
-            "affected": affects_critical["count"],
-            "top_component": top_critical_component,
-            "top_product": top_critical_product,
-        }
-        important = {
-            "affected": affects_important["count"],
-            "top_component": top_important_component,
-            "top_product": top_important_product,
-        }
-        moderate = {
-            "affected": affects_moderate["count"],
-            "top_component": top_moderate_component,
-            "top_product": top_moderate_product,
-        }
-        low = {
-            "affected": affects_low["count"],
-            "top_component": top_low_component,
-            "top_product": top_low_product,
-        }
 
         if self.show_components:
             critical["components"] = critical_components
@@ -160,8 +158,8 @@ class example_affects_report:
         report = {
             "title": "Example Affects report",
             "ts": str(datetime.now()),
-            "total_affects": affects.count,
-            "total_affected": affects_affected.count,
+            "total_affects": total_affects,
+            "total_affected": total_affected,
             "critical": critical,
             "important": important,
             "moderate": moderate,
@@ -180,8 +178,8 @@ class example_affects_report:
         return {
             "title": "Example Affects report",
             "ts": str(datetime.now()),
-            "total_affects": affects.count,
-            "total_affected": affects_affected.count,
+            "total_affects": total_affects,
+            "total_affected": total_affected,
             "critical": critical,
             "important": important,
             "moderate": moderate,
@@ -201,73 +199,68 @@ class entity_report:
         self.osidb_session = OSIDBService.create_session()
         self.params = params
 
+    def cached(self, name: str, fetch: Callable) -> Tuple[Any, float]:
+        """
+        get value from response cache or fetch it, returns value and latency in seconds
+
+        counts change slowly, they are kept in the response cache (when enabled) for
+        cache_ttl_entity_report seconds across invocations
+        """
+        started = time.perf_counter()
+        if cache.response_cache is None:
+            value = fetch()
+        else:
+            value = cache.deserialize(
+                cache.cached_call(
+                    cache.response_cache,
+                    "corgi",
+                    "entity_report",
+                    name,
+                    lambda: cache.serialize(fetch()),
+                )
+            )
+        return value, round(time.perf_counter() - started, 3)
+
     def generate(self) -> dict:
         component_arches = CorgiService.get_component_arches()
         component_types = [
             component_type.value for component_type in CorgiService.get_component_types()
         ]
-        corgi_status = self.corgi_session.status()
-        active_product_streams_count = self.corgi_session.product_streams.retrieve_list().count
-        component_instances_count = self.corgi_session.components.retrieve_list(limit=1).count
-
-        # get src RPM count
-        rpmcomponents_cnt = self.corgi_session.components.count(
-            root_components="True",
-            type="RPM",
-        )
-        # get OCI noarch count
-        ocicomponents_cnt = self.corgi_session.components.count(
-            root_components="True",
-            type="OCI",
-        )
-        # get NPM noarch count
-        npmcomponents_cnt = self.corgi_session.components.count(
-            type="NPM",
-        )
-        # get GOLANG noarch count
-        golangcomponents_cnt = self.corgi_session.components.count(
-            type="GOLANG",
-        )
-        # get GENERIC count
-        genericcomponents_cnt = self.corgi_session.components.count(
-            type="GENERIC",
-        )
-        # get GEM count
-        gemcomponents_cnt = self.corgi_session.components.count(
-            type="GEM",
-        )
-        # get CARGO count
-        cargocomponents_cnt = self.corgi_session.components.count(
-            type="CARGO",
-        )
-        # get GITHUB count
-        githubcomponents_cnt = self.corgi_session.components.count(
-            type="GITHUB",
-        )
-        # get MAVEN count
-        mavencomponents_cnt = self.corgi_session.components.count(
-            type="MAVEN",
-        )
-        # get PYPI count
-        pypicomponents_cnt = self.corgi_session.components.count(
-            type="PYPI",
-        )
-        # get RPMMOD count
-        rpmmodcomponents_cnt = self.corgi_session.components.count(
-            type="RPMMOD",
-        )
 
-        total_component_cnt = (
-            rpmcomponents_cnt
-            + ocicomponents_cnt
-            + npmcomponents_cnt
-            + golangcomponents_cnt
-            + gemcomponents_cnt
-            + cargocomponents_cnt
-            + githubcomponents_cnt
-            + mavencomponents_cnt
-            + pypicomponents_cnt
-            + rpmmodcomponents_cnt
+        calls = {
+            "status": self.corgi_session.status,
+            "active_product_streams": lambda: self.corgi_session.product_streams.retrieve_list(
+                limit=1
+            ).count,
+            "total_component_instances": lambda: self.corgi_session.components.retrieve_list(
+                limit=1
+            ).count,
+        }
+        for component_type in filter(None, component_types):
+            if component_type in ROOT_COMPONENT_TYPES:
+                calls[f"{component_type.lower()}_root_components"] = partial(
+                    self.corgi_session.components.count,
+                    root_components="True",
+                    type=component_type,
+                )
+            else:
+                calls[f"{component_type.lower()}_components"] = partial(
+                    self.corgi_session.components.count, type=component_type
+                )
+
+        # all counts are independent, fire them at once so the report takes a single
+        # round trip instead of one per count
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            futures = {name: pool.submit(self.cached, name, fetch) for name, fetch in calls.items()}
+        values = {name: future.result()[0] for name, future in futures.items()}
+        latency = {name: future.result()[1] for name, future in futures.items()}
+
+        corgi_status = values.pop("status")
+        active_product_streams_count = values.pop("active_product_streams")
+        component_instances_count = values.pop("total_component_instances")
+        # generic components are not distinct components
+        total_component_cnt = sum(
+            count for name, count in values.items() if name != "generic_components"
         )
 
         return {
@@ -280,17 +273,7 @@ class entity_report:
                     "arches": component_arches,
                     "total_component_instances": component_instances_count,
                     "total_distinct_components": total_component_cnt,
-                    "rpm_root_components": rpmcomponents_cnt,
-                    "oci_root_components": ocicomponents_cnt,
-                    "npm_components": npmcomponents_cnt,
-                    "golang_components": golangcomponents_cnt,
-                    "generic_components": genericcomponents_cnt,
-                    "gem_components": gemcomponents_cnt,
-                    "cargo_components": cargocomponents_cnt,
-                    "github_components": githubcomponents_cnt,
-                    "maven_components": mavencomponents_cnt,
-                    "pypi_components": pypicomponents_cnt,
-                    "rpmmod_components": rpmmodcomponents_cnt,
+                    **values,
                 },
                 "products": {
                     "products": corgi_status["products"]["count"],
@@ -300,6 +283,7 @@ class entity_report:
                     "product_variants": corgi_status["product_variants"]["count"],
                     "channels": corgi_status["channels"]["count"],
                 },
+                "latency": latency,
             }
         }
 
@@ -309,7 +293,7 @@ class license_report:
 
     name = "license_report"
     description = " "
-    allowed_params = ["product_stream_name", "purl", "exclude_children"]
+    allowed_params = ["product_stream_name", "purl", "exclude_children", "max_workers"]
 
     def __init__(self, params) -> None:
         self.corgi_session = CorgiService.create_session()
@@ -317,9 +301,49 @@ class license_report:
         self.product_stream_name = params.get("product_stream_name")
         self.purl = params.get("purl")
         self.exclude_children = params.get("exclude_children")
-
-    def generate(self) -> dict:
-        output = {}
+        self.max_workers = params.get("max_workers") or get_max_workers()
+
+    @staticmethod
+    def license_record(component, **fields) -> dict:
+        record = {
+            "license_declared": component.license_declared,
+            "related_url": component.related_url,
+            **fields,
+        }
+        if component.license_concluded:
+            # Some components can't be scanned, e.g. binary RPMs
+            record["license_concluded"] = component.license_concluded
+        if str(component.type) not in ("RPM", "RPMMOD") and (
+            # Report container's exact repository_url if present
+            # Container Catalog search page is used as a fallback
+            # Just ignore it if no specific URL is available
+            component.download_url
+            != "https://catalog.redhat.com/software/containers/search"
+        ):
+            record["download_url"] = component.download_url
+        return record
+
+    def retrieve_children(self, purl: str) -> List[dict]:
+        provides_filter = {
+            "sources": purl,
+            "include_fields": "purl,type,license_concluded,license_declared,related_url,download_url",  # noqa
+        }
+        provides_components = iterate_list(self.corgi_session.components, **provides_filter)
+        return [{"purl": c.purl, **self.license_record(c)} for c in provides_components]
+
+    def root_record(self, component) -> dict:
+        record = self.license_record(component, build_id=component.software_build.build_id)
+        if not self.exclude_children:
+            record["children"] = self.retrieve_children(component.purl)
+        return record
+
+    def stream(self) -> Iterator[Tuple[str, dict]]:
+        """
+        yield (purl, record) of each root component in order of retrieval
+
+        children of at most max_workers root components are retrieved concurrently,
+        records are yielded as soon as they and all preceding records are complete
+        """
         component_filter = {
             "include_fields": "uuid,purl,type,license_concluded,license_declared,related_url,download_url,software_build.build_id",  # noqa
         }
@@ -331,53 +355,18 @@ class license_report:
             )
             stream_ofuri = product_stream["ofuri"]
             component_filter["ofuri"] = stream_ofuri
-        search_components = self.corgi_session.components.retrieve_list_iterator_async(
-            **component_filter
-        )
-        for component in search_components:
-            purl = component.purl
-            output[purl] = {
-                "license_declared": component.license_declared,
-                "related_url": component.related_url,
-                "build_id": component.software_build.build_id,
-            }
-            if component.license_concluded:
-                # Some components can't be scanned, e.g. binary RPMs
-                output[purl]["license_concluded"] = component.license_concluded
-            if str(component.type) not in ("RPM", "RPMMOD") and (
-                # Report container's exact repository_url if present
-                # Container Catalog search page is used as a fallback
-                # Just ignore it if no specific URL is available
-                component.download_url
-                != "https://catalog.redhat.com/software/containers/search"
-            ):
-                output[purl]["download_url"] = component.download_url
-
-            children = []
-            provides_filter = {
-                "sources": purl,
-                "include_fields": "purl,type,license_concluded,license_declared,related_url,download_url",  # noqa
-            }
-            provides_components = self.corgi_session.components.retrieve_list_iterator_async(
-                **provides_filter
-            )
-            for c in provides_components:
-                child = {
-                    "purl": c.purl,
-                    "license_declared": c.license_declared,
-                    "related_url": c.related_url,
-                }
-                if c.license_concluded:
-                    # Some components can't be scanned, e.g. binary RPMs
-                    child["license_concluded"] = c.license_concluded
-                if str(c.type) not in ("RPM", "RPMMOD") and (
-                    # Report container's exact repository_url if present
-                    # Container Catalog search page is used as a fallback
-                    # Just ignore it if no specific URL is available
-                    c.download_url
-                    != "https://catalog.redhat.com/software/containers/search"
-                ):
-                    child["download_url"] = c.download_url
-                children.append(child)
-            output[purl]["children"] = children
-        return output
+        # root components are paged in as the window of pending records drains
+        search_components = iterate_list(self.corgi_session.components, **component_filter)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending: Deque[Tuple[str, Future]] = deque()
+            for component in search_components:
+                pending.append((component.purl, pool.submit(self.root_record, component)))
+                if len(pending) >= self.max_workers:
+                    purl, record = pending.popleft()
+                    yield purl, record.result()
+            while pending:
+                purl, record = pending.popleft()
+                yield purl, record.result()
+
+    def generate(self) -> dict:
+        return dict(self.stream())
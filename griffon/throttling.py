@@ -0,0 +1,124 @@
+"""
+    process wide bound of service calls in flight
+
+"""
+import importlib
+import threading
+from functools import wraps
+from typing import Dict, Optional
+
+from requests.adapters import HTTPAdapter
+
+from griffon.timings import http_span_args, operation_span_args, timings
+
+# slots of service calls in flight, sized by max_workers once first needed
+request_slots: Optional[threading.BoundedSemaphore] = None
+request_slots_lock = threading.Lock()
+
+
+def get_request_slots() -> threading.BoundedSemaphore:
+    """
+    semaphore shared by all service calls of the process
+
+    queries and reports nest worker pools (searches, page prefetching, sub
+    retrievals), calls of all of them go through the same slots so at most
+    max_workers calls are in flight in total, a slot is held only for the duration
+    of a single call so nested pools cannot deadlock
+    """
+    global request_slots
+    with request_slots_lock:
+        if request_slots is None:
+            from griffon import get_max_workers
+
+            request_slots = threading.BoundedSemaphore(get_max_workers())
+        return request_slots
+
+
+def bounded(call, service: str, resource: str):
+    """
+    wrap call of service operation so it waits for a free request slot, span of the
+    call is recorded once the slot is acquired
+    """
+
+    @wraps(call)
+    def wrapper(*args, **params):
+        span_args = operation_span_args(service, resource, call.__name__, params)
+        with get_request_slots(), timings.span(span_args.pop("name"), "http", **span_args):
+            return call(*args, **params)
+
+    return wrapper
+
+
+class BoundedAdapter(HTTPAdapter):
+    """http adapter sending requests through request slots"""
+
+    def send(self, request, *args, **kwargs):
+        span_args = http_span_args(request.method, request.url)
+        name = span_args.pop("name")
+        with get_request_slots(), timings.span(name, "http", **span_args) as recorded_args:
+            response = super().send(request, *args, **kwargs)
+            if timings.enabled:
+                if kwargs.get("stream"):
+                    recorded_args["bytes"] = int(response.headers.get("Content-Length", 0))
+                else:
+                    # content is read right after anyway, read it here to time the transfer
+                    recorded_args["bytes"] = len(response.content)
+                recorded_args["status"] = response.status_code
+            return response
+
+
+class BoundedOperationsGroup:
+    """proxy of session operations group calling the service through request slots"""
+
+    def __init__(self, group, service: str) -> None:
+        self.group = group
+        self.service = service
+        self.resource = group.resource_name
+        # binding package of the group, its constants set page size of list operations
+        self.binding = getattr(group, "binding", None) or type(group).__module__.split(".")[0]
+
+    def __getattr__(self, name):
+        attr = getattr(self.group, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        return bounded(attr, self.service, self.resource)
+
+    def paginator(self):
+        return importlib.import_module(f"{self.binding}.iterators").Paginator
+
+    def retrieve_list(self, *args, **params):
+        response = bounded(self.group.retrieve_list, self.service, self.resource)(*args, **params)
+        # further pages of the response are retrieved through the slots too
+        return self.paginator().make_response_iterable(
+            response, self.retrieve_list, *args, **params
+        )
+
+    def retrieve_list_iterator(self, *args, **params):
+        for page in self.paginator()(*args, retrieve_list_fn=self.retrieve_list, **params):
+            yield from page.results
+
+    def retrieve_list_iterator_async(self, max_results=None, **params):
+        # bindings gather all pages at once, pages are prefetched by iterate_list
+        # instead so that they are retrieved through the slots as well
+        from griffon import iterate_list
+
+        return iterate_list(self, max_results=max_results, **params)
+
+
+class BoundedSession:
+    """proxy of binding session calling the service through request slots"""
+
+    def __init__(self, session, service: str) -> None:
+        self.session = session
+        self.service = service
+        self.groups: Dict[str, BoundedOperationsGroup] = {}
+
+    def __getattr__(self, name):
+        attr = getattr(self.session, name)
+        if hasattr(attr, "resource_name") and hasattr(attr, "allowed_operations"):
+            if name not in self.groups:
+                self.groups[name] = BoundedOperationsGroup(attr, self.service)
+            return self.groups[name]
+        if name.startswith("_") or not callable(attr):
+            return attr
+        return bounded(attr, self.service, "session")
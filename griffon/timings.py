@@ -0,0 +1,196 @@
+"""
+    timing spans of http calls, service operations and output rendering
+
+"""
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+# ids in url paths are replaced so calls of the same endpoint are summarized together
+ID_PATTERN = re.compile(r"/(?:[0-9a-fA-F-]{32,36}|\d+)(?=/|$)")
+
+
+class Span:
+    """timed operation"""
+
+    def __init__(self, name: str, category: str, start: float, end: float, **args: Any) -> None:
+        self.name = name
+        self.category = category
+        self.start = start
+        self.duration = end - start
+        self.thread = threading.get_ident()
+        self.args = args
+
+
+class Timings:
+    """
+    collector of timing spans, spans are only collected once enabled
+
+    http calls of service sessions and http_session are recorded by the request
+    slots they go through (griffon.throttling)
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.spans: List[Span] = []
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()
+
+    def enable(self) -> None:
+        if not self.enabled:
+            self.enabled = True
+            self.origin = time.perf_counter()
+
+    def record(self, name: str, category: str, start: float, end: float, **args: Any) -> Span:
+        span = Span(name, category, start, end, **args)
+        with self.lock:
+            self.spans.append(span)
+        return span
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any):
+        """record span of the block, args yielded can be updated within the block"""
+        if not self.enabled:
+            yield args
+            return
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.record(name, category, start, time.perf_counter(), **args)
+
+    def iterate(
+        self, iterable: Iterable, name: str, category: str, start: Optional[float] = None
+    ) -> Iterator:
+        """
+        yield from iterable recording span of the whole iteration, span starts at start
+        (or once first item is requested) and ends once iterable is exhausted or closed
+        """
+        if not self.enabled:
+            yield from iterable
+            return
+        start = time.perf_counter() if start is None else start
+        try:
+            yield from iterable
+        finally:
+            self.record(name, category, start, time.perf_counter())
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """spans grouped by category and name, sorted by total duration"""
+        groups: Dict[tuple, List[Span]] = defaultdict(list)
+        for span in self.spans:
+            groups[(span.category, span.name)].append(span)
+        rows = [
+            {
+                "category": category,
+                "name": name,
+                "calls": len(spans),
+                "total": sum(span.duration for span in spans),
+                "max": max(span.duration for span in spans),
+                "bytes": sum(span.args.get("bytes", 0) for span in spans),
+            }
+            for (category, name), spans in groups.items()
+        ]
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+    def print_summary(self, width: Optional[int] = None) -> None:
+        from rich.console import Console
+        from rich.table import Table
+
+        table = Table(title="Timings")
+        for column in ("Category", "Name", "Calls", "Total (s)", "Mean (ms)", "Max (ms)", "Bytes"):
+            table.add_column(column, justify="left" if column in ("Category", "Name") else "right")
+        for row in self.summary():
+            table.add_row(
+                row["category"],
+                row["name"],
+                str(row["calls"]),
+                f"{row['total']:.3f}",
+                f"{row['total'] / row['calls'] * 1000:.1f}",
+                f"{row['max'] * 1000:.1f}",
+                str(row["bytes"]) if row["bytes"] else "",
+            )
+        # summary goes to stderr so it does not mix with (possibly piped) results
+        Console(stderr=True, width=width).print(table)
+
+    def chrome_trace(self) -> dict:
+        """spans in Chrome trace event format (chrome://tracing, Perfetto)"""
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round((span.start - self.origin) * 1e6),
+                    "dur": round(span.duration * 1e6),
+                    "pid": os.getpid(),
+                    "tid": span.thread,
+                    "args": span.args,
+                }
+                for span in self.spans
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def report(self, trace_file: Optional[str] = None, width: Optional[int] = None) -> None:
+        self.print_summary(width=width)
+        if trace_file:
+            with open(trace_file, "w") as fp:
+                json.dump(self.chrome_trace(), fp, default=str)
+
+
+timings = Timings()
+
+
+def timed(category: str):
+    """decorator recording span of each call of function"""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timings.span(func.__name__, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def page_number(params: dict) -> int:
+    """page number of list call derived from limit and offset"""
+    try:
+        return int(params.get("offset", 0)) // int(params["limit"]) + 1
+    except (KeyError, ValueError, ZeroDivisionError):
+        return 1
+
+
+def http_span_args(method: str, url: str) -> Dict[str, Any]:
+    """span name and args of http call"""
+    parts = urlsplit(str(url))
+    params = dict(parse_qsl(parts.query))
+    return {
+        "name": f"{method} {parts.netloc}{ID_PATTERN.sub('/{id}', parts.path)}",
+        "url": str(url),
+        "params": params,
+        "page": page_number(params),
+        "bytes": 0,
+    }
+
+
+def operation_span_args(
+    service: str, resource: str, operation: str, params: dict
+) -> Dict[str, Any]:
+    """span name and args of service binding operation (eg. components retrieve_list)"""
+    return {
+        "name": f"{operation} {urlsplit(str(service)).netloc or service}/{resource}",
+        "params": {name: str(value) for name, value in params.items()},
+        "page": page_number(params),
+        "bytes": 0,
+    }
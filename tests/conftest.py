@@ -0,0 +1,243 @@
+import atexit
+import gzip
+import importlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, List
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+from requests import Response
+from requests.adapters import BaseAdapter
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+def pytest_configure(config):
+    """
+    griffon config directory (option schema, plugin manifest, caches) of the suite
+    is a temporary directory instead of ~/.griffon, set before any test module
+    imports griffon so the suite does not change the home directory of the developer
+    """
+    config_dir = tempfile.mkdtemp(prefix="griffon-")
+    # registered first so it runs after state is stored at exit (eg. option schema)
+    atexit.register(shutil.rmtree, config_dir, ignore_errors=True)
+    os.environ["GRIFFON_API_URL"] = config_dir
+
+
+@pytest.fixture(scope="session")
+def normalised_results():
+    """products-contain-component normalised results of a large search"""
+    with gzip.open(os.path.join(DATA_DIR, "normalised_results.json.gz"), "rt") as fp:
+        return json.load(fp)
+
+
+class FakeResource:
+    """
+    operations group of fake service session, its records are binding models
+
+    list params naming record fields filter records (re_ params by regex, list
+    fields by membership), fields named _<param> filter records without being
+    returned, other params (eg. include_fields) are ignored
+    """
+
+    allowed_operations = ("retrieve", "list")
+
+    def __init__(self, service: "FakeService", resource_name: str) -> None:
+        self.service = service
+        self.resource_name = resource_name
+        self.binding = service.binding
+        self.records: List[Dict[str, Any]] = []
+        models = importlib.import_module(f"{service.binding}.bindings.python_client.models")
+        model_name = "".join(part.title() for part in resource_name[:-1].split("_"))
+        self.page_model = getattr(models, f"Paginated{model_name}List")
+
+    @staticmethod
+    def matches(record: dict, param: str, value) -> bool:
+        field = param[len("re_") :] if param.startswith("re_") else param
+        for name in (f"_{field}", field):
+            if name not in record:
+                continue
+            if param.startswith("re_"):
+                return re.search(value, record[name]) is not None
+            if isinstance(record[name], list):
+                return value in record[name]
+            return str(record[name]) == str(value)
+        return True
+
+    def filter(self, params: dict) -> List[dict]:
+        return [
+            {name: value for name, value in record.items() if not name.startswith("_")}
+            for record in self.records
+            if all(self.matches(record, param, value) for param, value in params.items())
+        ]
+
+    def retrieve_list(self, limit=50, offset=0, **params):
+        with self.service.call(self.resource_name, "retrieve_list", offset=offset, **params):
+            records = self.filter(params)
+            url = f"http://fake/{self.resource_name}?limit={limit}&offset={{}}"
+            return self.page_model.from_dict(
+                {
+                    "count": len(records),
+                    "results": records[offset : offset + limit],
+                    "next": url.format(offset + limit) if offset + limit < len(records) else None,
+                    "previous": url.format(max(offset - limit, 0)) if offset else None,
+                }
+            )
+
+    def count(self, **params) -> int:
+        with self.service.call(self.resource_name, "count", **params):
+            return len(self.filter(params))
+
+
+class FakeService:
+    """fake binding session, resources are created on first use"""
+
+    def __init__(self, services: "FakeServices", binding: str) -> None:
+        self.services = services
+        self.binding = binding
+        self.resources: Dict[str, FakeResource] = {}
+        self.status_data: Dict[str, Any] = {}
+        # seconds added to latency of the calls of this service
+        self.latency = 0.0
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.resources.setdefault(name, FakeResource(self, name))
+
+    def call(self, resource: str, operation: str, **params):
+        return self.services.call(self, resource, operation, **params)
+
+    def status(self) -> dict:
+        with self.call("session", "status"):
+            return self.status_data
+
+
+class FakeAdapter(BaseAdapter):
+    """http adapter serving list operations of service apis from fake services"""
+
+    def __init__(self, services: "FakeServices") -> None:
+        super().__init__()
+        self.services = services
+
+    def send(self, request, *args, **kwargs) -> Response:
+        url = urlsplit(request.url)
+        path = url.path.strip("/").split("/")
+        service = self.services.osidb if path[0] == "osidb" else self.services.corgi
+        params: Dict[str, Any] = dict(parse_qsl(url.query))
+        for param in ("limit", "offset"):
+            if param in params:
+                params[param] = int(params[param])
+        page = getattr(service, path[-1]).retrieve_list(**params)
+        response = Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(page.to_dict()).encode("utf-8")
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class FakeServices:
+    """
+    fake component registry, community component registry and osidb services
+
+    every call is recorded and takes latency seconds, peak is the highest number
+    of calls in flight across all services
+    """
+
+    def __init__(self) -> None:
+        self.corgi = FakeService(self, "component_registry_bindings")
+        self.community = FakeService(self, "component_registry_bindings")
+        self.osidb = FakeService(self, "osidb_bindings")
+        self.latency = 0.0
+        self.calls: List[tuple] = []
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def call(self, service: FakeService, resource: str, operation: str, **params):
+        with self.lock:
+            self.calls.append((service, resource, operation, params))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.latency + service.latency)
+            yield
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def new_corgi_session(self, component_registry_server_uri, **kwargs) -> FakeService:
+        from griffon import COMMUNITY_COMPONENTS_SERVER_URL
+
+        if component_registry_server_uri == COMMUNITY_COMPONENTS_SERVER_URL:
+            return self.community
+        return self.corgi
+
+    def new_osidb_session(self, **kwargs) -> FakeService:
+        return self.osidb
+
+
+@pytest.fixture
+def fake_services(monkeypatch):
+    """
+    fake services replacing component registry and osidb, queries and reports
+    create their sessions through the usual (shared, cached, bounded) factories
+    """
+    import component_registry_bindings
+    import osidb_bindings
+
+    import griffon
+    from griffon import cache, throttling
+
+    services = FakeServices()
+    monkeypatch.setattr(component_registry_bindings, "new_session", services.new_corgi_session)
+    monkeypatch.setattr(osidb_bindings, "new_session", services.new_osidb_session)
+    monkeypatch.setattr(griffon, "shared_sessions", {})
+    monkeypatch.setattr(cache, "response_cache", None)
+    monkeypatch.setattr(throttling, "request_slots", None)
+    griffon.http_session().mount("http://", FakeAdapter(services))
+    return services
+
+
+# peak memory of benchmarked functions by test, reported in the terminal summary
+peak_memory_key = pytest.StashKey[Dict[str, float]]()
+
+
+@pytest.fixture
+def peak_memory(request, benchmark):
+    """measure peak memory (in MB) of a single call of function outside of the timed rounds"""
+
+    def measure(fn, *args):
+        tracemalloc.start()
+        try:
+            fn(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak_mb = round(peak / 2**20, 1)
+        benchmark.extra_info["peak_memory_mb"] = peak_mb
+        request.config.stash.setdefault(peak_memory_key, {})[request.node.name] = peak_mb
+
+    return measure
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    peak_memory = config.stash.get(peak_memory_key, {})
+    if peak_memory:
+        terminalreporter.section("peak memory")
+        for name, peak in peak_memory.items():
+            terminalreporter.write_line(f"{name:<70} {peak:>10.1f} MB")
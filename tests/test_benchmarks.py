@@ -0,0 +1,178 @@
+"""
+    products-contain-component output pipeline and cli startup benchmarks
+
+    run with: pytest -m benchmark --no-cov tests/test_benchmarks.py
+"""
+import copy
+import io
+import subprocess
+import sys
+
+import click
+import pytest
+
+from griffon.output import (
+    console,
+    generate_normalised_results,
+    generate_result_tree,
+    raw_json_transform,
+    rhel_br_deduplicate,
+    text_output_products_contain_component,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+SIZES = (1000, 10000, 100000)
+# tracing memory of rendering 100k components takes minutes
+TEXT_OUTPUT_SIZES = (1000, 10000)
+VERBOSITY_LEVELS = (0, 1, 2, 3, 4)
+
+
+def raw_results(normalised_results, size):
+    """
+    raw products-contain-component results of given number of components
+
+    components of the recorded search are rebuilt from its normalised results
+    and cloned under new names until the size is reached
+    """
+    components = {}
+    for item in normalised_results:
+        if item["purl"] not in components:
+            components[item["purl"]] = {
+                **{
+                    field: item[field]
+                    for field in (
+                        "namespace",
+                        "name",
+                        "nvr",
+                        "type",
+                        "arch",
+                        "version",
+                        "related_url",
+                        "purl",
+                        "sources",
+                        "upstreams",
+                        "provides",
+                    )
+                },
+                "software_build": {
+                    "source": item["build_source_url"],
+                    "build_type": item["build_type"],
+                },
+                "product_streams": [],
+            }
+        components[item["purl"]]["product_streams"].append(
+            {
+                "name": item["product_stream"],
+                "active": item["product_stream_active"],
+                "relations": item["product_stream_relations"],
+                "product_versions": [{"name": item["product_version"]}],
+                "exclude_components": [],
+            }
+        )
+
+    recorded = list(components.values())
+    results = []
+    for i in range(size):
+        component = copy.deepcopy(recorded[i % len(recorded)])
+        clone = i // len(recorded)
+        if clone:
+            for field in ("name", "nvr", "purl"):
+                component[field] = f"{component[field]}-{clone}"
+        results.append(component)
+    return results
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size}")
+def raw(request, normalised_results):
+    return raw_results(normalised_results, request.param)
+
+
+@pytest.fixture(scope="module")
+def output(raw):
+    return raw_json_transform(raw, True)
+
+
+@pytest.fixture(scope="module")
+def normalised(output):
+    return normalise(output)
+
+
+def normalise(output):
+    return generate_normalised_results(output, [], ["-debuginfo", "-devel"], None, False, False)
+
+
+def products_contain_component_ctx(verbose):
+    ctx = click.Context(click.Command("products-contain-component"))
+    ctx.obj = {"VERBOSE": verbose, "MIDDLEWARE_CLI": None}
+    ctx.params = {
+        "purl": None,
+        "component_name": "kernel",
+        "output_type_filter": None,
+        "include_inactive_product_streams": False,
+        "include_product_stream_excluded_components": False,
+        "deduplicate": True,
+        "affect_mode": False,
+        "flaw_mode": None,
+        "no_middleware": True,
+    }
+    return ctx
+
+
+def test_raw_json_transform(benchmark, peak_memory, raw):
+    # bindings imported on first use are not measured
+    raw_json_transform(raw[:1], True)
+    peak_memory(raw_json_transform, raw, True)
+    benchmark.pedantic(raw_json_transform, args=(raw, True), rounds=3)
+
+
+def test_generate_normalised_results(benchmark, peak_memory, output):
+    peak_memory(normalise, output)
+    benchmark.pedantic(normalise, args=(output,), rounds=3)
+
+
+def test_generate_result_tree(benchmark, peak_memory, normalised):
+    peak_memory(generate_result_tree, normalised)
+    benchmark.pedantic(generate_result_tree, args=(normalised,), rounds=3)
+
+
+def test_rhel_br_deduplicate(benchmark, peak_memory, normalised):
+    # deduplication modifies the tree in place
+    peak_memory(rhel_br_deduplicate, generate_result_tree(normalised))
+    benchmark.pedantic(
+        rhel_br_deduplicate,
+        setup=lambda: ((generate_result_tree(normalised),), {}),
+        rounds=3,
+    )
+
+
+@pytest.mark.parametrize("verbose", VERBOSITY_LEVELS, ids=lambda level: f"v{level}")
+@pytest.mark.parametrize("size", TEXT_OUTPUT_SIZES, ids=lambda size: f"{size}")
+def test_text_output_products_contain_component(
+    benchmark, peak_memory, monkeypatch, normalised_results, size, verbose
+):
+    output = raw_json_transform(raw_results(normalised_results, size), True)
+    ctx = products_contain_component_ctx(verbose)
+    monkeypatch.setattr(console, "file", io.StringIO())
+    monkeypatch.setattr(console, "width", 1000)
+
+    def render():
+        # rendered text is discarded, only rendering itself is measured
+        console.file = io.StringIO()
+        text_output_products_contain_component(ctx, output, [], [], exit_after=False)
+
+    peak_memory(render)
+    benchmark.pedantic(render, rounds=1)
+
+
+def test_cli_startup(benchmark):
+    """cold start of the cli in a fresh interpreter takes well under 200 ms"""
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", "from griffon.cli import cli"],),
+        kwargs={"check": True},
+        rounds=5,
+    )
+    assert benchmark.stats.stats.min < 0.2
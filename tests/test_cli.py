@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 from click.testing import CliRunner
 
@@ -25,3 +28,23 @@ def test_cli_components():
     runner = CliRunner()
     result = runner.invoke(cli, ["--help"])
     assert result.exit_code == 0
+
+
+def test_cli_startup():
+    """cli startup must not import command or service modules nor service bindings"""
+    lazy_modules = (
+        "component_registry_bindings",
+        "osidb_bindings",
+        "requests",
+        "pkg_resources",
+        "griffon.commands.queries",
+        "griffon.services",
+    )
+    code = (
+        "import sys; from griffon.cli import cli; "
+        f"print(' '.join(m for m in {lazy_modules!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
@@ -0,0 +1,163 @@
+import io
+import re
+
+import click
+import pytest
+
+from griffon.output import (
+    ExcludeMatcher,
+    console,
+    generate_result_tree,
+    text_output_products_contain_component_unsorted,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def legacy_generate_result_tree(normalised_results):
+    """previous generate_result_tree implementation rescanning results per key"""
+    product_versions = sorted(list(set([item["product_version"] for item in normalised_results])))
+    result_tree = {}
+    for pv in product_versions:
+        result_tree[pv] = {}
+        product_streams = sorted(
+            list(
+                set(
+                    [
+                        item["product_stream"]
+                        for item in normalised_results
+                        if item["product_version"] == pv
+                    ]
+                )
+            )
+        )
+        for ps in product_streams:
+            result_tree[pv][ps] = {}
+            component_names = sorted(
+                list(
+                    set(
+                        [
+                            item["name"]
+                            for item in normalised_results
+                            if item["product_stream"] == ps
+                        ]
+                    )
+                )
+            )
+            for cn in component_names:
+                result_tree[pv][ps][cn] = {}
+                nvrs = [
+                    item
+                    for item in normalised_results
+                    if item["product_stream"] == ps and item["name"] == cn
+                ]
+
+                for nvr in nvrs:
+                    result_tree[pv][ps][cn][nvr["nvr"]] = nvr
+    return result_tree
+
+
+def tree_keys(tree):
+    """nested keys in iteration order"""
+    if not isinstance(tree, dict) or "nvr" in tree:
+        return tree
+    return [(key, tree_keys(value)) for key, value in tree.items()]
+
+
+def test_generate_result_tree(normalised_results):
+    result_tree = generate_result_tree(normalised_results)
+    legacy_result_tree = legacy_generate_result_tree(normalised_results)
+    assert result_tree == legacy_result_tree
+    assert tree_keys(result_tree) == tree_keys(legacy_result_tree)
+
+
+def test_generate_result_tree_empty():
+    assert generate_result_tree([]) == {}
+
+
+def test_exclude_matcher(normalised_results):
+    exclude_products = ["rhel-br-.*", "ocp-tools-4", "quay-.*"]
+    exclude_components = ["-container-source", "-debuginfo", "-devel", "-libs"]
+    ps_exclude_components = [[], ["kernel-rt", "^libcurl"], ["openssl"]]
+    exclude_matcher = ExcludeMatcher(exclude_products, exclude_components)
+    for i, item in enumerate(normalised_results):
+        ps_excludes = ps_exclude_components[i % len(ps_exclude_components)]
+        for include_ps_excluded in (False, True):
+            is_included = not any(
+                [re.search(match, item["product_version"]) for match in exclude_products]
+            ) and (
+                (
+                    not any([re.search(match, item["name"]) for match in ps_excludes])
+                    or include_ps_excluded
+                )
+                and not any([re.search(match, item["name"]) for match in exclude_components])
+            )
+            assert (
+                exclude_matcher.is_included(
+                    ps_excludes, item["product_version"], item["name"], include_ps_excluded
+                )
+                == is_included
+            )
+
+    assert ExcludeMatcher([], []).is_included([], "rhel-8", "curl", False)
+
+
+def component(nvr, *product_streams):
+    name = nvr.rsplit("-", 2)[0]
+    return {
+        "purl": f"pkg:rpm/redhat/{name}@{nvr}?arch=src",
+        "name": name,
+        "nvr": nvr,
+        "type": "RPM",
+        "arch": "src",
+        "version": nvr.rsplit("-", 2)[1],
+        "namespace": "REDHAT",
+        "related_url": None,
+        "software_build": {"source": None, "build_type": "BREW"},
+        "upstreams": [],
+        "sources": [],
+        "provides": [],
+        "product_streams": [
+            {
+                "name": ps,
+                "active": True,
+                "relations": [],
+                "product_versions": [{"name": ps.rsplit(".", 2)[0]}],
+                "exclude_components": [],
+            }
+            for ps in product_streams
+        ],
+    }
+
+
+def test_text_output_products_contain_component_unsorted(monkeypatch):
+    ctx = click.Context(click.Command("products-contain-component"))
+    ctx.obj = {"VERBOSE": 1, "MIDDLEWARE_CLI": None}
+    ctx.params = {
+        "purl": None,
+        "component_name": "kernel",
+        "output_type_filter": None,
+        "include_inactive_product_streams": False,
+        "include_product_stream_excluded_components": False,
+        "deduplicate": True,
+        "affect_mode": False,
+        "no_middleware": True,
+    }
+    monkeypatch.setattr(console, "file", io.StringIO())
+    monkeypatch.setattr(console, "width", 1000)
+
+    batches = [
+        [component("kernel-5.14.0-284.el9", "rhel-br-9.2.0", "openshift-4.14")],
+        # components found again by another search are not rendered twice
+        [
+            component("kernel-5.14.0-284.el9", "rhel-br-9.2.0", "openshift-4.14"),
+            component("kernel-5.14.0-362.el9", "rhel-9.2.0"),
+        ],
+    ]
+    text_output_products_contain_component_unsorted(ctx, iter(batches), [], [])
+
+    # results are rendered by search, rhel-br is deduplicated against rhel of any search
+    assert console.file.getvalue().splitlines() == [
+        "openshift-4.14 kernel-5.14.0-284.el9 (RPM) ",
+        "rhel-9.2.0 kernel-5.14.0-362.el9 (RPM) ",
+    ]
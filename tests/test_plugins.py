@@ -1,7 +1,12 @@
+import importlib
+import os
+import sys
+
 import pytest
 from click.testing import CliRunner
 
 from griffon.cli import cli
+from griffon.commands import plugin_commands
 
 pytestmark = pytest.mark.unit
 
@@ -40,3 +45,67 @@ def test_cvelib():
     runner = CliRunner()
     result = runner.invoke(cli, ["plugins", "cvelib"])
     assert result.exit_code == 0
+
+
+def test_plugin_manifest(tmp_path, monkeypatch):
+    custom_folder = tmp_path / "plugins"
+    custom_folder.mkdir()
+    (custom_folder / "custom.py").write_text(
+        "import click\n\n\n@click.group(help='custom plugin')\ndef plugins():\n    pass\n"
+    )
+    monkeypatch.setattr(plugin_commands, "custom_folder", str(custom_folder))
+
+    manifest = plugin_commands.PluginManifest(str(tmp_path / "manifest.json"))
+    plugins = manifest.load()
+    assert plugins["custom"]["help"] == "custom plugin"
+    assert plugins["osv"]["help"] == "OSV plugin"
+
+    # stored manifest is reused until plugin folder changes
+    monkeypatch.setattr(plugin_commands, "load_plugin", None)
+    assert plugin_commands.PluginManifest(str(tmp_path / "manifest.json")).load() == plugins
+    monkeypatch.undo()
+    monkeypatch.setattr(plugin_commands, "custom_folder", str(custom_folder))
+    (custom_folder / "other.py").write_text(
+        "import click\n\n\n@click.group(help='other plugin')\ndef plugins():\n    pass\n"
+    )
+    os.utime(custom_folder, (0, 0))
+    plugins = plugin_commands.PluginManifest(str(tmp_path / "manifest.json")).load()
+    assert plugins["other"]["help"] == "other plugin"
+
+
+def test_plugin_failing_to_load(tmp_path, monkeypatch):
+    custom_folder = tmp_path / "plugins"
+    custom_folder.mkdir()
+    (custom_folder / "mine.py").write_text(
+        "import click\nimport griffon_missing_dependency\n\n\n"
+        "@click.command(help='my plugin')\ndef plugins():\n    click.echo('hi')\n"
+    )
+    monkeypatch.setattr(plugin_commands, "custom_folder", str(custom_folder))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    manifest_path = tmp_path / "manifest.json"
+    monkeypatch.setattr(
+        plugin_commands, "plugin_manifest", plugin_commands.PluginManifest(str(manifest_path))
+    )
+
+    # plugin is listed though it fails to load, import error is reported once invoked
+    assert "mine" in plugin_commands.plugin_manifest.load()
+    assert not manifest_path.exists()
+    result = CliRunner().invoke(cli, ["plugins", "mine"])
+    assert isinstance(result.exception, ImportError)
+    assert "griffon_missing_dependency" in str(result.exception)
+
+    # plugin loads once its dependency exists, no stale manifest is reused
+    (tmp_path / "griffon_missing_dependency.py").write_text("")
+    importlib.invalidate_caches()
+    monkeypatch.setattr(
+        plugin_commands, "plugin_manifest", plugin_commands.PluginManifest(str(manifest_path))
+    )
+    try:
+        assert plugin_commands.plugin_manifest.load()["mine"]["help"] == "my plugin"
+        assert manifest_path.exists()
+        result = CliRunner().invoke(cli, ["plugins", "mine"])
+        assert result.exit_code == 0
+        assert result.output == "hi\n"
+    finally:
+        sys.modules.pop("griffon_custom_plugins.mine", None)
+        sys.modules.pop("griffon_missing_dependency", None)
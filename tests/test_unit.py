@@ -1,8 +1,50 @@
+import io
+import json
+import pstats
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import click
+import component_registry_bindings.constants
 import pytest
+import requests
 
-from griffon.commands.queries import product_versions_affected_by_cve_query
-from griffon.output import OUTPUT_FORMAT, cprint
+import griffon
+from griffon import (
+    CommunityComponentService,
+    CorgiService,
+    cache,
+    iterate_list,
+    page_limit,
+    retrieve_list_with_progress,
+    throttling,
+)
+from griffon.autocomplete.index import CompletionIndex, CompletionSource
+from griffon.cache import CachedSession, ResponseCache
+from griffon.commands.entities.helpers import (
+    OptionSchema,
+    from_option_spec,
+    to_option_spec,
+)
+from griffon.commands.queries import (
+    batch_file_names,
+    product_versions_affected_by_cve_query,
+    search_middleware,
+)
+from griffon.output import OUTPUT_FORMAT, cprint, json_items_print
+from griffon.profiling import CpuProfiler
+from griffon.recording import FixtureAdapter, FixtureStore, ReplayError
+from griffon.services import core_reports
+from griffon.services.core_queries import (
+    RH_NAMING_PATTERNS,
+    products_containing_component_query,
+    retrieve_affects_with_flaws,
+    retrieve_latest_components_by_name,
+    rh_naming_verdicts,
+)
+from griffon.timings import Timings, http_span_args
 
 pytestmark = pytest.mark.unit
 
@@ -40,3 +82,719 @@ def test_output_formats():
     assert capture_err
     assert capture_err.type == SystemExit
     assert capture_err.value.code == 0
+
+
+def test_retrieve_list_with_progress(monkeypatch):
+    class Page:
+        def __init__(self, count, results, next_):
+            self.count = count
+            self.results = results
+            self.next_ = next_
+
+    class Resource:
+        def __init__(self):
+            self.offsets = []
+
+        def retrieve_list(self, limit, offset=0, **params):
+            self.offsets.append(offset)
+            results = list(range(offset, min(offset + limit, 23)))
+            return Page(23, results, "next" if offset + limit < 23 else None)
+
+    resource = Resource()
+    count, results = retrieve_list_with_progress(resource, limit=5)
+    assert count == 23
+    assert results == list(range(23))
+    assert sorted(resource.offsets) == [0, 5, 10, 15, 20]
+
+    resource = Resource()
+    count, results = retrieve_list_with_progress(resource, limit=5, max_results=7)
+    assert count == 23
+    assert results == list(range(10))
+    assert sorted(resource.offsets) == [0, 5]
+
+    resource = Resource()
+    assert list(iterate_list(resource, limit=5)) == list(range(23))
+    assert list(iterate_list(resource, limit=5, max_results=7)) == list(range(10))
+
+    # at most max_workers pages are prefetched, the rest is not retrieved once closed
+    monkeypatch.setattr(griffon, "get_max_workers", lambda: 2)
+    resource = Resource()
+    results = iterate_list(resource, limit=5)
+    assert next(results) == 0
+    results.close()
+    assert set(resource.offsets) <= {0, 5, 10}
+
+    # page size is set by the binding owning the resource
+    from osidb_bindings.constants import DEFAULT_LIMIT
+
+    assert page_limit(type("Affects", (), {"binding": "osidb_bindings"})()) == DEFAULT_LIMIT
+    resource = Resource()
+    resource.binding = "osidb_bindings"
+    messages = []
+    status = type("Status", (), {"update": lambda self, message: messages.append(message)})()
+    count, results = retrieve_list_with_progress(resource, status=status, max_results=7)
+    assert resource.offsets == [0]
+    assert messages == ["found 23 result(s)."]
+
+
+def test_response_cache(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60, resource_ttls={"flaws": 0})
+    assert ResponseCache.key("osidb", "flaws", "retrieve", a=1, b=2) == ResponseCache.key(
+        "osidb", "flaws", "retrieve", b=2, a=1
+    )
+
+    cache.set("components-key", "components", {"name": "curl"})
+    assert cache.get("components-key", "components") == {"name": "curl"}
+    cache.set("flaws-key", "flaws", {"cve_id": "CVE-2024-0001"})
+    with pytest.raises(KeyError):
+        cache.get("flaws-key", "flaws")
+    with pytest.raises(KeyError):
+        cache.get("missing-key", "components")
+
+    cache.refresh = True
+    with pytest.raises(KeyError):
+        cache.get("components-key", "components")
+
+    # least recently used entries are evicted once over max size
+    cache.max_size = 0
+    cache.set("new-key", "components", {})
+    assert not (tmp_path / "components-key.json.gz").exists()
+
+
+def test_record_replay(tmp_path):
+    class Components:
+        resource_name = "components"
+        allowed_operations = ("retrieve", "list")
+        calls = 0
+
+        def count(self, **params):
+            self.calls += 1
+            return 42
+
+    class Session:
+        def __init__(self):
+            self.components = Components()
+
+        def status(self):
+            return {"db_size": "1 GB"}
+
+    recorded = CachedSession(Session(), "corgi", FixtureStore(str(tmp_path)))
+    assert recorded.components.count(type="RPM") == 42
+    assert recorded.status() == {"db_size": "1 GB"}
+
+    session = Session()
+    replayed = CachedSession(session, "corgi", FixtureStore(str(tmp_path), replay=True))
+    assert replayed.components.count(type="RPM") == 42
+    assert replayed.status() == {"db_size": "1 GB"}
+    assert session.components.calls == 0
+    with pytest.raises(ReplayError):
+        replayed.components.count(type="NPM")
+
+    request = requests.Request("GET", "http://x/api/v1/status").prepare()
+    adapter = FixtureAdapter(FixtureStore(str(tmp_path), replay=True))
+    key = ResponseCache.key("http", "http", "GET", request.url, body=None)
+    adapter.store.replay = False
+    adapter.store.set(
+        key,
+        "http",
+        {"status_code": 200, "headers": {}, "encoding": "utf-8", "content": "eyJvayI6IDF9"},
+    )
+    adapter.store.replay = True
+    assert adapter.send(request).json() == {"ok": 1}
+
+
+def test_jsonl_output(capsys):
+    ctx = click.Context(
+        product_versions_affected_by_cve_query,
+        obj={"NO_COLOR": False, "PROFILE": "default", "FORMAT": "jsonl"},
+    )
+    results = iter([{"name": "curl", "upstreams": []}, {"name": "libcurl"}])
+    with pytest.raises(SystemExit):
+        cprint(results, ctx=ctx)
+    assert capsys.readouterr().out.splitlines() == [
+        '{"name": "curl", "upstreams": []}',
+        '{"name": "libcurl"}',
+    ]
+
+
+def test_completion_index(tmp_path):
+    class Source(CompletionSource):
+        def fetch(self, since=None):
+            self.since = since
+            return [{"name": "rhel-8.8.0.z", "ofuri": "o:redhat:rhel:8.8.0.z"}, {"name": "rhel-9"}]
+
+    source = Source("streams", "", {}, {"name": "name", "ofuri": "ofuri"}, since_param="since")
+    index = CompletionIndex(str(tmp_path / "autocomplete.db"))
+    assert index.is_stale(source)
+    index.refresh(source)
+    assert source.since is None
+    assert not index.is_stale(source)
+    assert index.search("name", "rhel-") == ["rhel-8.8.0.z", "rhel-9"]
+    assert index.search("name", "rhel-9") == ["rhel-9"]
+    assert index.search("ofuri", "o:redhat:") == ["o:redhat:rhel:8.8.0.z"]
+    assert index.search("ofuri", "rhel") == []
+
+    # incremental refresh only asks for changes since last refresh
+    index.add("name", ["rhel-10"])
+    index.refresh(source)
+    assert source.since is not None
+    assert index.search("name", "rhel-1") == ["rhel-10"]
+
+
+def test_option_schema(tmp_path):
+    from osidb_bindings.bindings.python_client.api.osidb import osidb_api_v1_flaws_list
+
+    path = str(tmp_path / "option_schema.json")
+    built = []
+
+    def build():
+        built.append(True)
+        return [
+            {
+                "option": f"--{name}",
+                "variable": name,
+                "type": spec,
+                "help": "",
+                "multiple": multiple,
+            }
+            for name, (spec, multiple) in (
+                (name, to_option_spec(type_))
+                for name, type_ in osidb_api_v1_flaws_list.QUERY_PARAMS.items()
+            )
+        ]
+
+    schema = OptionSchema(path)
+    specs = schema.get("flaws", build)
+    schema.save()
+    # stored schema is reused by new process without introspection of the bindings
+    assert OptionSchema(path).get("flaws", build) == specs
+    assert len(built) == 1
+
+    types = {spec["variable"]: from_option_spec(spec["type"]) for spec in specs}
+    assert types["cve_id"] is str
+    assert isinstance(types["created_dt"], click.DateTime)
+    assert "IMPORTANT" in [impact.value for impact in types["impact"].choices]
+
+
+def test_shared_session(fake_services):
+    created = []
+
+    def factory(name):
+        @griffon.shared_session
+        def create_session(*args, **kwargs):
+            created.append((name, args, kwargs))
+            return object()
+
+        return create_session
+
+    # factories of different services never share sessions, even if equally named
+    corgi, community = factory("corgi"), factory("community")
+    assert corgi.__qualname__ == community.__qualname__
+    assert corgi() is corgi()
+    assert corgi() is not community()
+    assert corgi("a", verify=True) is corgi("a", verify=True)
+    assert corgi("a", verify=True) is not corgi("b", verify=True)
+    assert created == [
+        ("corgi", (), {}),
+        ("community", (), {}),
+        ("corgi", ("a",), {"verify": True}),
+        ("corgi", ("b",), {"verify": True}),
+    ]
+
+    assert CorgiService.create_session() is CorgiService.create_session()
+    assert CorgiService.create_session() is not CommunityComponentService.create_session()
+    assert CommunityComponentService.create_session().session is fake_services.community
+
+
+def test_request_slots(fake_services, monkeypatch):
+    monkeypatch.setattr(griffon, "get_max_workers", lambda: 3)
+    fake_services.latency = 0.01
+    names = ["curl", "openssl", "zlib"]
+    fake_services.corgi.components.records = [
+        {"purl": f"pkg:rpm/redhat/{name}@{version}", "name": name, "type": "RPM"}
+        for name in names
+        for version in range(5)
+    ]
+    query = products_containing_component_query(
+        {
+            "component_names": names,
+            "search_latest": True,
+            "search_related_url": True,
+            "strict_name_search": True,
+            "no_community": True,
+        }
+    )
+    status = type("Status", (), {"update": lambda self, message: None})()
+    results = query.execute(status)
+
+    assert {name: len(components) for name, components in results.items()} == {
+        "curl": 20,
+        "openssl": 20,
+        "zlib": 20,
+    }
+    # batch, searches, page prefetching and sub retrievals pools are nested however
+    # calls in flight are bounded by max_workers in total
+    assert len(fake_services.calls) > 3
+    assert 1 < fake_services.peak <= 3
+
+
+def component_record(purl, name, **fields) -> dict:
+    """component record of fake services, not a source, upstream or provided child of any"""
+    return {
+        "purl": purl,
+        "name": name,
+        "type": "RPM",
+        "related_url": None,
+        "_sources": [],
+        "_upstreams": [],
+        "_provides": [],
+        "_provides_name": [],
+        **fields,
+    }
+
+
+def test_products_containing_component_batch_search(fake_services):
+    fake_services.corgi.components.records = [
+        component_record("pkg:rpm/redhat/curl@7.76.1", "curl"),
+        component_record("pkg:rpm/redhat/openssl@3.0.7", "openssl"),
+    ]
+    query = products_containing_component_query(
+        {
+            "component_names": ["curl", "pkg:rpm/redhat/curl@7.76.1", "openssl", "curl"],
+            "strict_name_search": True,
+            "search_latest": True,
+            "no_community": True,
+        }
+    )
+    status = type("Status", (), {"update": lambda self, message: None})()
+    results = query.execute(status)
+    assert {name: [c.purl for c in components] for name, components in results.items()} == {
+        "curl": ["pkg:rpm/redhat/curl@7.76.1"],
+        "pkg:rpm/redhat/curl@7.76.1": ["pkg:rpm/redhat/curl@7.76.1"],
+        "openssl": ["pkg:rpm/redhat/openssl@3.0.7"],
+    }
+
+    # repeated names are searched once, sub retrievals of components found by
+    # multiple names are performed once
+    searches = [
+        params.get("name") or params.get("purl")
+        for _, _, operation, params in fake_services.calls
+        if operation == "retrieve_list" and params["include_fields"] == query.include_fields
+    ]
+    assert sorted(searches) == ["curl", "openssl", "pkg:rpm/redhat/curl@7.76.1"]
+    sources = [
+        params["provides"]
+        for _, _, operation, params in fake_services.calls
+        if operation == "retrieve_list" and "provides" in params
+    ]
+    assert sorted(sources) == ["pkg:rpm/redhat/curl@7.76.1", "pkg:rpm/redhat/openssl@3.0.7"]
+
+
+def test_products_containing_component_stream(fake_services, monkeypatch):
+    for service, namespace in ((fake_services.corgi, "redhat"), (fake_services.community, "")):
+        service.components.records = [
+            component_record(f"pkg:rpm/{namespace}/curl", "curl"),
+            component_record(
+                f"pkg:rpm/{namespace}/libcurl-bindings", "libcurl-bindings", related_url="curl"
+            ),
+        ]
+    status = type("Status", (), {"update": lambda self, message: None})()
+    params = {
+        "component_name": "curl",
+        "strict_name_search": True,
+        "search_provides": True,
+        "search_related_url": True,
+    }
+
+    # searches are merged in search mode order, latest roots searched if no provides found
+    query = products_containing_component_query(params)
+    assert [c.purl for c in query.execute(status)] == [
+        "pkg:rpm/redhat/curl",
+        "pkg:rpm//curl",
+        "pkg:rpm/redhat/libcurl-bindings",
+        "pkg:rpm//libcurl-bindings",
+    ]
+
+    # searches are streamed in completion order, community searches complete first
+    monkeypatch.setattr(griffon, "get_max_workers", lambda: 16)
+    monkeypatch.setattr(throttling, "request_slots", None)
+    fake_services.corgi.latency = 0.2
+    params = {**params, "search_provides": False, "search_all_roots": True}
+    stream = products_containing_component_query(params).stream(status)
+    first, second, *rest = [[c.purl for c in components] for components in stream]
+    assert sorted([first, second]) == [["pkg:rpm//curl"], ["pkg:rpm//libcurl-bindings"]]
+    assert sorted(rest) == [["pkg:rpm/redhat/curl"], ["pkg:rpm/redhat/libcurl-bindings"]]
+
+
+def test_products_containing_component_merge_order(fake_services):
+    for service, namespace in ((fake_services.corgi, "redhat"), (fake_services.community, "")):
+        service.components.records = [
+            component_record(f"pkg:rpm/{namespace}/curl", "curl"),
+            component_record(
+                f"pkg:rpm/{namespace}/libcurl-bindings", "libcurl-bindings", related_url="curl"
+            ),
+        ]
+    # component-registry searches complete after their community counterparts
+    fake_services.corgi.latency = 0.05
+
+    query = products_containing_component_query(
+        {
+            "component_name": "curl",
+            "strict_name_search": True,
+            "search_related_url": True,
+            "search_all_roots": True,
+        }
+    )
+    status = type("Status", (), {"update": lambda self, message: None})()
+    assert [c.purl for c in query.execute(status)] == [
+        # related url search, component-registry then community
+        "pkg:rpm/redhat/libcurl-bindings",
+        "pkg:rpm//libcurl-bindings",
+        # all roots search, component-registry then community
+        "pkg:rpm/redhat/curl",
+        "pkg:rpm//curl",
+    ]
+
+
+def test_batch_file_names():
+    batch_file = io.StringIO("curl\n\n# comment\n  # indented comment\n  openssl  \n")
+    assert batch_file_names(batch_file) == ["curl", "openssl"]
+
+
+def test_search_middleware(tmp_path):
+    build = {
+        "ps_module": "eap-8",
+        "ps_update_stream": "eap-8.0",
+        "build_type": "MAVEN",
+        "build_name": "netty",
+        "build_nvr": "netty-4.1",
+        "build_id": 1,
+        "build_repo": "https://github.com/netty/netty",
+    }
+    middleware = tmp_path / "middleware.py"
+    middleware.write_text(f"print({json.dumps(json.dumps({'deps': [build]}))})")
+    components = search_middleware(f"{sys.executable} {middleware}", "netty", True)
+    assert [(c["name"], c["product_streams"][0]["name"]) for c in components] == [
+        ("netty", "eap-8.0")
+    ]
+
+    middleware.write_text("print('unavailable')")
+    assert search_middleware(f"{sys.executable} {middleware}", "netty", True) == []
+
+
+def test_rh_naming_verdicts():
+    names = [
+        "binutils",
+        "devtoolset-12-binutils",
+        "mingw-binutils",
+        "binutils-devel",
+        "compat-openssl11",
+        "openssl",
+        "openssl-libs",
+        "kernel-rt",
+        "kernel-rt-debug",
+        "qemu-kvm-rhev",
+        "qemu-kvm-ma",
+        "webkit2gtk3",
+        "WebKitGTK",
+    ]
+    for component_name in ("binutils", "openssl", "kernel", "qemu", "webkit", "webkit(gtk)?"):
+        patterns = [
+            re.compile(pattern.format(component_name), flags=re.IGNORECASE)
+            for pattern in RH_NAMING_PATTERNS
+        ]
+        expected = {name: any(p.match(name) for p in patterns) for name in names}
+        assert rh_naming_verdicts(component_name, names) == expected
+    assert rh_naming_verdicts("openssl", names)["compat-openssl11"]
+    assert not rh_naming_verdicts("openssl", names)["openssl-libs"]
+
+
+def test_retrieve_latest_components_by_name():
+    class Components:
+        def __init__(self):
+            self.names = []
+
+        def retrieve_list_iterator_async(self, name, latest_components_by_streams, **params):
+            self.names.append(name)
+            return iter([f"{name}-1", f"{name}-2"])
+
+    class Session:
+        components = Components()
+
+    session = Session()
+    components = retrieve_latest_components_by_name(
+        session, ["kernel", "kernel-rt", "kernel"], include_fields="purl"
+    )
+    assert components == {
+        "kernel": ["kernel-1", "kernel-2"],
+        "kernel-rt": ["kernel-rt-1", "kernel-rt-2"],
+    }
+    assert sorted(session.components.names) == ["kernel", "kernel-rt"]
+
+
+def test_retrieve_affects_with_flaws():
+    class Item:
+        def __init__(self, **fields):
+            self.__dict__.update(fields)
+
+    class Resource:
+        def __init__(self, items):
+            self.items = items
+
+        def retrieve_list_iterator_async(self, **params):
+            self.params = params
+            return iter(self.items)
+
+    class Session:
+        flaws = Resource([Item(uuid="f2", cve_id="CVE-2"), Item(uuid="f1", cve_id="CVE-1")])
+        affects = Resource(
+            [
+                Item(flaw="f1", ps_module="rhel-8"),
+                Item(flaw="f3", ps_module="rhel-8"),
+                Item(flaw="f2", ps_module="rhel-9"),
+                Item(flaw="f1", ps_module="rhel-9"),
+            ]
+        )
+
+    session = Session()
+    joined = retrieve_affects_with_flaws(session, {"ps_component": "curl"}, {"state": "NEW"})
+    assert [(flaw.cve_id, affect.ps_module) for flaw, affect in joined] == [
+        ("CVE-2", "rhel-9"),
+        ("CVE-1", "rhel-8"),
+        ("CVE-1", "rhel-9"),
+    ]
+    assert session.affects.params["ps_component"] == "curl"
+    assert session.flaws.params == {"state": "NEW"}
+
+
+def test_example_affects_report(fake_services, monkeypatch):
+    monkeypatch.setattr(core_reports, "OSIDB_SERVER_URL", "http://osidb")
+    monkeypatch.setattr(core_reports, "AFFECTS_PAGE_LIMIT", 2)
+    fake_services.osidb.affects.records = [
+        {
+            "affectedness": affectedness,
+            "impact": impact,
+            "ps_component": component,
+            "ps_module": "rhel-8",
+        }
+        for affectedness, impact, component in [
+            ("AFFECTED", "CRITICAL", "kernel"),
+            ("AFFECTED", "LOW", "curl"),
+            ("AFFECTED", "LOW", "curl"),
+            ("AFFECTED", "LOW", "kernel"),
+            ("AFFECTED", "CRITICAL", "kernel"),
+            ("AFFECTED", "IMPORTANT", "openssl"),
+            ("AFFECTED", "", "openssl"),
+            ("NOTAFFECTED", "CRITICAL", "bash"),
+        ]
+    ]
+
+    result = core_reports.example_affects_report({"show_components": True}).generate()
+    assert result["total_affects"] == 8
+    assert result["total_affected"] == 7
+    assert result["critical"] == {
+        "affected": 2,
+        "top_component": "kernel",
+        "top_product": "rhel-8",
+        "components": {"kernel": 2},
+    }
+    assert result["low"]["components"] == {"curl": 2, "kernel": 1}
+    assert result["moderate"]["affected"] == 0
+    assert result["moderate"]["top_component"] is None
+
+    # affects are filtered by impact in OSIDB, only pages of each impact are retrieved
+    pages = sorted(
+        (params["impact"], params["offset"])
+        for _, resource, _, params in fake_services.calls
+        if resource == "affects" and "impact" in params
+    )
+    assert pages == [("CRITICAL", 0), ("IMPORTANT", 0), ("LOW", 0), ("LOW", 2), ("MODERATE", 0)]
+
+
+def test_entity_report(fake_services, monkeypatch, tmp_path):
+    fake_services.corgi.status_data = {
+        "db_size": "1 GB",
+        **{entity: {"count": 1} for entity in ("products", "product_versions", "product_streams")},
+        **{entity: {"count": 2} for entity in ("product_variants", "channels")},
+    }
+    fake_services.corgi.components.records = [
+        {"purl": "pkg:rpm/a", "type": "RPM", "_root_components": "True"},
+        {"purl": "pkg:rpm/a-devel", "type": "RPM", "_root_components": "False"},
+        {"purl": "pkg:oci/b", "type": "OCI", "_root_components": "True"},
+        {"purl": "pkg:generic/c", "type": "GENERIC"},
+    ]
+    fake_services.corgi.product_streams.records = [{"name": "rhel-9"}, {"name": "rhel-8"}]
+
+    report = core_reports.entity_report({})
+    result = report.generate()["corgi"]
+    assert result["components"]["rpm_root_components"] == 1
+    assert result["components"]["oci_root_components"] == 1
+    assert result["components"]["generic_components"] == 1
+    assert result["components"]["total_component_instances"] == 4
+    assert result["products"]["active_product_streams"] == 2
+    assert result["products"]["channels"] == 2
+    assert {"status", "rpm_root_components", "pypi_components"} <= set(result["latency"])
+
+    # counts are retrieved again by new reports unless response cache is enabled
+    calls = len(fake_services.calls)
+    core_reports.entity_report({}).generate()
+    assert len(fake_services.calls) > calls
+
+    # enabled response cache (persisted across invocations) serves counts of new reports
+    monkeypatch.setattr(cache, "response_cache", ResponseCache(str(tmp_path), ttl=60))
+    core_reports.entity_report({}).generate()
+    calls = len(fake_services.calls)
+    assert core_reports.entity_report({}).generate()["corgi"]["components"] == result["components"]
+    assert len(fake_services.calls) == calls
+    assert list(tmp_path.iterdir())
+
+    # --refresh retrieves counts again
+    monkeypatch.setattr(cache, "response_cache", ResponseCache(str(tmp_path), refresh=True))
+    core_reports.entity_report({}).generate()
+    assert len(fake_services.calls) > calls
+
+
+def test_license_report_stream(fake_services, monkeypatch, capsys):
+    def component(purl, sources=(), **fields):
+        return {
+            "purl": purl,
+            "type": "RPM",
+            "license_declared": "MIT",
+            "related_url": None,
+            "download_url": None,
+            "_sources": list(sources),
+            **fields,
+        }
+
+    components = fake_services.corgi.components
+    components.records = [
+        component(f"pkg:rpm/{name}", software_build={"build_id": name}) for name in "abc"
+    ] + [component("pkg:npm/a-child", sources=["pkg:rpm/a"], type="NPM")]
+
+    report = core_reports.license_report({"purl": "pkg:rpm/a", "max_workers": 2})
+    records = list(report.stream())
+    assert records == [
+        (
+            "pkg:rpm/a",
+            {
+                "license_declared": "MIT",
+                "related_url": None,
+                "build_id": "a",
+                "children": [
+                    {
+                        "purl": "pkg:npm/a-child",
+                        "license_declared": "MIT",
+                        "related_url": None,
+                        "download_url": None,
+                    }
+                ],
+            },
+        )
+    ]
+
+    json_items_print(iter(records))
+    assert json.loads(capsys.readouterr().out) == dict(records)
+    json_items_print(iter([]))
+    assert json.loads(capsys.readouterr().out) == {}
+
+    # root components are paged in as records are yielded, in order of retrieval
+    monkeypatch.setattr(griffon, "get_max_workers", lambda: 2)
+    monkeypatch.setattr(component_registry_bindings.constants, "DEFAULT_LIMIT", 2)
+    components.records = [
+        component(f"pkg:rpm/{name}", software_build={"build_id": name}) for name in "abcdefghij"
+    ]
+    fake_services.calls.clear()
+    stream = core_reports.license_report({"exclude_children": True, "max_workers": 2}).stream()
+    assert next(stream)[0] == "pkg:rpm/a"
+    pages = [call for call in fake_services.calls if call[2] == "retrieve_list"]
+    assert len(pages) < 5
+    assert [purl for purl, _ in stream] == [f"pkg:rpm/{name}" for name in "bcdefghij"]
+
+
+def test_timings():
+    span_args = http_span_args(
+        "GET",
+        "http://corgi/api/v1/components/3fa85f64-5717-4562-b3fc-2c963f66afa6/taxonomy"
+        "?limit=50&offset=100",
+    )
+    assert span_args["name"] == "GET corgi/api/v1/components/{id}/taxonomy"
+    assert span_args["page"] == 3
+    assert span_args["params"] == {"limit": "50", "offset": "100"}
+
+    collector = Timings()
+    with collector.span("disabled", "service"):
+        pass
+    assert collector.spans == []
+
+    collector.enabled = True
+    with collector.span("products_containing_component_query", "service"):
+        pass
+    collector.record("GET corgi/api/v1/components", "http", 1.0, 1.5, bytes=10)
+    collector.record("GET corgi/api/v1/components", "http", 2.0, 2.25, bytes=20)
+    summary = collector.summary()
+    assert summary[0] == {
+        "category": "http",
+        "name": "GET corgi/api/v1/components",
+        "calls": 2,
+        "total": 0.75,
+        "max": 0.5,
+        "bytes": 30,
+    }
+    events = collector.chrome_trace()["traceEvents"]
+    assert [event["name"] for event in events] == [
+        "products_containing_component_query",
+        "GET corgi/api/v1/components",
+        "GET corgi/api/v1/components",
+    ]
+    assert events[1]["ph"] == "X" and events[1]["dur"] == 500000
+
+    # span of iteration lasts until it is exhausted
+    collector = Timings()
+    collector.enable()
+    records = collector.iterate(iter([1, 2]), "license_report", "service")
+    assert next(records) == 1
+    time.sleep(0.01)
+    assert collector.spans == []
+    assert list(records) == [2]
+    assert collector.spans[0].name == "license_report"
+    assert collector.spans[0].duration >= 0.01
+
+
+def test_service_call_timings(fake_services, monkeypatch):
+    collector = Timings()
+    collector.enable()
+    monkeypatch.setattr(throttling, "timings", collector)
+    fake_services.corgi.components.records = [{"name": f"curl-{i}"} for i in range(12)]
+
+    session = CorgiService.create_session()
+    assert len(list(session.components.retrieve_list_iterator_async(limit=5))) == 12
+    spans = sorted(collector.spans, key=lambda span: span.args["page"])
+    assert [span.args["page"] for span in spans] == [1, 2, 3]
+    assert {span.category for span in spans} == {"http"}
+    assert {span.name.split(" ")[0] for span in spans} == {"retrieve_list"}
+    assert all(span.name.endswith("/components") for span in spans)
+
+    # count and pagination phases of retrievals are recorded as well
+    monkeypatch.setattr(griffon, "timings", collector)
+    collector.spans = []
+    retrieve_list_with_progress(session.components, label="component(s)", limit=5)
+    assert [(span.name, span.args) for span in collector.spans if span.category == "service"] == [
+        ("count", {"label": "component(s)"}),
+        ("pagination", {"label": "component(s)", "pages": 2}),
+    ]
+
+
+def test_cpu_profiler(tmp_path):
+    def worker_task():
+        return sum(range(1000))
+
+    path = str(tmp_path / "griffon.prof")
+    profiler = CpuProfiler(path)
+    profiler.start()
+    with ThreadPoolExecutor() as executor:
+        assert executor.submit(worker_task).result() == 499500
+    profiler.stop()
+
+    # functions called in worker threads are profiled as well
+    functions = {function for _, _, function in pstats.Stats(path).stats}
+    assert "worker_task" in functions